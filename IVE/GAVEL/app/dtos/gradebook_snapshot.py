@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class GradebookSnapshot:
+    """One stored gradebook CSV pull for a course."""
+    course_id: int
+    snapshot_id: str       # sortable, oldest first
+    taken_at: datetime
+    digest: str            # sha256 prefix of the uncompressed CSV
+
+
+@dataclass(frozen=True)
+class ScoreChange:
+    """One gradebook cell whose score differs between two snapshots."""
+    canvas_id: int         # Canvas student ID (gradebook "ID" column)
+    assignment_id: int     # Canvas assignment ID
+    old_score: Optional[float]
+    new_score: Optional[float]
+
+
+@dataclass(frozen=True)
+class GradebookDiff:
+    """
+    Cell-level difference between two gradebook snapshots, keyed by Canvas
+    student and assignment IDs (so reordered rows or columns are not changes).
+
+    Scores in added or removed columns are not listed as changes; only cells
+    present in both snapshots are compared.
+    """
+    added_students: tuple[int, ...]
+    removed_students: tuple[int, ...]
+    added_assignments: tuple[int, ...]
+    removed_assignments: tuple[int, ...]
+    changes: tuple[ScoreChange, ...]
+
+    @property
+    def changed_students(self) -> tuple[int, ...]:
+        """Students with at least one changed score, in ascending ID order."""
+        return tuple(sorted({c.canvas_id for c in self.changes}))
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_students or self.removed_students or self.added_assignments
+            or self.removed_assignments or self.changes
+        )
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class ScoreMatrix:
+    """
+    Column-oriented scores for one gradebook (or evaluation) export.
+
+    scores is a float64 (students x columns) array in Fortran order, so each
+    column is contiguous for sorting and statistics; missing scores are NaN.
+    points_possible holds one value per column (NaN when unknown).
+    """
+    row_labels: tuple[str, ...]       # e.g. "Last, First"
+    row_ids: tuple[str, ...]          # e.g. SIS login ID
+    column_labels: tuple[str, ...]    # e.g. assignment display names
+    scores: np.ndarray
+    points_possible: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.scores.shape
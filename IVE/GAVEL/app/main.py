@@ -9,30 +9,32 @@ from GAVEL.app_services import AppServices
 from GAVEL.bootstrap import build_canvas_client, build_roster_client
 from GAVEL.core.main_window import MainWindow
 from GAVEL.core.page_registry import PageRegistry
-from GAVEL.pages.canvas_course.page import CanvasCoursePage  # noqa: F401
-from GAVEL.pages.home.page import HomePage  # noqa: F401
-from GAVEL.pages.settings.page import SettingsPage  # noqa: F401
 from GAVEL.services.config_service import ConfigService
 from GAVEL.services.logger import AppLogger
 from GAVEL.theme.context import ThemeContext
-from GAVEL.theme.qss_builder import build_app_qss
-from GAVEL.theme.tokens import load_tokens
+from GAVEL.theme.qss_cache import ThemeWatcher, compile_theme
 
 
-def main() -> None:
-    app = QApplication(sys.argv)
+PAGE_MANIFEST = Path(__file__).resolve().parents[1] / "pages" / "pages.json"
 
+
+def build_main_window(app: QApplication, page_manifest: Path = PAGE_MANIFEST) -> MainWindow:
     tokens_path = Path(__file__).resolve().parents[1] / "theme" / "tokens_dark.json"
-    tokens = load_tokens(tokens_path)
-    app.setStyleSheet(build_app_qss(tokens))
+    compiled = compile_theme(tokens_path)
+    app.setStyleSheet(compiled.qss)
     icon_path = Path(__file__).resolve().parents[1] / "assets" / "icons" / "GAVEL_logo.ico"
     app_icon = QIcon(str(icon_path))
     app.setWindowIcon(app_icon)
 
-    theme = ThemeContext(tokens=tokens)
+    theme = ThemeContext(tokens=compiled.tokens)
     config_service = ConfigService()
     logger = AppLogger()
 
+    if config_service.get().environment == "DEV":
+        # restyle the running app whenever the token file is saved.
+        watcher = ThemeWatcher(tokens_path, app.setStyleSheet, compiled, parent=app)
+        watcher.reload_failed.connect(lambda exc: logger.warning(f"Theme reload failed: {exc}"))
+
     canvas_client = build_canvas_client(config_service.get(), logger)
     roster_client = build_roster_client(config_service.get(), logger)
     services = AppServices.build(canvas_client, roster_client, logger)
@@ -44,10 +46,18 @@ def main() -> None:
         services=services,
     )
 
+    # pages are registered from metadata only; each page module is imported on first navigation.
     registry = PageRegistry.get()
+    registry.load_manifest(page_manifest)
     window = MainWindow(registry, ctx)
     window.resize(1200, 800)
     window.setWindowIcon(app_icon)
+    return window
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    window = build_main_window(app)
     window.show()
 
     sys.exit(app.exec())
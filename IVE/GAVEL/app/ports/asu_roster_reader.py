@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 from IVE.GAVEL.app.dtos.asu_roster import RosterStudent
 
@@ -12,3 +12,17 @@ class RosterReader(ABC):
     def read(self, path: Path) -> List[RosterStudent]:
         """Load a roster file and return one RosterStudent per row."""
         raise NotImplementedError
+
+    def read_many(self, paths: Iterable[Path]) -> List[RosterStudent]:
+        """
+        Load several section rosters into one list, in file order. A student
+        listed in more than one section is kept once (first occurrence, by ID).
+        """
+        seen: set[str] = set()
+        merged: List[RosterStudent] = []
+        for path in paths:
+            for student in self.read(path):
+                if student.id not in seen:
+                    seen.add(student.id)
+                    merged.append(student)
+        return merged
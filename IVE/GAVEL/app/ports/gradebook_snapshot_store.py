@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from GAVEL.app.dtos.gradebook_snapshot import GradebookSnapshot
+
+
+class GradebookSnapshotStore(ABC):
+    """Keeps every gradebook CSV pulled from Canvas, per course."""
+
+    @abstractmethod
+    def save(self, course_id: int, csv_bytes: bytes) -> GradebookSnapshot:
+        """Store a pulled CSV. Returns the latest snapshot unchanged if the CSV is identical to it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_snapshots(self, course_id: int) -> List[GradebookSnapshot]:
+        """All snapshots of a course, oldest first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, course_id: int, snapshot_id: str) -> bytes:
+        """Return the CSV of a snapshot. Raises KeyError for an unknown snapshot."""
+        raise NotImplementedError
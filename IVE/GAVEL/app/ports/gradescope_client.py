@@ -10,9 +10,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
 import requests
 
+from GAVEL.infra.gradescope.gradescope_html import (
+    extract_assignment_ids,
+    extract_bulk_export_href,
+    extract_csrf_token,
+)
+
 # -------------------------
 # Logging Setup
 # -------------------------
@@ -245,39 +250,35 @@ def gs_downloader(course_id: int):
 
     session = build_requests_session(gs_session, course_id=gs_course_id)
     resp = session.get(f"https://www.gradescope.com/courses/{gs_course_id}/assignments")
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    elements = soup.find_all(attrs={"data-assignment-id": True})
-    assignment_ids = [e["data-assignment-id"] for e in elements]
+    assignment_ids = extract_assignment_ids(resp.text)
 
     ##TODO: Determine file save directory
 
     for a in assignment_ids:
-        resp = session.get(f"https://www.gradescope.com/courses/{gs_course_id}/assignments/{a}/review_grades")
-        soup = BeautifulSoup(resp.text, "html.parser")
-        link = soup.find("a", class_="js-bulkExportModalDownload")
-        if (".zip" in link["href"]):
+        review_url = f"https://www.gradescope.com/courses/{gs_course_id}/assignments/{a}/review_grades"
+        resp = session.get(review_url)
+        review_html = resp.text
+        href = extract_bulk_export_href(review_html)
+        if href is not None and ".zip" in href:
             log.info("Downloading assignment: %s", a)
-            resp = session.get("https://www.gradescope.com" + link["href"])
+            resp = session.get("https://www.gradescope.com" + href)
             output_str = a + ".zip"
             with open(output_str, "wb") as f:
                 f.write(resp.content)
             print(f"Assignment {a} downloaded!")
         else:
             log.info("Export not created yet; exporting assignment: %s", a)
-            review_url = f"https://www.gradescope.com/courses/{gs_course_id}/assignments/{a}/review_grades"
-            resp = session.get(review_url)
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            csrf = soup.find("meta", attrs={"name": "csrf-token"})["content"]
+            # the review page we already fetched carries the CSRF token.
+            csrf = extract_csrf_token(review_html)
+            if csrf is None:
+                raise RuntimeError(f"No CSRF token found on review page for assignment {a}.")
 
             session.headers["X-CSRF-Token"] = csrf
 
             resp = session.post(
                 f"https://www.gradescope.com/courses/{gs_course_id}/assignments/{a}/export",
-                headers={"Referer": f"https://www.gradescope.com/courses/{gs_course_id}/assignments/{a}/review_grades"}
+                headers={"Referer": review_url}
             )
-            soup = BeautifulSoup(resp.text, "html.parser")
             data = resp.json()
             file_id = data["generated_file_id"]
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from typing import Optional
 
 from GAVEL.app.dtos.canvas_course import CanvasCourseData
 from GAVEL.app.ports.canvas_client import CanvasClient
+from GAVEL.app.usecases.course_data_cache import CourseDataCache
 
 
 @dataclass(frozen=True)
@@ -21,8 +23,20 @@ class DownloadCourseDataResult:
 
 
 class DownloadCourseDataUseCase:
-    def __init__(self, canvas_client: CanvasClient) -> None:
+    def __init__(self, canvas_client: CanvasClient, cache: Optional[CourseDataCache] = None) -> None:
         self._canvas_client = canvas_client
+        self._cache = cache
+
+    def prefetch(self, course_id: int) -> CanvasCourseData:
+        """
+        Fetches (or returns the cached) course data without writing anything,
+        so a later execute() for the same course only has to serialize it.
+        """
+        if course_id <= 0:
+            raise ValueError("course_id must be greater than zero")
+        if self._cache is None:
+            return self._canvas_client.fetch_course_data(course_id)
+        return self._cache.get_or_load(course_id, self._canvas_client.fetch_course_data)
 
     def execute(self, request: DownloadCourseDataRequest) -> DownloadCourseDataResult:
         if request.course_id <= 0:
@@ -31,7 +45,7 @@ class DownloadCourseDataUseCase:
         output_dir = request.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        course_data = self._canvas_client.fetch_course_data(request.course_id)
+        course_data = self.prefetch(request.course_id)
 
         payload = self._serialize_course_data(course_data)
         file_path = output_dir / f"canvas_course_{course_data.course.id}.json"
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from GAVEL.app.dtos.asu_roster import RosterStudent
+from GAVEL.app.dtos.canvas_consent_form_entry import ConsentFormEntry
+from GAVEL.app.dtos.canvas_gradebook import CanvasGradebook, GradebookStudentRow
+from GAVEL.app.dtos.score_matrix import ScoreMatrix
+from GAVEL.app.usecases.load_score_matrix import score_matrix_from_gradebook
+from GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+
+if TYPE_CHECKING:
+    # the port modules import their DTOs through the IVE package.
+    from GAVEL.app.ports.asu_roster_reader import RosterReader
+    from GAVEL.app.ports.canvas_consent_form_reader import ConsentFormReader
+
+
+@dataclass(frozen=True)
+class BuildResearchDatasetRequest:
+    consent_path: Path
+    gradebook_path: Path
+    roster_path: Optional[Path] = None
+
+
+@dataclass(frozen=True, eq=False)
+class ResearchDataset:
+    """
+    De-identified, consent-filtered copies of one study's exports.
+
+    Every output only holds students whose latest consent form attempt
+    consented, ordered by pseudonym, with names, Canvas/SIS IDs and e-mail
+    addresses replaced. pseudonyms (ASURITE -> pseudonym) is the re-identification
+    key: keep it with the raw exports, never with the shared dataset.
+    """
+    gradebook: CanvasGradebook
+    scores: ScoreMatrix
+    roster: tuple[RosterStudent, ...]
+    evaluations: tuple[ScoreMatrix, ...]
+    pseudonyms: Dict[str, str]
+
+
+def latest_attempts(entries: Sequence[ConsentFormEntry]) -> List[ConsentFormEntry]:
+    """
+    Keeps the highest attempt of each student, ordered by sis_id.
+
+    One lexsort over (sis_id, attempt) puts every student's attempts next to
+    each other with the latest last, so the survivors are the positions where
+    the sorted sis_id changes.
+    """
+    n = len(entries)
+    if n == 0:
+        return []
+    sis_ids = np.fromiter((e.sis_id for e in entries), dtype=np.int64, count=n)
+    attempts = np.fromiter((e.attempt for e in entries), dtype=np.int64, count=n)
+    order = np.lexsort((attempts, sis_ids))
+    ordered = sis_ids[order]
+    last = np.ones(n, dtype=bool)
+    last[:-1] = ordered[1:] != ordered[:-1]
+    return [entries[i] for i in order[last]]
+
+
+class ConsentIndex:
+    """Hash index of the students whose latest consent form attempt consented."""
+
+    def __init__(self, sis_ids: Iterable[int]) -> None:
+        self._sis_ids = frozenset(sis_ids)
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[ConsentFormEntry]) -> ConsentIndex:
+        return cls(e.sis_id for e in latest_attempts(entries) if e.consented)
+
+    @property
+    def sis_ids(self) -> frozenset[int]:
+        return self._sis_ids
+
+    def __contains__(self, sis_id: object) -> bool:
+        return sis_id in self._sis_ids
+
+    def __len__(self) -> int:
+        return len(self._sis_ids)
+
+    def consenting_rows(self, gradebook: CanvasGradebook) -> List[int]:
+        """
+        Gradebook row indices of consenting students, ordered by sis_id.
+
+        The consent form's sis_id is the gradebook's "ID" column, which is what
+        links the form to the gradebook (and through its SIS Login ID, to the
+        roster and evaluation exports).
+        """
+        by_id = {row.canvas_id: i for i, row in enumerate(gradebook.rows)}
+        return [by_id[s] for s in sorted(self._sis_ids) if s in by_id]
+
+
+def filter_score_matrix(matrix: ScoreMatrix, row_ids: Sequence[str], labels: Sequence[str]) -> ScoreMatrix:
+    """
+    Takes the rows of matrix whose row_id is in row_ids, in row_ids order,
+    relabelling row i (both label and ID) with labels[i]. Students in row_ids
+    missing from the matrix are skipped.
+    """
+    position = {row_id: i for i, row_id in enumerate(matrix.row_ids)}
+    keep = [(position[r], label) for r, label in zip(row_ids, labels, strict=True) if r in position]
+    rows = np.fromiter((p for p, _ in keep), dtype=np.intp, count=len(keep))
+    kept_labels = tuple(label for _, label in keep)
+    return ScoreMatrix(
+        row_labels=kept_labels,
+        row_ids=kept_labels,
+        column_labels=matrix.column_labels,
+        scores=np.asfortranarray(matrix.scores[rows]),
+        points_possible=matrix.points_possible,
+    )
+
+
+def build_research_dataset(
+    consent_entries: Sequence[ConsentFormEntry],
+    gradebook: CanvasGradebook,
+    roster: Sequence[RosterStudent] = (),
+    evaluations: Sequence[ScoreMatrix] = (),
+    prefix: str = "P",
+) -> ResearchDataset:
+    """
+    Filters a gradebook, ASU roster and any evaluation matrices (rows keyed by
+    SIS login ID) down to consenting students and replaces their identities.
+
+    Each join is a dict lookup, so the whole pipeline is linear in the size of
+    the exports. Consenting students missing from the gradebook cannot be
+    linked to the other exports and are left out.
+    """
+    rows = ConsentIndex.from_entries(consent_entries).consenting_rows(gradebook)
+    width = max(3, len(str(len(rows))))
+    pseudonyms: Dict[str, str] = {}
+    deidentified: List[GradebookStudentRow] = []
+    for n, i in enumerate(rows, start=1):
+        row = gradebook.rows[i]
+        pseudonym = f"{prefix}{n:0{width}d}"
+        pseudonyms[row.sis_login_id] = pseudonym
+        deidentified.append(
+            GradebookStudentRow(
+                student_name=pseudonym,
+                canvas_id=n,
+                sis_login_id=pseudonym,
+                section=row.section,
+                assignment_scores=row.assignment_scores,
+            )
+        )
+    filtered = CanvasGradebook(columns=gradebook.columns, rows=tuple(deidentified))
+
+    by_asurite = {student.asurite: student for student in roster}
+    kept_roster = tuple(
+        replace(
+            by_asurite[asurite],
+            id=pseudonym,
+            posting_id="",
+            first_name="",
+            last_name="",
+            asurite=pseudonym,
+            zoom_email="",
+        )
+        for asurite, pseudonym in pseudonyms.items()
+        if asurite in by_asurite
+    )
+
+    asurites = list(pseudonyms)
+    labels = list(pseudonyms.values())
+    return ResearchDataset(
+        gradebook=filtered,
+        scores=score_matrix_from_gradebook(filtered),
+        roster=kept_roster,
+        evaluations=tuple(filter_score_matrix(m, asurites, labels) for m in evaluations),
+        pseudonyms=pseudonyms,
+    )
+
+
+class BuildResearchDatasetUseCase:
+    def __init__(
+        self,
+        consent_reader: ConsentFormReader,
+        gradebook_reader: LegacyGradebookCSVReader,
+        roster_reader: Optional[RosterReader] = None,
+    ) -> None:
+        self._consent_reader = consent_reader
+        self._gradebook_reader = gradebook_reader
+        self._roster_reader = roster_reader
+
+    def execute(
+        self, request: BuildResearchDatasetRequest, evaluations: Sequence[ScoreMatrix] = ()
+    ) -> ResearchDataset:
+        paths = [request.consent_path, request.gradebook_path]
+        if request.roster_path is not None:
+            if self._roster_reader is None:
+                raise ValueError("roster_path given but no roster reader was configured")
+            paths.append(request.roster_path)
+        for path in paths:
+            if not path.is_file():
+                raise FileNotFoundError(f"Export not found: {path}")
+
+        roster = () if request.roster_path is None else self._roster_reader.read(request.roster_path)
+        return build_research_dataset(
+            self._consent_reader.read(str(request.consent_path)),
+            self._gradebook_reader.parse(request.gradebook_path),
+            roster=roster,
+            evaluations=evaluations,
+        )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+from GAVEL.app.dtos.canvas_course import CanvasCourseData
+
+
+class CourseDataCache:
+    """
+    Thread-safe LRU of recently fetched Canvas course data, keyed by course ID.
+
+    get_or_load() is single-flight: when a prefetch for a course is already
+    in progress, a second caller (e.g. the Download button) waits for that
+    request instead of starting another one. Entries older than max_age_seconds
+    are fetched again, so a long-open window does not serve stale modules.
+    """
+
+    def __init__(self, capacity: int = 32, max_age_seconds: float = 300.0) -> None:
+        self._capacity = capacity
+        self._max_age = max_age_seconds
+        self._entries: OrderedDict[int, Tuple[float, CanvasCourseData]] = OrderedDict()
+        self._loading: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, course_id: int) -> Optional[CanvasCourseData]:
+        with self._lock:
+            return self._get_locked(course_id)
+
+    def get_or_load(self, course_id: int, load: Callable[[int], CanvasCourseData]) -> CanvasCourseData:
+        with self._lock:
+            data = self._get_locked(course_id)
+            if data is not None:
+                return data
+            pending = self._loading.get(course_id)
+            owner = pending is None
+            if owner:
+                pending = Future()
+                self._loading[course_id] = pending
+
+        if not owner:
+            return pending.result()
+
+        try:
+            data = load(course_id)
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[course_id]
+            pending.set_exception(exc)
+            raise
+
+        with self._lock:
+            del self._loading[course_id]
+            self._entries[course_id] = (time.monotonic(), data)
+            self._entries.move_to_end(course_id)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+        pending.set_result(data)
+        return data
+
+    def invalidate(self, course_id: int) -> None:
+        with self._lock:
+            self._entries.pop(course_id, None)
+
+    def _get_locked(self, course_id: int) -> Optional[CanvasCourseData]:
+        entry = self._entries.get(course_id)
+        if entry is None:
+            return None
+        loaded_at, data = entry
+        if time.monotonic() - loaded_at > self._max_age:
+            del self._entries[course_id]
+            return None
+        self._entries.move_to_end(course_id)
+        return data
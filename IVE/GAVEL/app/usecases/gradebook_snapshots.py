@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from GAVEL.app.dtos.canvas_gradebook import CanvasGradebook
+from GAVEL.app.dtos.gradebook_snapshot import GradebookDiff, GradebookSnapshot, ScoreChange
+from GAVEL.app.ports.canvas_client import CanvasClient
+from GAVEL.app.ports.gradebook_snapshot_store import GradebookSnapshotStore
+from GAVEL.app.usecases.load_score_matrix import score_matrix_from_gradebook
+from GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+
+
+def _score_or_none(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+def diff_gradebooks(old: CanvasGradebook, new: CanvasGradebook) -> GradebookDiff:
+    """
+    Compares two gradebooks cell by cell, keyed by Canvas student and
+    assignment IDs.
+
+    Both gradebooks become score matrices; the students and assignments they
+    share are aligned with intersect1d and compared in one array operation,
+    so only cells that actually changed are turned back into Python objects.
+    A score going from blank to blank is not a change.
+    """
+    old_students = np.array([r.canvas_id for r in old.rows], dtype=np.int64)
+    new_students = np.array([r.canvas_id for r in new.rows], dtype=np.int64)
+    old_columns = np.array([c.canvas_id for c in old.columns], dtype=np.int64)
+    new_columns = np.array([c.canvas_id for c in new.columns], dtype=np.int64)
+
+    students, old_rows, new_rows = np.intersect1d(old_students, new_students, return_indices=True)
+    columns, old_cols, new_cols = np.intersect1d(old_columns, new_columns, return_indices=True)
+
+    a = score_matrix_from_gradebook(old).scores[np.ix_(old_rows, old_cols)]
+    b = score_matrix_from_gradebook(new).scores[np.ix_(new_rows, new_cols)]
+    differs = (a != b) & ~(np.isnan(a) & np.isnan(b))
+    rows, cols = np.nonzero(differs)
+
+    changes = tuple(
+        ScoreChange(
+            canvas_id=int(students[i]),
+            assignment_id=int(columns[j]),
+            old_score=_score_or_none(a[i, j]),
+            new_score=_score_or_none(b[i, j]),
+        )
+        for i, j in zip(rows.tolist(), cols.tolist(), strict=True)
+    )
+    return GradebookDiff(
+        added_students=tuple(np.setdiff1d(new_students, old_students).tolist()),
+        removed_students=tuple(np.setdiff1d(old_students, new_students).tolist()),
+        added_assignments=tuple(np.setdiff1d(new_columns, old_columns).tolist()),
+        removed_assignments=tuple(np.setdiff1d(old_columns, new_columns).tolist()),
+        changes=changes,
+    )
+
+
+def changed_rows(gradebook: CanvasGradebook, diff: GradebookDiff) -> CanvasGradebook:
+    """
+    The rows of gradebook (normally the newer snapshot) that need
+    reprocessing: students with a changed score, plus new students.
+    """
+    keep = set(diff.changed_students) | set(diff.added_students)
+    return CanvasGradebook(
+        columns=gradebook.columns,
+        rows=tuple(r for r in gradebook.rows if r.canvas_id in keep),
+    )
+
+
+@dataclass(frozen=True)
+class SnapshotGradebookRequest:
+    course_id: int
+
+
+@dataclass(frozen=True)
+class SnapshotGradebookResult:
+    snapshot: GradebookSnapshot
+    previous: Optional[GradebookSnapshot]
+    # None for the first snapshot of a course.
+    diff: Optional[GradebookDiff]
+
+
+class SnapshotGradebookUseCase:
+    """Pulls the gradebook CSV, stores it, and diffs it against the previous snapshot."""
+
+    def __init__(
+        self, canvas_client: CanvasClient, store: GradebookSnapshotStore, reader: LegacyGradebookCSVReader
+    ) -> None:
+        self._canvas_client = canvas_client
+        self._store = store
+        self._reader = reader
+
+    def execute(self, request: SnapshotGradebookRequest) -> SnapshotGradebookResult:
+        if request.course_id <= 0:
+            raise ValueError("course_id must be greater than zero")
+
+        history = self._store.list_snapshots(request.course_id)
+        csv_bytes = self._canvas_client.fetch_gradebook_csv(request.course_id)
+        snapshot = self._store.save(request.course_id, csv_bytes)
+
+        previous = history[-1] if history else None
+        if previous is None:
+            return SnapshotGradebookResult(snapshot=snapshot, previous=None, diff=None)
+        if previous.snapshot_id == snapshot.snapshot_id:
+            # identical pull: the store kept the existing snapshot.
+            return SnapshotGradebookResult(snapshot=snapshot, previous=previous, diff=GradebookDiff((), (), (), (), ()))
+
+        old = self._reader.parse_bytes(self._store.load(request.course_id, previous.snapshot_id))
+        diff = diff_gradebooks(old, self._reader.parse_bytes(csv_bytes))
+        return SnapshotGradebookResult(snapshot=snapshot, previous=previous, diff=diff)
+
+
+@dataclass(frozen=True)
+class DiffGradebookSnapshotsRequest:
+    course_id: int
+    old_snapshot_id: str
+    new_snapshot_id: str
+
+
+class DiffGradebookSnapshotsUseCase:
+    def __init__(self, store: GradebookSnapshotStore, reader: LegacyGradebookCSVReader) -> None:
+        self._store = store
+        self._reader = reader
+
+    def execute(self, request: DiffGradebookSnapshotsRequest) -> GradebookDiff:
+        old = self._reader.parse_bytes(self._store.load(request.course_id, request.old_snapshot_id))
+        new = self._reader.parse_bytes(self._store.load(request.course_id, request.new_snapshot_id))
+        return diff_gradebooks(old, new)
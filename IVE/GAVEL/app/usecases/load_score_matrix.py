@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from GAVEL.app.dtos.canvas_gradebook import CanvasGradebook
+from GAVEL.app.dtos.score_matrix import ScoreMatrix
+from GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+
+
+@dataclass(frozen=True)
+class LoadScoreMatrixRequest:
+    path: Path
+
+
+def score_matrix_from_gradebook(gradebook: CanvasGradebook) -> ScoreMatrix:
+    headers = [c.raw_header for c in gradebook.columns]
+    scores = np.full((len(gradebook.rows), len(headers)), np.nan, order="F")
+    for j, header in enumerate(headers):
+        scores[:, j] = [
+            np.nan if (v := row.assignment_scores.get(header)) is None else v
+            for row in gradebook.rows
+        ]
+
+    return ScoreMatrix(
+        row_labels=tuple(r.student_name for r in gradebook.rows),
+        row_ids=tuple(r.sis_login_id for r in gradebook.rows),
+        column_labels=tuple(c.display_name for c in gradebook.columns),
+        scores=scores,
+        points_possible=np.array(
+            [np.nan if c.points_possible is None else c.points_possible for c in gradebook.columns],
+            dtype=np.float64,
+        ),
+    )
+
+
+class LoadScoreMatrixUseCase:
+    def __init__(self, reader: LegacyGradebookCSVReader) -> None:
+        self._reader = reader
+
+    def execute(self, request: LoadScoreMatrixRequest) -> ScoreMatrix:
+        if not request.path.is_file():
+            raise FileNotFoundError(f"Gradebook not found: {request.path}")
+        return score_matrix_from_gradebook(self._reader.parse(request.path))
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from GAVEL.app.ports.canvas_client import CanvasClient
 from GAVEL.app.ports.roster_client import RosterClient
 from GAVEL.app.usecases.canvas_download_course import DownloadCourseDataUseCase
+from GAVEL.app.usecases.course_data_cache import CourseDataCache
 from GAVEL.services.logger import AppLogger
 
 
@@ -22,7 +23,7 @@ class AppServices:
         logger: AppLogger,
     ) -> "AppServices":
         logger.info("AppServices: initializing use cases")
-        download_uc = DownloadCourseDataUseCase(canvas_client)
+        download_uc = DownloadCourseDataUseCase(canvas_client, CourseDataCache())
         return cls(
             canvas_client=canvas_client,
             roster_client=roster_client,
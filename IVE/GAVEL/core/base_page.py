@@ -19,3 +19,6 @@ class BasePage(QWidget):
 
     def build_tabs(self) -> List[Tuple[str, QWidget]]:
         raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Called when the window closes; pages stop background work here."""
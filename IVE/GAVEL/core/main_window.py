@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from typing import Dict
 
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import QHBoxLayout, QMainWindow, QStackedWidget, QWidget
 
 from GAVEL.app_context import AppContext
+from GAVEL.core.base_page import BasePage
 from GAVEL.core.navigation_drawer import NavigationDrawer
 from GAVEL.core.page_registry import PageRegistry, PageSpec
 
@@ -53,3 +55,9 @@ class MainWindow(QMainWindow):
         self._page_widgets[page_id] = widget
         self._stack.addWidget(widget)
         return widget
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        for widget in self._page_widgets.values():
+            if isinstance(widget, BasePage):
+                widget.shutdown()
+        super().closeEvent(event)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import importlib
+import json
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
 from PyQt6.QtWidgets import QWidget
@@ -18,6 +21,22 @@ class PageSpec:
     group: str = "General"
 
 
+def lazy_page_factory(target: str) -> Callable[[AppContext], QWidget]:
+    """
+    Factory for a page given as "package.module:ClassName". The module is only
+    imported the first time the factory is called.
+    """
+    module_name, _, class_name = target.partition(":")
+    if not module_name or not class_name:
+        raise ValueError(f"Page target must look like 'package.module:ClassName': {target}")
+
+    def factory(ctx: AppContext) -> QWidget:
+        page_class = getattr(importlib.import_module(module_name), class_name)
+        return page_class(ctx)
+
+    return factory
+
+
 class PageRegistry:
     _instance: Optional["PageRegistry"] = None
 
@@ -35,6 +54,35 @@ class PageRegistry:
             raise ValueError(f"Duplicate page_id registered: {spec.page_id}")
         self._pages[spec.page_id] = spec
 
+    def load_manifest(self, path: Path) -> None:
+        """
+        Registers every page listed in a JSON manifest:
+
+            {"pages": [{"page_id": "home", "title": "Home", "icon_text": "🏠",
+                        "page": "GAVEL.pages.home.page:HomePage",
+                        "order": 10, "group": "General"}]}
+
+        Only the metadata is read here; page modules are imported when a page
+        is first shown.
+        """
+        with path.open("r", encoding="utf-8") as fh:
+            manifest = json.load(fh)
+
+        for entry in manifest.get("pages", []):
+            missing = [k for k in ("page_id", "title", "icon_text", "page") if k not in entry]
+            if missing:
+                raise ValueError(f"Page manifest entry is missing {', '.join(missing)}: {entry}")
+            self.register(
+                PageSpec(
+                    page_id=entry["page_id"],
+                    title=entry["title"],
+                    icon_text=entry["icon_text"],
+                    factory=lazy_page_factory(entry["page"]),
+                    order=int(entry.get("order", 100)),
+                    group=entry.get("group", "General"),
+                )
+            )
+
     def list_pages(self) -> List[PageSpec]:
         return sorted(self._pages.values(), key=lambda p: (p.group, p.order))
 
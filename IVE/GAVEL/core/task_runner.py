@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task (via TaskContext.check_cancelled) to stop it early."""
+
+
+@dataclass(frozen=True)
+class TaskProgress:
+    done: int
+    total: int
+    message: str = ""
+
+
+class TaskContext:
+    """
+    Handed to every task function. Tasks run on a pool thread, so the only
+    things they may touch are this context and their own arguments.
+
+    Cancellation is cooperative: long tasks should call check_cancelled()
+    between steps.
+    """
+
+    def __init__(self, handle: "TaskHandle") -> None:
+        self._handle = handle
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._handle.is_cancelled
+
+    def check_cancelled(self) -> None:
+        if self._handle.is_cancelled:
+            raise TaskCancelled()
+
+    def report_progress(self, done: int, total: int, message: str = "") -> None:
+        self._handle.progress.emit(TaskProgress(done=done, total=total, message=message))
+
+
+class TaskHandle(QObject):
+    """
+    One submitted task. Lives on the GUI thread; its signals are emitted from
+    the pool thread and delivered on the GUI thread, so slots may update view
+    model state directly.
+
+    Exactly one of succeeded / failed / cancelled is emitted, then finished.
+    """
+
+    progress = pyqtSignal(object)  # TaskProgress
+    succeeded = pyqtSignal(object)  # task return value
+    failed = pyqtSignal(object)  # Exception
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+        self._cancel_event = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+
+class _TaskRunnable(QRunnable):
+    def __init__(self, handle: TaskHandle, fn: Callable[[TaskContext], Any]) -> None:
+        super().__init__()
+        self._handle = handle
+        self._fn = fn
+
+    def run(self) -> None:
+        handle = self._handle
+        try:
+            if handle.is_cancelled:
+                raise TaskCancelled()
+            result = self._fn(TaskContext(handle))
+        except TaskCancelled:
+            handle.cancelled.emit()
+        except Exception as exc:  # noqa: BLE001
+            if handle.is_cancelled:
+                handle.cancelled.emit()
+            else:
+                handle.failed.emit(exc)
+        else:
+            # a result that arrives after cancel() is discarded.
+            if handle.is_cancelled:
+                handle.cancelled.emit()
+            else:
+                handle.succeeded.emit(result)
+        finally:
+            handle.finished.emit()
+
+
+class TaskRunner(QObject):
+    """
+    Runs blocking work (use cases, exports, network calls) off the GUI thread.
+
+    Each page owns one runner; max_concurrent bounds how many of that page's
+    tasks run at once, and further submissions wait in the runner's queue.
+    """
+
+    def __init__(self, max_concurrent: int = 1, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, max_concurrent))
+        self._active: List[TaskHandle] = []
+
+    def submit(
+        self,
+        fn: Callable[[TaskContext], Any],
+        *,
+        name: str = "task",
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_cancelled: Optional[Callable[[], None]] = None,
+        on_progress: Optional[Callable[[TaskProgress], None]] = None,
+    ) -> TaskHandle:
+        handle = TaskHandle(name)
+        # handle is parented so it lives on this (GUI) thread.
+        handle.setParent(self)
+        if on_success is not None:
+            handle.succeeded.connect(on_success)
+        if on_error is not None:
+            handle.failed.connect(on_error)
+        if on_cancelled is not None:
+            handle.cancelled.connect(on_cancelled)
+        if on_progress is not None:
+            handle.progress.connect(on_progress)
+        handle.finished.connect(lambda: self._forget(handle))
+
+        self._active.append(handle)
+        self._pool.start(_TaskRunnable(handle, fn))
+        return handle
+
+    @property
+    def active_count(self) -> int:
+        """Tasks submitted whose finished signal has not been delivered yet."""
+        return len(self._active)
+
+    def cancel_all(self) -> None:
+        for handle in list(self._active):
+            handle.cancel()
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """Blocks until every pool thread is idle. Signals are delivered on the next event loop pass."""
+        return self._pool.waitForDone(timeout_ms)
+
+    def shutdown(self, timeout_ms: int = 5000) -> bool:
+        self.cancel_all()
+        return self.wait_for_done(timeout_ms)
+
+    def _forget(self, handle: TaskHandle) -> None:
+        if handle in self._active:
+            self._active.remove(handle)
+        handle.deleteLater()
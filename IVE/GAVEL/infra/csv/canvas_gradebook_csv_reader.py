@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import csv
+import io
 import re
 from pathlib import Path
+from typing import TextIO
 
 from GAVEL.app.dtos.canvas_gradebook import (
     CanvasGradebook,
@@ -86,30 +88,37 @@ class LegacyGradebookCSVReader:
 
     def parse(self, path: Path) -> CanvasGradebook:
         with path.open(encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            # Discard the "Manual Posting" preamble row.
-            next(reader)
-
-            # Consume the "Points Possible" row to extract column point values.
-            points_row = next(reader)
-
-            assignment_headers = [
-                h for h in reader.fieldnames or []
-                if _is_assignment_column(h)
-            ]
-
-            columns = tuple(
-                _parse_assignment_column(h, points_row.get(h, ""))
-                for h in assignment_headers
-            )
-
-            rows = tuple(
-                self._parse_student_row(row, assignment_headers)
-                for row in reader
-                if not row["Student"].strip().startswith(_SENTINEL_STUDENT)
-                and row["ID"].strip()  # skip blank/staff rows with no Canvas ID
-            )
+            return self._parse_file(f)
+
+    def parse_bytes(self, data: bytes) -> CanvasGradebook:
+        """Parses an export already in memory, e.g. from CanvasClient.fetch_gradebook_csv."""
+        return self._parse_file(io.StringIO(data.decode("utf-8-sig"), newline=""))
+
+    def _parse_file(self, f: TextIO) -> CanvasGradebook:
+        reader = csv.DictReader(f)
+
+        # Discard the "Manual Posting" preamble row.
+        next(reader)
+
+        # Consume the "Points Possible" row to extract column point values.
+        points_row = next(reader)
+
+        assignment_headers = [
+            h for h in reader.fieldnames or []
+            if _is_assignment_column(h)
+        ]
+
+        columns = tuple(
+            _parse_assignment_column(h, points_row.get(h, ""))
+            for h in assignment_headers
+        )
+
+        rows = tuple(
+            self._parse_student_row(row, assignment_headers)
+            for row in reader
+            if not row["Student"].strip().startswith(_SENTINEL_STUDENT)
+            and row["ID"].strip()  # skip blank/staff rows with no Canvas ID
+        )
 
         return CanvasGradebook(columns=columns, rows=rows)
 
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
+import csv
 from pathlib import Path
 from typing import List
 
-import pandas as pd
-
 from IVE.GAVEL.app.dtos.asu_roster import RosterStudent
 from IVE.GAVEL.app.ports.asu_roster_reader import RosterReader
 
@@ -26,10 +25,33 @@ _COLUMN_MAP: dict[str, str] = {
 
 
 class CanvasRosterCSVReader(RosterReader):
-    """Reads the MyASU/PeopleSoft ground-truth roster CSV format."""
+    """
+    Reads the MyASU/PeopleSoft ground-truth roster CSV format.
+
+    Rows are streamed with the csv module straight into RosterStudent
+    (a slotted dataclass): the header is resolved to column positions once,
+    so no per-row dict is built and pandas is never imported.
+    """
 
     def read(self, path: Path) -> List[RosterStudent]:
-        df = pd.read_csv(path, dtype=str)
-        df = df.rename(columns=_COLUMN_MAP)
-        df["units"] = df["units"].astype(int)
-        return [RosterStudent(**row) for row in df.to_dict(orient="records")]
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return []
+
+            missing = [name for name in _COLUMN_MAP if name not in header]
+            if missing:
+                raise ValueError(f"Roster {path} is missing columns: {missing}")
+            # field order of RosterStudent, so rows can be passed positionally.
+            positions = [header.index(name) for name in _COLUMN_MAP]
+            units = list(_COLUMN_MAP.values()).index("units")
+
+            students = []
+            for row in reader:
+                if not row:
+                    continue
+                values = [row[i] for i in positions]
+                values[units] = int(values[units])
+                students.append(RosterStudent(*values))
+        return students
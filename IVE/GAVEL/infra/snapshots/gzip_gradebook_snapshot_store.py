@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from GAVEL.app.dtos.gradebook_snapshot import GradebookSnapshot
+from GAVEL.app.ports.gradebook_snapshot_store import GradebookSnapshotStore
+
+_SUFFIX = ".csv.gz"
+_TIME_FORMAT = "%Y%m%dT%H%M%S%fZ"
+_DIGEST_CHARS = 16
+
+
+class GzipGradebookSnapshotStore(GradebookSnapshotStore):
+    """
+    Stores snapshots as <root>/<course_id>/<UTC time>_<digest>.csv.gz.
+
+    File names sort oldest first and carry everything list_snapshots() needs,
+    so listing never opens a file. Snapshots are written to a temporary file
+    and renamed into place, so a failed pull never leaves a partial snapshot.
+    """
+
+    def __init__(
+        self, root: Path, clock: Optional[Callable[[], datetime]] = None, compresslevel: int = 6
+    ) -> None:
+        self._root = Path(root)
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._compresslevel = compresslevel
+
+    def save(self, course_id: int, csv_bytes: bytes) -> GradebookSnapshot:
+        digest = hashlib.sha256(csv_bytes).hexdigest()[:_DIGEST_CHARS]
+        existing = self.list_snapshots(course_id)
+        if existing and existing[-1].digest == digest:
+            return existing[-1]
+
+        taken_at = self._clock().astimezone(timezone.utc)
+        snapshot_id = f"{taken_at.strftime(_TIME_FORMAT)}_{digest}"
+        folder = self._course_dir(course_id)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".", suffix=".partial")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=self._compresslevel, mtime=0
+            ) as gz:
+                gz.write(csv_bytes)
+            os.replace(temp_path, folder / f"{snapshot_id}{_SUFFIX}")
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return GradebookSnapshot(course_id=course_id, snapshot_id=snapshot_id, taken_at=taken_at, digest=digest)
+
+    def list_snapshots(self, course_id: int) -> List[GradebookSnapshot]:
+        folder = self._course_dir(course_id)
+        if not folder.is_dir():
+            return []
+        snapshots = []
+        for path in sorted(folder.glob(f"*{_SUFFIX}")):
+            snapshot_id = path.name[: -len(_SUFFIX)]
+            stamp, _, digest = snapshot_id.partition("_")
+            taken_at = datetime.strptime(stamp, _TIME_FORMAT).replace(tzinfo=timezone.utc)
+            snapshots.append(GradebookSnapshot(course_id, snapshot_id, taken_at, digest))
+        return snapshots
+
+    def load(self, course_id: int, snapshot_id: str) -> bytes:
+        path = self._course_dir(course_id) / f"{snapshot_id}{_SUFFIX}"
+        if not path.is_file():
+            raise KeyError(f"No snapshot {snapshot_id} for course {course_id}")
+        with gzip.open(path, "rb") as f:
+            return f.read()
+
+    def _course_dir(self, course_id: int) -> Path:
+        return self._root / str(int(course_id))
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from GAVEL.app.dtos.asu_roster import RosterStudent
+from GAVEL.app.dtos.canvas_consent_form_entry import ConsentFormEntry
+from GAVEL.app.dtos.canvas_course import CanvasCourseData
+from GAVEL.app.dtos.canvas_gradebook import CanvasGradebook
+from GAVEL.app.dtos.gradescope import GradescopeSubmission
+
+# students.key is the ASURITE (the gradebook's SIS Login ID) wherever one is
+# known; Shoggoth evaluations only carry the uid from their file name, which
+# is used as the key instead.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    id          INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    course_code TEXT,
+    semester    TEXT
+);
+CREATE TABLE IF NOT EXISTS modules (
+    id          INTEGER PRIMARY KEY,
+    course_id   INTEGER NOT NULL REFERENCES courses (id) ON DELETE CASCADE,
+    name        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id          INTEGER PRIMARY KEY,
+    course_id   INTEGER NOT NULL REFERENCES courses (id) ON DELETE CASCADE,
+    name        TEXT NOT NULL,
+    UNIQUE (course_id, name)
+);
+CREATE TABLE IF NOT EXISTS students (
+    id               INTEGER PRIMARY KEY,
+    key              TEXT NOT NULL UNIQUE,
+    asu_id           TEXT,
+    canvas_id        INTEGER,
+    name             TEXT,
+    academic_level   TEXT,
+    program_and_plan TEXT
+);
+CREATE INDEX IF NOT EXISTS students_by_asu_id ON students (asu_id);
+CREATE INDEX IF NOT EXISTS students_by_canvas_id ON students (canvas_id);
+CREATE TABLE IF NOT EXISTS enrollments (
+    section_id  INTEGER NOT NULL REFERENCES sections (id) ON DELETE CASCADE,
+    student_id  INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    status      TEXT,
+    units       INTEGER,
+    PRIMARY KEY (section_id, student_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS enrollments_by_student ON enrollments (student_id);
+CREATE TABLE IF NOT EXISTS assignments (
+    id              INTEGER PRIMARY KEY,
+    course_id       INTEGER NOT NULL REFERENCES courses (id) ON DELETE CASCADE,
+    source          TEXT NOT NULL,
+    external_id     TEXT NOT NULL,
+    name            TEXT NOT NULL,
+    points_possible REAL,
+    UNIQUE (course_id, source, external_id)
+);
+CREATE TABLE IF NOT EXISTS scores (
+    assignment_id INTEGER NOT NULL REFERENCES assignments (id) ON DELETE CASCADE,
+    student_id    INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    score         REAL,
+    PRIMARY KEY (assignment_id, student_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scores_by_student ON scores (student_id);
+CREATE TABLE IF NOT EXISTS test_results (
+    assignment_id INTEGER NOT NULL REFERENCES assignments (id) ON DELETE CASCADE,
+    student_id    INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    number        TEXT NOT NULL,
+    name          TEXT,
+    score         REAL NOT NULL,
+    max_score     REAL,
+    PRIMARY KEY (assignment_id, student_id, number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS test_results_by_student ON test_results (student_id);
+CREATE TABLE IF NOT EXISTS consent (
+    course_id   INTEGER NOT NULL REFERENCES courses (id) ON DELETE CASCADE,
+    canvas_id   INTEGER NOT NULL,
+    attempt     INTEGER NOT NULL,
+    consented   INTEGER NOT NULL,
+    PRIMARY KEY (course_id, canvas_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS consent_by_canvas_id ON consent (canvas_id);
+"""
+
+
+class CourseWarehouse:
+    """
+    Local SQLite store for every artifact GAVEL downloads or reads, so
+    cross-semester questions are SQL queries instead of re-parsing folders.
+
+    Each ingest_* method takes what the matching reader or client returns and
+    is idempotent: re-ingesting an export updates its rows in place. Students
+    are merged across sources by ASURITE, so a roster, a gradebook and a
+    Gradescope export of the same class end up on the same students rows.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # -- ingest -------------------------------------------------------------
+
+    def ingest_course(self, data: CanvasCourseData, semester: Optional[str] = None) -> None:
+        """Adds a course and its modules (DownloadCourseDataUseCase / CanvasClient)."""
+        with self._conn:
+            self._ensure_course(data.course.id, data.course.name, data.course.course_code, semester)
+            self._conn.executemany(
+                "INSERT INTO modules (id, course_id, name) VALUES (?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET course_id = excluded.course_id, name = excluded.name",
+                [(m.id, data.course.id, m.name) for m in data.modules],
+            )
+
+    def ingest_roster(self, course_id: int, section: str, students: Sequence[RosterStudent]) -> None:
+        """Adds one section roster (CanvasRosterCSVReader)."""
+        with self._conn:
+            self._ensure_course(course_id)
+            section_id = self._section_id(course_id, section)
+            ids = self._upsert_students(
+                (s.asurite, s.id, None, f"{s.last_name}, {s.first_name}", s.academic_level, s.program_and_plan)
+                for s in students
+            )
+            self._conn.executemany(
+                "INSERT INTO enrollments (section_id, student_id, status, units) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (section_id, student_id) DO UPDATE SET status = excluded.status, units = excluded.units",
+                [(section_id, ids[s.asurite], s.status, s.units) for s in students],
+            )
+
+    def ingest_gradebook(self, course_id: int, gradebook: CanvasGradebook) -> None:
+        """Adds assignment columns, section enrollments and scores (LegacyGradebookCSVReader)."""
+        with self._conn:
+            self._ensure_course(course_id)
+            ids = self._upsert_students(
+                (r.sis_login_id, None, r.canvas_id, r.student_name, None, None) for r in gradebook.rows
+            )
+            sections = {name: self._section_id(course_id, name) for name in {r.section for r in gradebook.rows}}
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO enrollments (section_id, student_id) VALUES (?, ?)",
+                [(sections[r.section], ids[r.sis_login_id]) for r in gradebook.rows],
+            )
+            assignments = {
+                c.raw_header: self._assignment_id(
+                    course_id, "canvas", str(c.canvas_id), c.display_name, c.points_possible
+                )
+                for c in gradebook.columns
+            }
+            self._upsert_scores(
+                (assignments[header], ids[r.sis_login_id], score)
+                for r in gradebook.rows
+                for header, score in r.assignment_scores.items()
+                if header in assignments
+            )
+
+    def ingest_gradescope(
+        self, course_id: int, assignment: str, submissions: Sequence[GradescopeSubmission]
+    ) -> None:
+        """
+        Adds per-test results of one Gradescope assignment (YamlGradescopeReader).
+
+        Submitters are matched to students by ASU ID, then by the ASURITE in
+        their e-mail address.
+        """
+        with self._conn:
+            self._ensure_course(course_id)
+            assignment_id = self._assignment_id(course_id, "gradescope", assignment, assignment, None)
+            sids = json.dumps([s.submitter.sid for s in submissions])
+            by_asu_id = {
+                row["asu_id"]: row["key"]
+                for row in self._conn.execute(
+                    "SELECT asu_id, key FROM students WHERE asu_id IN (SELECT value FROM json_each(?))", (sids,)
+                )
+            }
+            for s in submissions:
+                by_asu_id.setdefault(s.submitter.sid, s.submitter.email.split("@")[0])
+            ids = self._upsert_students(
+                (by_asu_id[s.submitter.sid], s.submitter.sid, None, s.submitter.name, None, None) for s in submissions
+            )
+            self._upsert_tests(
+                (assignment_id, ids[by_asu_id[s.submitter.sid]], t.number or t.name, t.name, t.score, t.max_score)
+                for s in submissions
+                for t in s.tests
+            )
+            self._upsert_scores(
+                (assignment_id, ids[by_asu_id[s.submitter.sid]], sum(t.score for t in s.tests))
+                for s in submissions
+            )
+
+    def ingest_evaluations(self, course_id: int, module: str, evaluations: Mapping[str, Mapping[str, Any]]) -> None:
+        """Adds Shoggoth evaluations of one module, given as uid -> evaluation JSON."""
+        with self._conn:
+            self._ensure_course(course_id)
+            assignment_id = self._assignment_id(course_id, "shoggoth", module, module, None)
+            ids = self._upsert_students((uid, None, None, None, None, None) for uid in evaluations)
+            self._upsert_tests(
+                (assignment_id, ids[uid], str(t["number"]), t.get("name"), t["score"], t.get("max_score"))
+                for uid, evaluation in evaluations.items()
+                for t in evaluation["tests"]
+            )
+            self._upsert_scores(
+                (assignment_id, ids[uid], sum(t["score"] for t in evaluation["tests"]))
+                for uid, evaluation in evaluations.items()
+            )
+
+    def ingest_consent(self, course_id: int, entries: Iterable[ConsentFormEntry]) -> None:
+        """Records each student's latest consent form attempt (CanvasConsentFormCSVReader)."""
+        with self._conn:
+            self._ensure_course(course_id)
+            self._conn.executemany(
+                "INSERT INTO consent (course_id, canvas_id, attempt, consented) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (course_id, canvas_id) DO UPDATE SET attempt = excluded.attempt, "
+                "consented = excluded.consented WHERE excluded.attempt >= consent.attempt",
+                [(course_id, e.sis_id, e.attempt, int(e.consented)) for e in entries],
+            )
+
+    # -- queries ------------------------------------------------------------
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        return self._conn.execute(sql, params).fetchall()
+
+    def dataframe(self, sql: str, params: Sequence[Any] = ()):
+        """Runs a query into a pandas DataFrame (pandas is only imported here)."""
+        import pandas as pd
+
+        return pd.read_sql_query(sql, self._conn, params=params)
+
+    # -- helpers ------------------------------------------------------------
+
+    def _ensure_course(
+        self,
+        course_id: int,
+        name: Optional[str] = None,
+        course_code: Optional[str] = None,
+        semester: Optional[str] = None,
+    ) -> None:
+        self._conn.execute(
+            "INSERT INTO courses (id, name, course_code, semester) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET name = COALESCE(?, courses.name), "
+            "course_code = COALESCE(excluded.course_code, courses.course_code), "
+            "semester = COALESCE(excluded.semester, courses.semester)",
+            (course_id, name or str(course_id), course_code, semester, name),
+        )
+
+    def _section_id(self, course_id: int, name: str) -> int:
+        return self._conn.execute(
+            "INSERT INTO sections (course_id, name) VALUES (?, ?) "
+            "ON CONFLICT (course_id, name) DO UPDATE SET name = excluded.name RETURNING id",
+            (course_id, name),
+        ).fetchone()["id"]
+
+    def _assignment_id(
+        self, course_id: int, source: str, external_id: str, name: str, points_possible: Optional[float]
+    ) -> int:
+        return self._conn.execute(
+            "INSERT INTO assignments (course_id, source, external_id, name, points_possible) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (course_id, source, external_id) DO UPDATE SET name = excluded.name, "
+            "points_possible = COALESCE(excluded.points_possible, assignments.points_possible) RETURNING id",
+            (course_id, source, external_id, name, points_possible),
+        ).fetchone()["id"]
+
+    def _upsert_students(self, rows: Iterable[tuple]) -> Dict[str, int]:
+        """
+        Inserts or fills in (key, asu_id, canvas_id, name, academic_level,
+        program_and_plan) rows, keeping known values where a source has None.
+        Returns key -> students.id.
+        """
+        rows = list(rows)
+        self._conn.executemany(
+            "INSERT INTO students (key, asu_id, canvas_id, name, academic_level, program_and_plan) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+            "asu_id = COALESCE(excluded.asu_id, students.asu_id), "
+            "canvas_id = COALESCE(excluded.canvas_id, students.canvas_id), "
+            "name = COALESCE(excluded.name, students.name), "
+            "academic_level = COALESCE(excluded.academic_level, students.academic_level), "
+            "program_and_plan = COALESCE(excluded.program_and_plan, students.program_and_plan)",
+            rows,
+        )
+        keys = json.dumps([row[0] for row in rows])
+        return {
+            row["key"]: row["id"]
+            for row in self._conn.execute(
+                "SELECT key, id FROM students WHERE key IN (SELECT value FROM json_each(?))", (keys,)
+            )
+        }
+
+    def _upsert_scores(self, rows: Iterable[tuple]) -> None:
+        self._conn.executemany(
+            "INSERT INTO scores (assignment_id, student_id, score) VALUES (?, ?, ?) "
+            "ON CONFLICT (assignment_id, student_id) DO UPDATE SET score = excluded.score",
+            rows,
+        )
+
+    def _upsert_tests(self, rows: Iterable[tuple]) -> None:
+        self._conn.executemany(
+            "INSERT INTO test_results (assignment_id, student_id, number, name, score, max_score) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (assignment_id, student_id, number) DO UPDATE SET "
+            "name = excluded.name, score = excluded.score, max_score = excluded.max_score",
+            rows,
+        )
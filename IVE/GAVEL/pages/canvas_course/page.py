@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import QTabWidget, QVBoxLayout
 
 from GAVEL.app_context import AppContext
 from GAVEL.core.base_page import BasePage
-from GAVEL.core.page_registry import PageRegistry, PageSpec
+from GAVEL.core.task_runner import TaskRunner
 from GAVEL.pages.canvas_course.tabs import CanvasCourseTab
 from GAVEL.pages.canvas_course.viewmodel import CanvasCourseViewModel
 
@@ -23,11 +23,17 @@ class CanvasCoursePage(BasePage):
         canvas_cfg = ctx.config.get().canvas
         canvas_configured = bool(canvas_cfg.base_url and canvas_cfg.token)
 
+        # two, so one prefetch in flight can't hold up a download. Cancelling a stale prefetch only
+        # stops it before it starts fetching, so two of them still can; and a download of the course
+        # being prefetched waits for that fetch anyway, through the course data cache.
+        self._tasks = TaskRunner(max_concurrent=2, parent=self)
+
         vm = CanvasCourseViewModel(
             use_case=ctx.services.download_course_data_uc,
             default_output_dir=default_output_dir,
             logger=ctx.logger,
             canvas_configured=canvas_configured,
+            task_runner=self._tasks,
         )
 
         tab = CanvasCourseTab(ctx.theme, vm)
@@ -38,14 +44,5 @@ class CanvasCoursePage(BasePage):
         root = QVBoxLayout(self)
         root.addWidget(self._tabs)
 
-
-PageRegistry.get().register(
-    PageSpec(
-        page_id=CanvasCoursePage.page_id,
-        title=CanvasCoursePage.title,
-        icon_text="📚",
-        factory=lambda ctx: CanvasCoursePage(ctx),
-        order=30,
-        group="Integrations",
-    )
-)
+    def shutdown(self) -> None:
+        self._tasks.shutdown()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from PyQt6.QtWidgets import (
     QFormLayout,
+    QHBoxLayout,
     QLabel,
     QLineEdit,
     QMessageBox,
@@ -30,6 +31,7 @@ class CanvasCourseTab(ScrollableTab):
 
         self._course_id = QLineEdit()
         self._download_btn = QPushButton("Download")
+        self._cancel_btn = QPushButton("Cancel")
         self._status_pill = StatusPill(theme)
         self._message_label = QLabel("")
         self._message_label.setWordWrap(True)
@@ -37,9 +39,13 @@ class CanvasCourseTab(ScrollableTab):
         self._last_saved_label.setWordWrap(True)
         self._last_saved_label.setProperty("role", "text_muted")
         self._last_saved_label.hide()
+        self._preview_label = QLabel("")
+        self._preview_label.setWordWrap(True)
+        self._preview_label.setProperty("role", "text_muted")
 
         self._course_id.textChanged.connect(self._vm.set_course_id)
         self._download_btn.clicked.connect(self._vm.download_course)
+        self._cancel_btn.clicked.connect(self._vm.cancel_download)
         self._vm.state_changed.connect(self.render)
         self._vm.event_raised.connect(self._handle_event)
 
@@ -57,7 +63,16 @@ class CanvasCourseTab(ScrollableTab):
         set_spacing(form, self._theme, 8)
 
         form.addRow("Course ID", self._course_id)
-        form.addRow("", self._download_btn)
+        form.addRow("Course", self._preview_label)
+        buttons = QWidget()
+        buttons_row = QHBoxLayout(buttons)
+        buttons_row.setContentsMargins(0, 0, 0, 0)
+        set_spacing(buttons_row, self._theme, 8)
+        buttons_row.addWidget(self._download_btn)
+        buttons_row.addWidget(self._cancel_btn)
+        buttons_row.addStretch(1)
+
+        form.addRow("", buttons)
         form.addRow("Status", self._status_pill)
         form.addRow("Message", self._message_label)
         form.addRow("Last Saved", self._last_saved_label)
@@ -70,6 +85,7 @@ class CanvasCourseTab(ScrollableTab):
         self._message_label.setText(state.message)
 
         self._download_btn.setEnabled(not state.is_busy)
+        self._cancel_btn.setVisible(state.is_busy)
 
         if self._course_id.text() != state.course_id:
             self._course_id.blockSignals(True)
@@ -78,6 +94,8 @@ class CanvasCourseTab(ScrollableTab):
             finally:
                 self._course_id.blockSignals(False)
 
+        self._preview_label.setText(self._preview_text(state))
+
         if state.last_saved_path:
             self._last_saved_label.setText(state.last_saved_path)
             self._last_saved_label.show()
@@ -85,6 +103,20 @@ class CanvasCourseTab(ScrollableTab):
             self._last_saved_label.clear()
             self._last_saved_label.hide()
 
+    @staticmethod
+    def _preview_text(state: CanvasCourseUiState) -> str:
+        preview = state.preview
+        if preview is None:
+            return ""
+        if preview.error:
+            return f"Preview unavailable: {preview.error}"
+        if preview.course_name is None:
+            return "Looking up course..."
+        modules = ", ".join(preview.module_names[:5])
+        if len(preview.module_names) > 5:
+            modules += f", ... ({len(preview.module_names)} modules)"
+        return f"{preview.course_name}\n{modules}" if modules else preview.course_name
+
     def _handle_event(self, event: object) -> None:
         if isinstance(event, ShowError):
             QMessageBox.critical(self, "Canvas Course", event.message)
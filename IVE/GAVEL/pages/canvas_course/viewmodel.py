@@ -2,18 +2,29 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+from GAVEL.app.dtos.canvas_course import CanvasCourseData
 from GAVEL.app.usecases.canvas_download_course import (
     DownloadCourseDataRequest,
+    DownloadCourseDataResult,
     DownloadCourseDataUseCase,
 )
 from GAVEL.core.status import Status
+from GAVEL.core.task_runner import TaskContext, TaskHandle, TaskRunner
 from GAVEL.services.logger import AppLogger
 
 
+@dataclass(frozen=True)
+class CoursePreview:
+    course_id: str
+    course_name: Optional[str]    # None while loading or after an error
+    module_names: Tuple[str, ...]
+    error: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class CanvasCourseUiState:
     course_id: str
@@ -21,6 +32,7 @@ class CanvasCourseUiState:
     status: Status
     message: str
     last_saved_path: Optional[str]
+    preview: Optional[CoursePreview] = None
 
 
 @dataclass(frozen=True)
@@ -34,6 +46,9 @@ class ShowInfo:
 
 
 class CanvasCourseViewModel(QObject):
+    # how long the typed course ID must stay unchanged before it is prefetched.
+    PREFETCH_DEBOUNCE_MS = 400
+
     state_changed = pyqtSignal(object)  # CanvasCourseUiState
     event_raised = pyqtSignal(object)  # ShowError | ShowInfo
 
@@ -43,12 +58,24 @@ class CanvasCourseViewModel(QObject):
         default_output_dir: Path,
         logger: AppLogger,
         canvas_configured: bool,
+        task_runner: Optional[TaskRunner] = None,
+        prefetch_debounce_ms: Optional[int] = None,
     ) -> None:
         super().__init__()
         self._use_case = use_case
         self._output_dir = default_output_dir
         self._logger = logger
         self._canvas_configured = canvas_configured
+        self._tasks = task_runner if task_runner is not None else TaskRunner(parent=self)
+        self._download: Optional[TaskHandle] = None
+        self._prefetch: Optional[TaskHandle] = None
+
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(
+            self.PREFETCH_DEBOUNCE_MS if prefetch_debounce_ms is None else prefetch_debounce_ms
+        )
+        self._prefetch_timer.timeout.connect(self._start_prefetch)
 
         initial_message = "Enter a Canvas course ID to download."
         initial_status = Status.UNKNOWN
@@ -71,7 +98,51 @@ class CanvasCourseViewModel(QObject):
         text = value.strip()
         if text == self._state.course_id:
             return
-        self._state = replace(self._state, course_id=text)
+        self._state = replace(self._state, course_id=text, preview=None)
+        self.state_changed.emit(self._state)
+
+        # restarted on every keystroke, so only a course ID left alone is fetched.
+        self._prefetch_timer.stop()
+        if self._prefetch is not None:
+            self._prefetch.cancel()  # stale: a request already sent still fills the cache.
+            self._prefetch = None
+        if self._canvas_configured and text.isdigit() and int(text) > 0:
+            self._prefetch_timer.start()
+
+    def _start_prefetch(self) -> None:
+        course_id = self._state.course_id
+        self._state = replace(self._state, preview=CoursePreview(course_id, None, ()))
+        self.state_changed.emit(self._state)
+
+        def run(ctx: TaskContext) -> CanvasCourseData:
+            ctx.check_cancelled()
+            return self._use_case.prefetch(int(course_id))
+
+        handle = self._tasks.submit(
+            run,
+            name=f"canvas_prefetch_{course_id}",
+            on_success=lambda data: self._on_prefetched(handle, course_id, data),
+            on_error=lambda exc: self._on_prefetch_failed(handle, course_id, exc),
+        )
+        self._prefetch = handle
+
+    def _on_prefetched(self, handle: TaskHandle, course_id: str, data: CanvasCourseData) -> None:
+        if handle is self._prefetch:
+            self._prefetch = None
+        if course_id != self._state.course_id:
+            return  # the user has typed another course since.
+        preview = CoursePreview(course_id, data.course.name, tuple(m.name for m in data.modules))
+        self._state = replace(self._state, preview=preview)
+        self.state_changed.emit(self._state)
+
+    def _on_prefetch_failed(self, handle: TaskHandle, course_id: str, exc: Exception) -> None:
+        if handle is self._prefetch:
+            self._prefetch = None
+        if course_id != self._state.course_id:
+            return
+        # only a preview: the error is shown inline, and Download reports it properly if retried.
+        self._logger.warning(f"Canvas prefetch for course {course_id} failed: {exc}")
+        self._state = replace(self._state, preview=CoursePreview(course_id, None, (), error=str(exc)))
         self.state_changed.emit(self._state)
 
     def download_course(self) -> None:
@@ -90,19 +161,45 @@ class CanvasCourseViewModel(QObject):
             return
 
         self._set_busy(Status.WARNING, "Downloading course data...")
+        # downloading right after typing should not wait out the debounce first.
+        self._prefetch_timer.stop()
 
-        try:
-            request = DownloadCourseDataRequest(course_id=course_id, output_dir=self._output_dir)
-            result = self._use_case.execute(request)
-        except Exception as exc:  # noqa: BLE001
-            self._logger.error(f"Canvas download failed: {exc}")
-            self._set_idle(Status.CRITICAL, str(exc), None)
-            self.event_raised.emit(ShowError(str(exc)))
+        request = DownloadCourseDataRequest(course_id=course_id, output_dir=self._output_dir)
+
+        def run(ctx: TaskContext) -> DownloadCourseDataResult:
+            ctx.check_cancelled()
+            return self._use_case.execute(request)
+
+        self._download = self._tasks.submit(
+            run,
+            name=f"canvas_download_{course_id}",
+            on_success=self._on_download_succeeded,
+            on_error=self._on_download_failed,
+            on_cancelled=self._on_download_cancelled,
+        )
+
+    def cancel_download(self) -> None:
+        if self._download is None or self._download.is_cancelled:
             return
+        # the request in flight cannot be interrupted; its result is discarded.
+        self._download.cancel()
+        self._set_busy(Status.CAUTION, "Cancelling download...")
 
+    def _on_download_succeeded(self, result: DownloadCourseDataResult) -> None:
+        self._download = None
         self._set_idle(Status.NOMINAL, result.message, str(result.saved_path))
         self.event_raised.emit(ShowInfo(result.message))
 
+    def _on_download_failed(self, exc: Exception) -> None:
+        self._download = None
+        self._logger.error(f"Canvas download failed: {exc}")
+        self._set_idle(Status.CRITICAL, str(exc), None)
+        self.event_raised.emit(ShowError(str(exc)))
+
+    def _on_download_cancelled(self) -> None:
+        self._download = None
+        self._set_idle(Status.UNKNOWN, "Download cancelled.", self._state.last_saved_path)
+
     def _set_busy(self, status: Status, message: str) -> None:
         self._state = replace(
             self._state,
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from PyQt6.QtWidgets import QTabWidget, QVBoxLayout
+
+from GAVEL.app.usecases.load_score_matrix import LoadScoreMatrixUseCase
+from GAVEL.app_context import AppContext
+from GAVEL.core.base_page import BasePage
+from GAVEL.core.task_runner import TaskRunner
+from GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+from GAVEL.pages.gradebook.tabs import GradebookTab
+from GAVEL.pages.gradebook.viewmodel import GradebookViewModel
+
+
+class GradebookPage(BasePage):
+    page_id = "gradebook"
+    title = "Gradebook"
+
+    def __init__(self, ctx: AppContext) -> None:
+        super().__init__()
+        self._tasks = TaskRunner(max_concurrent=1, parent=self)
+
+        # built here rather than in AppServices so NumPy is only imported once this page is opened.
+        use_case = LoadScoreMatrixUseCase(LegacyGradebookCSVReader())
+        self._vm = GradebookViewModel(use_case, ctx.logger, task_runner=self._tasks)
+
+        self._tabs = QTabWidget()
+        self._tabs.addTab(GradebookTab(ctx.theme, self._vm), "Scores")
+
+        root = QVBoxLayout(self)
+        root.addWidget(self._tabs)
+
+    def shutdown(self) -> None:
+        self._tasks.shutdown()
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QBrush, QColor
+
+from GAVEL.app.dtos.score_matrix import ScoreMatrix
+
+# cells are shaded in this many steps from the low to the high score colour.
+_SHADE_STEPS = 16
+
+# data() runs for every role of every visible cell on each repaint, so it compares plain ints.
+_DISPLAY = int(Qt.ItemDataRole.DisplayRole.value)
+_BACKGROUND = int(Qt.ItemDataRole.BackgroundRole.value)
+_ALIGNMENT = int(Qt.ItemDataRole.TextAlignmentRole.value)
+_RIGHT_ALIGNED = int((Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter).value)
+
+_NO_PARENT = QModelIndex()
+
+
+class ScoreTableModel(QAbstractTableModel):
+    """
+    Read-only table over a ScoreMatrix.
+
+    The matrix is never copied or reordered: sorting and filtering only
+    rebuild `_view`, an index array of the matrix rows currently shown, and
+    data() reads straight from the matrix for whichever cells the view asks
+    for (only the visible ones). Cell shading is looked up per cell from a
+    handful of precomputed brushes.
+    """
+
+    def __init__(self, low_color: str, high_color: str, parent=None) -> None:
+        super().__init__(parent)
+        self._matrix: Optional[ScoreMatrix] = None
+        self._points: List[float] = []
+        self._names = np.empty(0, dtype=str)
+        self._order = np.empty(0, dtype=np.intp)
+        self._mask = np.empty(0, dtype=bool)
+        self._view = np.empty(0, dtype=np.intp)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._brushes = self._shade_brushes(QColor(low_color), QColor(high_color))
+
+    # -- data ---------------------------------------------------------------
+
+    def set_matrix(self, matrix: Optional[ScoreMatrix]) -> None:
+        self.beginResetModel()
+        self._matrix = matrix
+        self._points = [] if matrix is None else matrix.points_possible.tolist()
+        n = 0 if matrix is None else matrix.shape[0]
+        labels = () if matrix is None else matrix.row_labels
+        self._names = np.array([label.lower() for label in labels], dtype=str)
+        self._order = np.arange(n, dtype=np.intp)
+        self._mask = np.ones(n, dtype=bool)
+        self._sort_column = -1
+        self._view = self._order
+        self.endResetModel()
+
+    def matrix(self) -> Optional[ScoreMatrix]:
+        return self._matrix
+
+    def visible_rows(self) -> np.ndarray:
+        """Matrix row indices in display order."""
+        return self._view
+
+    def rowCount(self, parent: QModelIndex = _NO_PARENT) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._view)
+
+    def columnCount(self, parent: QModelIndex = _NO_PARENT) -> int:  # noqa: N802
+        if parent.isValid() or self._matrix is None:
+            return 0
+        return self._matrix.shape[1]
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        role = int(role)
+        if role == _ALIGNMENT:
+            return _RIGHT_ALIGNED
+        if (role != _DISPLAY and role != _BACKGROUND) or self._matrix is None:
+            return None
+
+        column = index.column()
+        value = float(self._matrix.scores[self._view[index.row()], column])
+        if value != value:  # NaN: no score
+            return "" if role == _DISPLAY else None
+        if role == _DISPLAY:
+            return f"{value:g}"
+
+        points = self._points[column]
+        if not points > 0:
+            return None
+        step = int(min(max(value / points, 0.0), 1.0) * (_SHADE_STEPS - 1) + 0.5)
+        return self._brushes[step]
+
+    def headerData(  # noqa: N802
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if self._matrix is None or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            label = self._matrix.column_labels[section]
+            points = self._matrix.points_possible[section]
+            if role == Qt.ItemDataRole.ToolTipRole and not np.isnan(points):
+                return f"{label} ({points:g} pts)"
+            return label
+        row = self._view[section]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._matrix.row_ids[row]
+        return self._matrix.row_labels[row]
+
+    # -- sorting and filtering ---------------------------------------------
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        if self._matrix is None:
+            return
+        self._sort_column = column
+        self._sort_order = order
+
+        if column < 0:
+            self._order = np.arange(self._matrix.shape[0], dtype=np.intp)
+        else:
+            # sorts the current order (not the matrix's) with a stable sort, so ties keep
+            # the previous sort's order; NaN (missing) sorts last either way.
+            values = self._matrix.scores[self._order, column]
+            if order == Qt.SortOrder.DescendingOrder:
+                values = -values
+            self._order = self._order[np.argsort(values, kind="stable")]
+        self._refresh_view()
+
+    def set_name_filter(self, text: str) -> None:
+        if self._matrix is None:
+            return
+        needle = text.strip().lower()
+        if needle:
+            self._mask = np.char.find(self._names, needle) >= 0
+        else:
+            self._mask = np.ones(self._matrix.shape[0], dtype=bool)
+        self._refresh_view()
+
+    def _refresh_view(self) -> None:
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._view
+        self._view = self._order[self._mask[self._order]]
+
+        # keep selections and the current cell on the same student.
+        persistent = self.persistentIndexList()
+        if persistent:
+            position = np.full(len(self._mask), -1, dtype=np.intp)
+            position[self._view] = np.arange(len(self._view))
+            moved: List[QModelIndex] = []
+            for index in persistent:
+                row = position[old_rows[index.row()]]
+                moved.append(QModelIndex() if row < 0 else self.index(int(row), index.column()))
+            self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+
+    @staticmethod
+    def _shade_brushes(low: QColor, high: QColor) -> List[QBrush]:
+        brushes = []
+        for i in range(_SHADE_STEPS):
+            t = i / (_SHADE_STEPS - 1)
+            color = QColor(
+                round(low.red() + (high.red() - low.red()) * t),
+                round(low.green() + (high.green() - low.green()) * t),
+                round(low.blue() + (high.blue() - low.blue()) * t),
+            )
+            # subtle tint, so text stays readable on the dark surface.
+            color.setAlpha(90)
+            brushes.append(QBrush(color))
+        return brushes
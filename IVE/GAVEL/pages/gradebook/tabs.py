@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QMessageBox,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from GAVEL.pages.gradebook.score_table_model import ScoreTableModel
+from GAVEL.pages.gradebook.viewmodel import GradebookUiState, GradebookViewModel, ShowError
+from GAVEL.theme.context import ThemeContext
+from GAVEL.ui_components.layout import set_margins, set_spacing
+from GAVEL.ui_components.status_pill import StatusPill
+
+
+def configure_fast_table(table: QTableView) -> None:
+    """
+    Fixed section sizes: Qt then never measures cell contents to lay out
+    rows/columns, so only visible cells are ever asked for data.
+    """
+    for header in (table.horizontalHeader(), table.verticalHeader()):
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    table.verticalHeader().setDefaultSectionSize(table.fontMetrics().height() + 8)
+    table.horizontalHeader().setDefaultSectionSize(96)
+    table.setWordWrap(False)
+    table.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+    table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+
+
+class GradebookTab(QWidget):
+    # not a ScrollableTab: the table scrolls itself, and must fill the page to stay virtualized.
+    def __init__(self, theme: ThemeContext, vm: GradebookViewModel) -> None:
+        super().__init__()
+        self._theme = theme
+        self._vm = vm
+
+        c = theme.tokens.color
+        self._model = ScoreTableModel(c["status_critical"], c["status_nominal"], parent=self)
+
+        self._open_btn = QPushButton("Open Gradebook...")
+        self._filter = QLineEdit()
+        self._filter.setPlaceholderText("Filter students")
+        self._filter.setClearButtonEnabled(True)
+        self._status_pill = StatusPill(theme)
+        self._message_label = QLabel("")
+        self._message_label.setProperty("role", "text_muted")
+
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        self._table.setSortingEnabled(True)
+        self._table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        configure_fast_table(self._table)
+
+        toolbar = QHBoxLayout()
+        set_spacing(toolbar, theme, 8)
+        toolbar.addWidget(self._open_btn)
+        toolbar.addWidget(self._filter, 1)
+        toolbar.addWidget(self._status_pill)
+        toolbar.addWidget(self._message_label)
+
+        root = QVBoxLayout(self)
+        set_margins(root, theme, 16)
+        set_spacing(root, theme, 12)
+        root.addLayout(toolbar)
+        root.addWidget(self._table, 1)
+
+        self._open_btn.clicked.connect(self._choose_file)
+        self._filter.textChanged.connect(self._vm.set_name_filter)
+        self._vm.state_changed.connect(self.render)
+        self._vm.matrix_loaded.connect(self._show_matrix)
+        self._vm.event_raised.connect(self._handle_event)
+
+        self.render(self._vm.get_state())
+
+    def render(self, state: GradebookUiState) -> None:
+        self._status_pill.set_status(state.status)
+        self._message_label.setText(state.message)
+        self._open_btn.setEnabled(not state.is_busy)
+        self._model.set_name_filter(state.name_filter)
+
+    def _show_matrix(self, matrix) -> None:
+        self._model.set_matrix(matrix)
+        self._table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self._model.set_name_filter(self._vm.get_state().name_filter)
+
+    def _choose_file(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(self, "Open Gradebook", "", "CSV files (*.csv)")
+        if path:
+            self._vm.open_gradebook(path)
+
+    def _handle_event(self, event: object) -> None:
+        if isinstance(event, ShowError):
+            QMessageBox.critical(self, "Gradebook", event.message)
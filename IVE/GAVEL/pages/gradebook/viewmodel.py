@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from GAVEL.app.dtos.score_matrix import ScoreMatrix
+from GAVEL.app.usecases.load_score_matrix import LoadScoreMatrixRequest, LoadScoreMatrixUseCase
+from GAVEL.core.status import Status
+from GAVEL.core.task_runner import TaskContext, TaskRunner
+from GAVEL.services.logger import AppLogger
+
+
+@dataclass(frozen=True)
+class GradebookUiState:
+    path: str
+    is_busy: bool
+    status: Status
+    message: str
+    name_filter: str
+
+
+@dataclass(frozen=True)
+class ShowError:
+    message: str
+
+
+class GradebookViewModel(QObject):
+    state_changed = pyqtSignal(object)  # GradebookUiState
+    matrix_loaded = pyqtSignal(object)  # ScoreMatrix
+    event_raised = pyqtSignal(object)  # ShowError
+
+    def __init__(
+        self,
+        use_case: LoadScoreMatrixUseCase,
+        logger: AppLogger,
+        task_runner: Optional[TaskRunner] = None,
+    ) -> None:
+        super().__init__()
+        self._use_case = use_case
+        self._logger = logger
+        self._tasks = task_runner if task_runner is not None else TaskRunner(parent=self)
+
+        self._state = GradebookUiState(
+            path="",
+            is_busy=False,
+            status=Status.UNKNOWN,
+            message="Open a Canvas gradebook export to view it.",
+            name_filter="",
+        )
+
+    def get_state(self) -> GradebookUiState:
+        return self._state
+
+    def open_gradebook(self, path: str) -> None:
+        if self._state.is_busy or not path:
+            return
+
+        self._set_state(path=path, is_busy=True, status=Status.WARNING, message="Loading gradebook...")
+        request = LoadScoreMatrixRequest(path=Path(path))
+
+        def run(ctx: TaskContext) -> ScoreMatrix:
+            return self._use_case.execute(request)
+
+        self._tasks.submit(
+            run,
+            name="load_gradebook",
+            on_success=self._on_loaded,
+            on_error=self._on_failed,
+        )
+
+    def set_name_filter(self, text: str) -> None:
+        if text == self._state.name_filter:
+            return
+        self._set_state(name_filter=text)
+
+    def _on_loaded(self, matrix: ScoreMatrix) -> None:
+        rows, columns = matrix.shape
+        self._set_state(
+            is_busy=False,
+            status=Status.NOMINAL,
+            message=f"{rows} students x {columns} assignments",
+        )
+        self.matrix_loaded.emit(matrix)
+
+    def _on_failed(self, exc: Exception) -> None:
+        self._logger.error(f"Gradebook load failed: {exc}")
+        self._set_state(is_busy=False, status=Status.CRITICAL, message=str(exc))
+        self.event_raised.emit(ShowError(str(exc)))
+
+    def _set_state(self, **changes) -> None:
+        self._state = replace(self._state, **changes)
+        self.state_changed.emit(self._state)
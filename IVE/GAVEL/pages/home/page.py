@@ -4,7 +4,6 @@ from PyQt6.QtWidgets import QTabWidget, QVBoxLayout
 
 from GAVEL.app_context import AppContext
 from GAVEL.core.base_page import BasePage
-from GAVEL.core.page_registry import PageRegistry, PageSpec
 from GAVEL.pages.home.tabs import DataEntryTab, OverviewTab
 from GAVEL.pages.home.viewmodel import HomeViewModel
 
@@ -32,15 +31,3 @@ class HomePage(BasePage):
             ("Overview", OverviewTab(self._theme, self._vm)),
             ("Data Entry", DataEntryTab(self._theme, self._vm)),
         ]
-
-
-PageRegistry.get().register(
-    PageSpec(
-        page_id=HomePage.page_id,
-        title=HomePage.title,
-        icon_text="🏠",
-        factory=lambda ctx: HomePage(ctx),
-        order=10,
-        group="General",
-    )
-)
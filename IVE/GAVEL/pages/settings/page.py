@@ -4,7 +4,6 @@ from PyQt6.QtWidgets import QTabWidget, QVBoxLayout
 
 from GAVEL.app_context import AppContext
 from GAVEL.core.base_page import BasePage
-from GAVEL.core.page_registry import PageRegistry, PageSpec
 from GAVEL.pages.settings.tabs import AboutTab, PreferencesTab
 from GAVEL.pages.settings.viewmodel import SettingsViewModel
 
@@ -32,15 +31,3 @@ class SettingsPage(BasePage):
             ("Preferences", PreferencesTab(self._theme, self._vm)),
             ("About", AboutTab(self._theme, self._vm)),
         ]
-
-
-PageRegistry.get().register(
-    PageSpec(
-        page_id=SettingsPage.page_id,
-        title=SettingsPage.title,
-        icon_text="⚙️",
-        factory=lambda ctx: SettingsPage(ctx),
-        order=20,
-        group="General",
-    )
-)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from GAVEL.theme import qss_builder
+from GAVEL.theme.tokens import ThemeTokens, parse_tokens
+
+
+@dataclass(frozen=True)
+class CompiledTheme:
+    tokens: ThemeTokens
+    qss: str
+    token_hash: str
+
+
+# compiled themes by token hash, so switching back to a theme (or saving an
+# unchanged token file) never re-renders it.
+_compiled: Dict[str, CompiledTheme] = {}
+
+
+def theme_hash(token_bytes: bytes) -> str:
+    return hashlib.sha256(token_bytes).hexdigest()[:16]
+
+
+def compile_theme(tokens_path: Path) -> CompiledTheme:
+    """
+    Loads a token file and renders its stylesheet, reusing the result for
+    token files with the same content.
+
+    Only the requested theme is read, so shipping more token files costs
+    nothing at startup.
+    """
+    token_bytes = tokens_path.read_bytes()
+    token_hash = theme_hash(token_bytes)
+    theme = _compiled.get(token_hash)
+    if theme is None:
+        tokens = parse_tokens(json.loads(token_bytes.decode("utf-8")))
+        theme = CompiledTheme(tokens, qss_builder.build_app_qss(tokens), token_hash)
+        _compiled[token_hash] = theme
+    return theme
+
+
+class ThemeWatcher(QObject):
+    """
+    Hot reload: recompiles the theme when its token file changes and hands the
+    new stylesheet to `apply` (normally QApplication.setStyleSheet). Saves that
+    leave the tokens unchanged are skipped, since every apply re-polishes all
+    widgets.
+
+    Only the stylesheet is reloaded. Spacing read from ThemeContext when
+    widgets were built keeps its old values until restart.
+    """
+
+    theme_changed = pyqtSignal(object)  # CompiledTheme
+    reload_failed = pyqtSignal(object)  # Exception
+
+    def __init__(
+        self,
+        tokens_path: Path,
+        apply: Callable[[str], None],
+        current: CompiledTheme,
+        debounce_ms: int = 200,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._path = tokens_path
+        self._apply = apply
+        self._current = current
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self.reload)
+
+        self._watcher = QFileSystemWatcher([str(tokens_path)], self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+
+    @property
+    def current(self) -> CompiledTheme:
+        return self._current
+
+    def reload(self) -> None:
+        if str(self._path) not in self._watcher.files() and self._path.exists():
+            self._watcher.addPath(str(self._path))
+        try:
+            theme = compile_theme(self._path)
+        except (OSError, ValueError, KeyError) as exc:
+            # a half-saved or invalid token file keeps the current theme.
+            self.reload_failed.emit(exc)
+            return
+        if theme.token_hash == self._current.token_hash:
+            return
+        self._current = theme
+        self._apply(theme.qss)
+        self.theme_changed.emit(theme)
+
+    def _on_file_changed(self, path: str) -> None:
+        # editors that save by replacing the file drop it from the watch list.
+        if path not in self._watcher.files() and Path(path).exists():
+            self._watcher.addPath(path)
+        self._debounce.start()
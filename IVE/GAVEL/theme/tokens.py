@@ -42,8 +42,10 @@ _REQUIRED_TYPE_KEYS = ["font_family", "font_size_base", "font_size_h1", "font_si
 
 
 def load_tokens(path: Path) -> ThemeTokens:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    return parse_tokens(json.loads(path.read_text(encoding="utf-8")))
 
+
+def parse_tokens(data: Dict[str, Any]) -> ThemeTokens:
     for block in ["color", "spacing", "shape", "typography"]:
         if block not in data:
             raise KeyError(f"Missing token block: {block}")
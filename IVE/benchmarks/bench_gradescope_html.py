@@ -0,0 +1,84 @@
+"""
+Benchmark: targeted Gradescope HTML extraction vs. full-page BeautifulSoup parsing.
+
+Uses the saved fixtures in tests/data/gradescope, inflated to course-sized pages
+by repeating their table rows, and times the old gs_downloader parsing against
+GAVEL.infra.gradescope.gradescope_html.
+
+    python benchmarks/bench_gradescope_html.py [--rows 4000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from GAVEL.infra.gradescope.gradescope_html import (  # noqa: E402
+    extract_assignment_ids,
+    extract_bulk_export_href,
+    extract_csrf_token,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "data" / "gradescope"
+
+
+def _inflate(html: str, rows: int) -> str:
+    """Repeat every <tr> in the first <tbody> until the table has `rows` rows."""
+    match = re.search(r"<tbody>(.*?)</tbody>", html, flags=re.DOTALL)
+    body = match.group(1)
+    copies = max(1, rows // max(1, body.count("<tr")))
+    return html[: match.start(1)] + body * copies + html[match.end(1):]
+
+
+def legacy_course(html: str) -> list[str]:
+    soup = BeautifulSoup(html, "html.parser")
+    return [e["data-assignment-id"] for e in soup.find_all(attrs={"data-assignment-id": True})]
+
+
+def legacy_review(html: str) -> tuple[str, str]:
+    # old gs_downloader parsed the review page twice when an export was pending
+    soup = BeautifulSoup(html, "html.parser")
+    href = soup.find("a", class_="js-bulkExportModalDownload")["href"]
+    soup = BeautifulSoup(html, "html.parser")
+    csrf = soup.find("meta", attrs={"name": "csrf-token"})["content"]
+    return href, csrf
+
+
+def targeted_review(html: str) -> tuple[str | None, str | None]:
+    return extract_bulk_export_href(html), extract_csrf_token(html)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=4000, help="table rows per inflated page")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args()
+
+    course = _inflate((FIXTURES / "course_assignments.html").read_text(encoding="utf-8"), args.rows)
+    review = _inflate((FIXTURES / "review_grades_pending.html").read_text(encoding="utf-8"), args.rows)
+
+    assert legacy_course(course) == extract_assignment_ids(course)
+    assert legacy_review(review) == targeted_review(review)
+
+    cases = [
+        ("course page", lambda: legacy_course(course), lambda: extract_assignment_ids(course), len(course)),
+        ("review page", lambda: legacy_review(review), lambda: targeted_review(review), len(review)),
+    ]
+
+    print(f"{'page':<12}{'size (KB)':>10}{'legacy (ms)':>14}{'targeted (ms)':>16}{'speedup':>10}")
+    for name, legacy, targeted, size in cases:
+        t_legacy = min(timeit.repeat(legacy, number=1, repeat=args.repeat)) * 1000
+        t_targeted = min(timeit.repeat(targeted, number=1, repeat=args.repeat)) * 1000
+        print(f"{name:<12}{size / 1024:>10.0f}{t_legacy:>14.1f}{t_targeted:>16.1f}{t_legacy / t_targeted:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Benchmark: CanvasRosterCSVReader (csv module) vs. the previous pandas reader.
+
+Writes synthetic section rosters in the MyASU export format and times a cold
+import of each reader in a fresh interpreter, reading one roster, and merging
+all sections with read_many.
+
+    python benchmarks/bench_roster_reader.py [--rows 200] [--sections 40] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# the roster reader imports its DTO and port through the IVE package.
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from IVE.GAVEL.app.dtos.asu_roster import RosterStudent  # noqa: E402
+from IVE.GAVEL.infra.csv.canvas_roster_csv_reader import _COLUMN_MAP, CanvasRosterCSVReader  # noqa: E402
+
+
+def _pandas_read(path: Path) -> list[RosterStudent]:
+    """The reader as it was before: read_csv, rename, one dict per row."""
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=str)
+    df = df.rename(columns=_COLUMN_MAP)
+    df["units"] = df["units"].astype(int)
+    return [RosterStudent(**row) for row in df.to_dict(orient="records")]
+
+
+def _write_section(path: Path, section: int, rows: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(_COLUMN_MAP)
+        for i in range(rows):
+            asurite = f"s{section:03d}x{i:04d}"
+            writer.writerow([
+                f"12{section:03d}{i:05d}", f"{i:04d}-{section:03d}", f"First{i}", f"Last{i}",
+                "ENRL (2025-10-27)", "3", "Standard", "Ira A Fulton Engineering - Software Engineering",
+                "Junior", asurite, "Resident", f"{asurite}@asu.edu",
+            ])
+
+
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def _cold_import_ms(statement: str) -> float:
+    code = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); start = time.perf_counter(); "
+        f"{statement}; print((time.perf_counter() - start) * 1000)"
+    )
+    out = subprocess.run([sys.executable, "-c", code, str(ROOT)], capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200, help="students per section")
+    parser.add_argument("--sections", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per measurement (median kept)")
+    args = parser.parse_args()
+
+    reader = CanvasRosterCSVReader()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"section_{s}.csv" for s in range(args.sections)]
+        for s, path in enumerate(paths):
+            _write_section(path, s, args.rows)
+        assert reader.read(paths[0]) == _pandas_read(paths[0])
+
+        csv_import = _cold_import_ms("import IVE.GAVEL.infra.csv.canvas_roster_csv_reader")
+        pandas_import = _cold_import_ms("import IVE.GAVEL.infra.csv.canvas_roster_csv_reader; import pandas")
+        rows = [
+            ("cold import", csv_import, pandas_import),
+            (
+                f"read one section ({args.rows})",
+                _median_ms(lambda: reader.read(paths[0]), args.repeat),
+                _median_ms(lambda: _pandas_read(paths[0]), args.repeat),
+            ),
+            (
+                f"read_many ({args.sections} sections)",
+                _median_ms(lambda: reader.read_many(paths), args.repeat),
+                _median_ms(lambda: [_pandas_read(p) for p in paths], args.repeat),
+            ),
+        ]
+
+    print(f"{'step':<28} {'csv ms':>10} {'pandas ms':>10}")
+    for step, new_ms, old_ms in rows:
+        print(f"{step:<28} {new_ms:>10.2f} {old_ms:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Benchmark: gradebook table (ScoreTableModel + QTableView) vs. a filled QTableWidget.
+
+Builds a synthetic department-sized score matrix and times loading it, sorting
+and filtering it, and repainting the view while scrolling (against the 16.7 ms
+budget of a 60 fps frame).
+
+    python benchmarks/bench_score_table.py [--rows 1000] [--columns 200] [--frames 120]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QTableView, QTableWidget, QTableWidgetItem  # noqa: E402
+
+from GAVEL.app.dtos.score_matrix import ScoreMatrix  # noqa: E402
+from GAVEL.pages.gradebook.score_table_model import ScoreTableModel  # noqa: E402
+from GAVEL.pages.gradebook.tabs import configure_fast_table  # noqa: E402
+
+
+def _matrix(rows: int, columns: int) -> ScoreMatrix:
+    rng = np.random.default_rng(0)
+    points = rng.choice([5.0, 10.0, 26.0, 30.0], size=columns)
+    scores = np.asfortranarray(np.round(rng.random((rows, columns)) * points, 2))
+    scores[rng.random((rows, columns)) < 0.05] = np.nan
+    return ScoreMatrix(
+        row_labels=tuple(f"Student{i:05d}, Test" for i in range(rows)),
+        row_ids=tuple(f"s{i:05d}" for i in range(rows)),
+        column_labels=tuple(f"Module {j}: Programming" for j in range(columns)),
+        scores=scores,
+        points_possible=points,
+    )
+
+
+def _ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _scroll_frames(app: QApplication, table: QTableView, frames: int) -> list[float]:
+    bar = table.verticalScrollBar()
+    step = max(1, bar.maximum() // frames)
+    times = []
+    for i in range(frames):
+        bar.setValue((i * step) % (bar.maximum() + 1))
+        times.append(_ms(table.viewport().repaint))
+        app.processEvents()
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    matrix = _matrix(args.rows, args.columns)
+
+    model = ScoreTableModel("#FF4D4F", "#56F000")
+    table = QTableView()
+    table.setModel(model)
+    table.setSortingEnabled(True)
+    configure_fast_table(table)
+    table.resize(1200, 800)
+    table.show()
+
+    load_ms = _ms(lambda: (model.set_matrix(matrix), app.processEvents()))
+    sort_ms = _ms(lambda: model.sort(3, Qt.SortOrder.DescendingOrder))
+    filter_ms = _ms(lambda: model.set_name_filter("student004"))
+    model.set_name_filter("")
+    frames = _scroll_frames(app, table, args.frames)
+
+    widget = QTableWidget()
+    widget.resize(1200, 800)
+
+    def fill_widget() -> None:
+        widget.setRowCount(args.rows)
+        widget.setColumnCount(args.columns)
+        for r in range(args.rows):
+            for c in range(args.columns):
+                v = matrix.scores[r, c]
+                widget.setItem(r, c, QTableWidgetItem("" if np.isnan(v) else f"{v:g}"))
+        widget.show()
+        app.processEvents()
+
+    widget_ms = _ms(fill_widget)
+
+    print(f"{args.rows} students x {args.columns} columns")
+    print(f"  model load            {load_ms:9.1f} ms   (QTableWidget fill: {widget_ms:.1f} ms)")
+    print(f"  sort one column       {sort_ms:9.2f} ms")
+    print(f"  filter by name        {filter_ms:9.2f} ms")
+    print(f"  scroll frame (median) {statistics.median(frames):9.2f} ms")
+    print(f"  scroll frame (max)    {max(frames):9.2f} ms   (60 fps budget: 16.7 ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
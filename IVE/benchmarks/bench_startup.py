@@ -0,0 +1,140 @@
+"""
+Benchmark: cold-start time to first paint as pages are added.
+
+Generates synthetic pages (each with a simulated module import cost), adds them
+to a copy of GAVEL/pages/pages.json, and times fresh interpreters from launch to
+the main window's first paint event. "eager" imports every page module before
+the window is built, the way GAVEL.app.main did when pages registered
+themselves on import; "lazy" only reads the manifest.
+
+    python benchmarks/bench_startup.py [--pages 0 10 40] [--import-ms 20] [--repeat 3]
+
+Exits with status 1 if lazy startup grows by more than --max-growth-ms between
+the smallest and largest page counts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MANIFEST = ROOT / "GAVEL" / "pages" / "pages.json"
+
+PAGE_TEMPLATE = '''
+import time
+
+from PyQt6.QtWidgets import QLabel, QVBoxLayout
+
+from GAVEL.core.base_page import BasePage
+
+_deadline = time.perf_counter() + {import_ms} / 1000
+while time.perf_counter() < _deadline:  # stands in for a page's own heavy imports
+    pass
+
+
+class BenchPage(BasePage):
+    def __init__(self, ctx) -> None:
+        super().__init__()
+        QVBoxLayout(self).addWidget(QLabel("bench page {index}"))
+'''
+
+
+def _write_pages(folder: Path, count: int, import_ms: int) -> Path:
+    package = folder / "bench_pages"
+    package.mkdir(parents=True, exist_ok=True)
+    (package / "__init__.py").write_text("")
+
+    manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    for i in range(count):
+        (package / f"page_{i}.py").write_text(PAGE_TEMPLATE.format(import_ms=import_ms, index=i))
+        manifest["pages"].append(
+            {
+                "page_id": f"bench_{i}",
+                "title": f"Bench {i}",
+                "icon_text": "•",
+                "page": f"bench_pages.page_{i}:BenchPage",
+                "order": 1000 + i,
+                "group": "Bench",
+            }
+        )
+
+    path = folder / f"pages_{count}.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+
+def _child(manifest_path: Path, eager: bool) -> None:
+    sys.path[:0] = [str(ROOT), str(manifest_path.parent)]
+
+    from PyQt6.QtCore import QEvent, QObject
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+
+    if eager:
+        for entry in json.loads(manifest_path.read_text(encoding="utf-8"))["pages"]:
+            importlib.import_module(entry["page"].partition(":")[0])
+
+    from GAVEL.app.main import build_main_window
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):  # noqa: N802
+            if event.type() == QEvent.Type.Paint:
+                sys.stdout.flush()
+                os._exit(0)
+            return False
+
+    window = build_main_window(app, manifest_path)
+    paint_filter = FirstPaint()
+    window.installEventFilter(paint_filter)
+    window.show()
+    app.exec()
+
+
+def _time_start(manifest_path: Path, eager: bool) -> float:
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    args = [sys.executable, __file__, "--child", str(manifest_path)] + (["--eager"] if eager else [])
+    start = time.perf_counter()
+    subprocess.run(args, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[0, 10, 40], help="synthetic page counts")
+    parser.add_argument("--import-ms", type=int, default=20, help="simulated import cost per page")
+    parser.add_argument("--repeat", type=int, default=3, help="launches per configuration (median kept)")
+    parser.add_argument("--max-growth-ms", type=float, default=100.0, help="allowed lazy startup growth")
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--eager", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.eager)
+        return 0
+
+    lazy = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'pages':>6} {'eager ms':>10} {'lazy ms':>10}")
+        for count in args.pages:
+            manifest_path = _write_pages(Path(tmp), count, args.import_ms)
+            eager_s = statistics.median(_time_start(manifest_path, True) for _ in range(args.repeat))
+            lazy[count] = statistics.median(_time_start(manifest_path, False) for _ in range(args.repeat))
+            print(f"{count:>6} {eager_s * 1000:>10.0f} {lazy[count] * 1000:>10.0f}")
+
+    growth_ms = (lazy[max(args.pages)] - lazy[min(args.pages)]) * 1000
+    print(f"lazy startup growth: {growth_ms:.0f} ms (limit {args.max_growth_ms:.0f} ms)")
+    return 1 if growth_ms > args.max_growth_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
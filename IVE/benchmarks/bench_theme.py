@@ -0,0 +1,104 @@
+"""
+Benchmark: where theme startup time goes.
+
+Times rendering the stylesheet (load_tokens + build_app_qss), the hash-keyed
+GAVEL.theme.qss_cache.compile_theme, and Qt applying the stylesheet and
+polishing a small widget tree. The run is repeated with extra token files
+next to the theme, to show that installed themes are never read at startup.
+
+    python benchmarks/bench_theme.py [--repeat 200] [--themes 0 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import (  # noqa: E402
+    QApplication,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from GAVEL.theme.qss_builder import build_app_qss  # noqa: E402
+from GAVEL.theme.qss_cache import compile_theme  # noqa: E402
+from GAVEL.theme.tokens import load_tokens  # noqa: E402
+
+TOKENS = Path(__file__).resolve().parents[1] / "GAVEL" / "theme" / "tokens_dark.json"
+
+
+def _widget_tree() -> QWidget:
+    root = QTabWidget()
+    for t in range(4):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        for i in range(20):
+            layout.addWidget(QLabel(f"label {i}"))
+            layout.addWidget(QLineEdit())
+            layout.addWidget(QPushButton(f"button {i}"))
+        root.addTab(page, f"tab {t}")
+    return root
+
+
+def _polish(app: QApplication, tree: QWidget, qss: str) -> None:
+    app.setStyleSheet(qss)
+    for widget in tree.findChildren(QWidget):
+        widget.ensurePolished()
+
+
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200, help="timed runs per measurement (median kept)")
+    parser.add_argument("--themes", type=int, nargs="+", default=[0, 20], help="extra token files installed")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    tree = _widget_tree()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        theme_dir = Path(tmp) / "theme"
+        theme_dir.mkdir()
+        tokens_path = theme_dir / TOKENS.name
+        tokens_path.write_bytes(TOKENS.read_bytes())
+        print(f"{'themes':>6} {'step':<22} {'ms':>10}")
+        for count in args.themes:
+            base = json.loads(TOKENS.read_text(encoding="utf-8"))
+            for i in range(count):
+                base["color"]["bg"] = f"#{i:06x}"
+                (theme_dir / f"tokens_extra_{i}.json").write_text(json.dumps(base), encoding="utf-8")
+
+            qss = compile_theme(tokens_path).qss
+            rows = [
+                ("render", _median_ms(lambda: build_app_qss(load_tokens(tokens_path)), args.repeat)),
+                ("compile_theme", _median_ms(lambda: compile_theme(tokens_path), args.repeat)),
+                ("apply + polish", _median_ms(lambda qss=qss: _polish(app, tree, qss), args.repeat)),
+            ]
+            for step, ms in rows:
+                print(f"{count:>6} {step:<22} {ms:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
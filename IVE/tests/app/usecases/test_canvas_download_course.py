@@ -0,0 +1,107 @@
+"""Tests for DownloadCourseDataUseCase and its course data cache (app/usecases)."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from IVE.GAVEL.app.dtos.canvas_course import CanvasCourse, CanvasCourseData, CanvasModule
+from IVE.GAVEL.app.usecases.canvas_download_course import (
+    DownloadCourseDataRequest,
+    DownloadCourseDataUseCase,
+)
+from IVE.GAVEL.app.usecases.course_data_cache import CourseDataCache
+
+
+class FakeCanvasClient:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: list[int] = []
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def fetch_course_data(self, course_id: int) -> CanvasCourseData:
+        with self._lock:
+            self.calls.append(course_id)
+        time.sleep(self._delay)
+        return CanvasCourseData(
+            course=CanvasCourse(id=course_id, name=f"Course {course_id}"),
+            modules=[CanvasModule(id=1, name="Module 1")],
+        )
+
+
+def test_download_after_prefetch_does_not_refetch(tmp_path: Path) -> None:
+    client = FakeCanvasClient()
+    use_case = DownloadCourseDataUseCase(client, CourseDataCache())
+
+    assert use_case.prefetch(42).course.name == "Course 42"
+    result = use_case.execute(DownloadCourseDataRequest(course_id=42, output_dir=tmp_path))
+
+    assert client.calls == [42]
+    assert json.loads(result.saved_path.read_text())["course"]["name"] == "Course 42"
+
+
+def test_without_cache_every_call_fetches(tmp_path: Path) -> None:
+    client = FakeCanvasClient()
+    use_case = DownloadCourseDataUseCase(client)
+    use_case.prefetch(7)
+    use_case.execute(DownloadCourseDataRequest(course_id=7, output_dir=tmp_path))
+    assert client.calls == [7, 7]
+
+
+def test_prefetch_rejects_invalid_course_id() -> None:
+    with pytest.raises(ValueError):
+        DownloadCourseDataUseCase(FakeCanvasClient(), CourseDataCache()).prefetch(0)
+
+
+def test_concurrent_loads_share_one_request() -> None:
+    client = FakeCanvasClient(delay=0.05)
+    cache = CourseDataCache()
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load(5, client.fetch_course_data)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert client.calls == [5]
+    assert len(results) == 4 and all(r is results[0] for r in results)
+
+
+def test_failed_load_is_not_cached() -> None:
+    cache = CourseDataCache()
+
+    def fail(course_id: int) -> CanvasCourseData:
+        raise RuntimeError("Canvas unavailable")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load(3, fail)
+    assert cache.get(3) is None
+    assert cache.get_or_load(3, FakeCanvasClient().fetch_course_data).course.id == 3
+
+
+def test_least_recently_used_course_is_evicted() -> None:
+    client = FakeCanvasClient()
+    cache = CourseDataCache(capacity=2)
+    cache.get_or_load(1, client.fetch_course_data)
+    cache.get_or_load(2, client.fetch_course_data)
+    cache.get(1)  # 1 is now the most recently used
+    cache.get_or_load(3, client.fetch_course_data)
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None and cache.get(3) is not None
+
+
+def test_expired_entries_are_fetched_again() -> None:
+    client = FakeCanvasClient()
+    cache = CourseDataCache(max_age_seconds=0.0)
+    cache.get_or_load(9, client.fetch_course_data)
+    time.sleep(0.01)
+    cache.get_or_load(9, client.fetch_course_data)
+    assert client.calls == [9, 9]
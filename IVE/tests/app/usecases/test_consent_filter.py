@@ -0,0 +1,128 @@
+"""Tests for the consent-filtered research dataset pipeline (app/usecases)."""
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from IVE.GAVEL.app.dtos.canvas_consent_form_entry import ConsentFormEntry
+from IVE.GAVEL.app.dtos.score_matrix import ScoreMatrix
+from IVE.GAVEL.app.usecases.consent_filter import (
+    BuildResearchDatasetRequest,
+    BuildResearchDatasetUseCase,
+    ConsentIndex,
+    build_research_dataset,
+    filter_score_matrix,
+    latest_attempts,
+)
+from IVE.GAVEL.infra.csv.canvas_consent_form_csv_reader import CanvasConsentFormCSVReader
+from IVE.GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+from IVE.GAVEL.infra.csv.canvas_roster_csv_reader import CanvasRosterCSVReader
+
+
+@pytest.fixture(scope="module")
+def entries(consent_form_csv_path: Path):
+    return list(CanvasConsentFormCSVReader().read(str(consent_form_csv_path)))
+
+
+@pytest.fixture(scope="module")
+def gradebook(gradebook_csv_path: Path):
+    return LegacyGradebookCSVReader().parse(gradebook_csv_path)
+
+
+@pytest.fixture(scope="module")
+def roster(roster_csv_path: Path):
+    # the sample roster and gradebook are different classes, so link two students by hand.
+    students = CanvasRosterCSVReader().read(roster_csv_path)
+    return [replace(students[0], asurite="brbourqu"), replace(students[1], asurite="cvonwein")] + students[2:]
+
+
+def test_latest_attempt_wins(entries) -> None:
+    latest = {e.sis_id: e for e in latest_attempts(entries)}
+    assert len(latest) == 10
+    assert latest[600005].attempt == 2 and latest[600005].consented is False  # withdrew
+    assert latest[600006].attempt == 2 and latest[600006].consented is True   # changed their mind
+
+
+def test_latest_attempt_does_not_depend_on_row_order() -> None:
+    shuffled = [
+        ConsentFormEntry(sis_id=2, lms_name="b", attempt=3, name_response="", consented=False),
+        ConsentFormEntry(sis_id=1, lms_name="a", attempt=1, name_response="", consented=True),
+        ConsentFormEntry(sis_id=2, lms_name="b", attempt=1, name_response="b", consented=True),
+        ConsentFormEntry(sis_id=2, lms_name="b", attempt=2, name_response="b", consented=True),
+    ]
+    assert [(e.sis_id, e.attempt) for e in latest_attempts(shuffled)] == [(1, 1), (2, 3)]
+    assert latest_attempts([]) == []
+
+
+def test_consent_index(entries) -> None:
+    index = ConsentIndex.from_entries(entries)
+    assert index.sis_ids == {309780, 494030, 771671, 600004, 600006, 1521801}
+    assert 600005 not in index
+
+
+def test_dataset_keeps_only_consenting_students(entries, gradebook) -> None:
+    dataset = build_research_dataset(entries, gradebook)
+
+    # the three gradebook students consented; the test student is not a gradebook row.
+    assert dataset.pseudonyms == {"brbourqu": "P001", "lcrain": "P002", "cvonwein": "P003"}
+    assert [r.student_name for r in dataset.gradebook.rows] == ["P001", "P002", "P003"]
+    assert dataset.scores.row_ids == ("P001", "P002", "P003")
+    assert dataset.scores.scores[0, 0] == pytest.approx(8.45)
+
+
+def test_withdrawn_student_is_dropped(entries, gradebook) -> None:
+    withdrawn = entries + [
+        ConsentFormEntry(sis_id=494030, lms_name="Crain, Lindy", attempt=2, name_response="", consented=False)
+    ]
+    dataset = build_research_dataset(withdrawn, gradebook)
+    assert list(dataset.pseudonyms) == ["brbourqu", "cvonwein"]
+    assert dataset.scores.shape[0] == 2
+
+
+def test_roster_is_joined_and_deidentified(entries, gradebook, roster) -> None:
+    dataset = build_research_dataset(entries, gradebook, roster=roster)
+
+    assert [s.asurite for s in dataset.roster] == ["P001", "P003"]
+    first = dataset.roster[0]
+    assert (first.id, first.first_name, first.last_name, first.zoom_email) == ("P001", "", "", "")
+    assert first.program_and_plan == roster[0].program_and_plan
+
+
+def test_evaluation_matrix_is_filtered_in_pseudonym_order(entries, gradebook) -> None:
+    evaluation = ScoreMatrix(
+        row_labels=("Vonweinstein, Carli", "Someone, Else", "Bourque, Bailey"),
+        row_ids=("cvonwein", "someone", "brbourqu"),
+        column_labels=("Q1",),
+        scores=np.asfortranarray([[3.0], [9.0], [1.0]]),
+        points_possible=np.array([10.0]),
+    )
+    (filtered,) = build_research_dataset(entries, gradebook, evaluations=[evaluation]).evaluations
+
+    assert filtered.row_ids == ("P001", "P003")
+    assert filtered.scores[:, 0].tolist() == [1.0, 3.0]
+    assert filtered.scores.flags.f_contiguous
+
+
+def test_filter_score_matrix_with_no_matches() -> None:
+    matrix = ScoreMatrix(("a",), ("a",), ("Q1",), np.asfortranarray([[1.0]]), np.array([1.0]))
+    assert filter_score_matrix(matrix, ["zzz"], ["P001"]).shape == (0, 1)
+
+
+def test_use_case_reads_the_exports(consent_form_csv_path, gradebook_csv_path, roster_csv_path) -> None:
+    use_case = BuildResearchDatasetUseCase(
+        CanvasConsentFormCSVReader(), LegacyGradebookCSVReader(), CanvasRosterCSVReader()
+    )
+    dataset = use_case.execute(
+        BuildResearchDatasetRequest(consent_form_csv_path, gradebook_csv_path, roster_csv_path)
+    )
+    assert dataset.scores.row_ids == ("P001", "P002", "P003")
+    assert dataset.roster == ()  # nobody in the sample roster is in the sample gradebook
+
+
+def test_use_case_missing_export_raises(consent_form_csv_path, tmp_path: Path) -> None:
+    use_case = BuildResearchDatasetUseCase(CanvasConsentFormCSVReader(), LegacyGradebookCSVReader())
+    with pytest.raises(FileNotFoundError):
+        use_case.execute(BuildResearchDatasetRequest(consent_form_csv_path, tmp_path / "missing.csv"))
@@ -0,0 +1,103 @@
+"""Tests for gradebook snapshot diffing (app/usecases)."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from IVE.GAVEL.app.usecases.gradebook_snapshots import (
+    DiffGradebookSnapshotsRequest,
+    DiffGradebookSnapshotsUseCase,
+    SnapshotGradebookRequest,
+    SnapshotGradebookUseCase,
+    changed_rows,
+    diff_gradebooks,
+)
+from IVE.GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+from IVE.GAVEL.infra.snapshots.gzip_gradebook_snapshot_store import GzipGradebookSnapshotStore
+
+BAILEY, LINDY, CARLI = 309780, 494030, 771671
+CAIRN_M3 = 7216975
+
+
+def edited(csv_text: str) -> str:
+    """The sample export after a regrade, a dropped student and an added one."""
+    lines = csv_text.splitlines()
+    bailey = next(i for i, line in enumerate(lines) if line.startswith('"Bourque'))
+    # Module 3: Cairn 0.50 -> 4.00, and the blank Module 4: ADJ Problem Set is graded.
+    lines[bailey] = lines[bailey].replace(",0.50,1.25,,26.00,", ",4.00,1.25,27.00,26.00,", 1)
+    lines = [line for line in lines if not line.startswith('"Crain')]
+    lines.append(lines[bailey].replace('"Bourque, Bailey",309780,brbourqu', '"New, Student",123456,nstudent', 1))
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture(scope="module")
+def csv_text(gradebook_csv_path: Path) -> str:
+    return gradebook_csv_path.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def reader() -> LegacyGradebookCSVReader:
+    return LegacyGradebookCSVReader()
+
+
+class FakeCanvasClient:
+    def __init__(self, pulls: list[bytes]) -> None:
+        self._pulls = iter(pulls)
+
+    def fetch_gradebook_csv(self, course_id: int) -> bytes:
+        return next(self._pulls)
+
+
+def test_diff_finds_changed_added_and_removed(csv_text: str, reader: LegacyGradebookCSVReader) -> None:
+    old = reader.parse_bytes(csv_text.encode())
+    diff = diff_gradebooks(old, reader.parse_bytes(edited(csv_text).encode()))
+
+    assert diff.added_students == (123456,)
+    assert diff.removed_students == (LINDY,)
+    assert diff.added_assignments == diff.removed_assignments == ()
+    assert [(c.canvas_id, c.assignment_id, c.old_score, c.new_score) for c in diff.changes] == [
+        (BAILEY, CAIRN_M3, 0.5, 4.0),
+        (BAILEY, 7216983, None, 27.0),
+    ]
+    assert diff.changed_students == (BAILEY,)
+
+
+def test_unchanged_gradebook_has_empty_diff(csv_text: str, reader: LegacyGradebookCSVReader) -> None:
+    gradebook = reader.parse_bytes(csv_text.encode())
+    assert diff_gradebooks(gradebook, gradebook).is_empty
+
+
+def test_changed_rows_are_only_changed_and_new_students(csv_text: str, reader: LegacyGradebookCSVReader) -> None:
+    new = reader.parse_bytes(edited(csv_text).encode())
+    diff = diff_gradebooks(reader.parse_bytes(csv_text.encode()), new)
+    assert [r.canvas_id for r in changed_rows(new, diff).rows] == [BAILEY, 123456]
+
+
+def test_snapshot_use_case_diffs_against_previous_pull(csv_text: str, reader, tmp_path: Path) -> None:
+    store = GzipGradebookSnapshotStore(tmp_path)
+    client = FakeCanvasClient([csv_text.encode(), csv_text.encode(), edited(csv_text).encode()])
+    use_case = SnapshotGradebookUseCase(client, store, reader)
+    request = SnapshotGradebookRequest(course_id=42)
+
+    first = use_case.execute(request)
+    assert first.previous is None and first.diff is None
+
+    same = use_case.execute(request)
+    assert same.snapshot == first.snapshot and same.diff.is_empty
+
+    third = use_case.execute(request)
+    assert third.previous == first.snapshot
+    assert third.diff.changed_students == (BAILEY,)
+    assert len(store.list_snapshots(42)) == 2
+
+    diff = DiffGradebookSnapshotsUseCase(store, reader).execute(
+        DiffGradebookSnapshotsRequest(42, first.snapshot.snapshot_id, third.snapshot.snapshot_id)
+    )
+    assert diff == third.diff
+
+
+def test_snapshot_rejects_invalid_course_id(reader, tmp_path: Path) -> None:
+    use_case = SnapshotGradebookUseCase(FakeCanvasClient([]), GzipGradebookSnapshotStore(tmp_path), reader)
+    with pytest.raises(ValueError):
+        use_case.execute(SnapshotGradebookRequest(course_id=0))
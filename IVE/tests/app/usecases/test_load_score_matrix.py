@@ -0,0 +1,41 @@
+"""Tests for LoadScoreMatrixUseCase (app/usecases)."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from IVE.GAVEL.app.usecases.load_score_matrix import LoadScoreMatrixRequest, LoadScoreMatrixUseCase
+from IVE.GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+
+
+@pytest.fixture(scope="module")
+def matrix(gradebook_csv_path: Path):
+    use_case = LoadScoreMatrixUseCase(LegacyGradebookCSVReader())
+    return use_case.execute(LoadScoreMatrixRequest(path=gradebook_csv_path))
+
+
+def test_shape_matches_gradebook(matrix) -> None:
+    assert matrix.shape == (3, 6)
+    assert matrix.row_labels == ("Bourque, Bailey", "Crain, Lindy", "Vonweinstein, Carli")
+    assert matrix.row_ids == ("brbourqu", "lcrain", "cvonwein")
+
+
+def test_scores_are_columnar_with_nan_for_blanks(matrix) -> None:
+    assert matrix.scores.dtype == np.float64
+    assert matrix.scores.flags.f_contiguous
+    assert matrix.scores[0, 0] == pytest.approx(8.45)
+    assert np.isnan(matrix.scores[0, 4])  # blank cell
+    assert np.isnan(matrix.scores[1]).all()
+
+
+def test_points_possible_and_labels(matrix) -> None:
+    assert matrix.points_possible.tolist() == [10.0, 10.0, 5.0, 3.0, 30.0, 26.0]
+    assert matrix.column_labels[2] == "Module 3: Cairn"
+
+
+def test_missing_file_raises(tmp_path: Path) -> None:
+    use_case = LoadScoreMatrixUseCase(LegacyGradebookCSVReader())
+    with pytest.raises(FileNotFoundError):
+        use_case.execute(LoadScoreMatrixRequest(path=tmp_path / "missing.csv"))
@@ -0,0 +1,70 @@
+"""Tests for manifest-based page registration (core/page_registry)."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from IVE.GAVEL.core.page_registry import PageRegistry, lazy_page_factory
+
+MANIFEST = Path(__file__).resolve().parents[2] / "GAVEL" / "pages" / "pages.json"
+
+
+@pytest.fixture
+def fake_page_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    (tmp_path / "fake_gavel_page.py").write_text(
+        "class FakePage:\n"
+        "    def __init__(self, ctx):\n"
+        "        self.ctx = ctx\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "fake_gavel_page"
+    sys.modules.pop("fake_gavel_page", None)
+
+
+def write_manifest(path: Path, pages: list) -> Path:
+    path.write_text(json.dumps({"pages": pages}), encoding="utf-8")
+    return path
+
+
+def test_manifest_pages_are_imported_on_first_use(tmp_path: Path, fake_page_module: str) -> None:
+    manifest = write_manifest(
+        tmp_path / "pages.json",
+        [{"page_id": "fake", "title": "Fake", "icon_text": "F", "page": f"{fake_page_module}:FakePage", "order": 5}],
+    )
+    registry = PageRegistry()
+    registry.load_manifest(manifest)
+
+    spec = registry.get_page("fake")
+    assert (spec.title, spec.icon_text, spec.order, spec.group) == ("Fake", "F", 5, "General")
+    assert fake_page_module not in sys.modules
+
+    page = spec.factory("ctx")
+    assert fake_page_module in sys.modules
+    assert page.ctx == "ctx"
+
+
+def test_manifest_entry_missing_keys_raises(tmp_path: Path) -> None:
+    manifest = write_manifest(tmp_path / "pages.json", [{"page_id": "fake", "title": "Fake"}])
+    with pytest.raises(ValueError, match="icon_text, page"):
+        PageRegistry().load_manifest(manifest)
+
+
+def test_duplicate_manifest_page_raises(tmp_path: Path) -> None:
+    entry = {"page_id": "fake", "title": "Fake", "icon_text": "F", "page": "x.y:Z"}
+    manifest = write_manifest(tmp_path / "pages.json", [entry, entry])
+    with pytest.raises(ValueError, match="Duplicate page_id"):
+        PageRegistry().load_manifest(manifest)
+
+
+def test_page_target_must_name_a_class() -> None:
+    with pytest.raises(ValueError):
+        lazy_page_factory("GAVEL.pages.home.page")
+
+
+def test_shipped_manifest_lists_the_app_pages() -> None:
+    registry = PageRegistry()
+    registry.load_manifest(MANIFEST)
+    assert [p.page_id for p in registry.list_pages()] == ["home", "settings", "gradebook", "canvas_course"]
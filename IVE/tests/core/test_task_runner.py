@@ -0,0 +1,146 @@
+"""Tests for the background task runner used by view models (core/task_runner)."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication  # noqa: E402
+
+from IVE.GAVEL.core.task_runner import TaskProgress, TaskRunner  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    yield app
+
+
+def drain(runner: TaskRunner, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while runner.active_count and time.monotonic() < deadline:
+        runner.wait_for_done(50)
+        QCoreApplication.processEvents()
+
+
+def test_success_is_delivered_on_the_calling_thread(qapp) -> None:
+    runner = TaskRunner()
+    seen = {}
+
+    def work(ctx):
+        seen["worker"] = threading.get_ident()
+        return 42
+
+    def done(result):
+        seen["result"] = result
+        seen["receiver"] = threading.get_ident()
+
+    runner.submit(work, on_success=done)
+    drain(runner)
+
+    assert seen["result"] == 42
+    assert seen["receiver"] == threading.get_ident()
+    assert seen["worker"] != threading.get_ident()
+
+
+def test_errors_are_reported(qapp) -> None:
+    runner = TaskRunner()
+    errors = []
+
+    def work(ctx):
+        raise ValueError("boom")
+
+    runner.submit(work, on_error=errors.append)
+    drain(runner)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+
+
+def test_progress_and_cooperative_cancel(qapp) -> None:
+    runner = TaskRunner()
+    started = threading.Event()
+    progress = []
+    outcome = []
+
+    def work(ctx):
+        for i in range(1000):
+            ctx.check_cancelled()
+            ctx.report_progress(i, 1000)
+            started.set()
+            time.sleep(0.001)
+        return "finished"
+
+    handle = runner.submit(
+        work,
+        on_success=outcome.append,
+        on_cancelled=lambda: outcome.append("cancelled"),
+        on_progress=progress.append,
+    )
+    assert started.wait(5)
+    handle.cancel()
+    drain(runner)
+
+    assert outcome == ["cancelled"]
+    assert progress and isinstance(progress[0], TaskProgress)
+    assert progress[-1].done < 999
+
+
+def test_result_after_cancel_is_discarded(qapp) -> None:
+    runner = TaskRunner()
+    release = threading.Event()
+    outcome = []
+
+    def work(ctx):
+        release.wait(5)  # e.g. a blocking request that ignores cancellation.
+        return "late"
+
+    handle = runner.submit(work, on_success=outcome.append, on_cancelled=lambda: outcome.append("cancelled"))
+    handle.cancel()
+    release.set()
+    drain(runner)
+
+    assert outcome == ["cancelled"]
+
+
+def test_max_concurrent_limits_parallel_tasks(qapp) -> None:
+    runner = TaskRunner(max_concurrent=2)
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def work(ctx):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+
+    for _ in range(6):
+        runner.submit(work)
+    assert runner.active_count == 6
+    drain(runner)
+
+    assert peak[0] == 2
+    assert runner.active_count == 0
+
+
+def test_queued_tasks_do_not_start_after_shutdown(qapp) -> None:
+    runner = TaskRunner(max_concurrent=1)
+    release = threading.Event()
+    ran = []
+
+    runner.submit(lambda ctx: release.wait(5))
+    for i in range(3):
+        runner.submit(lambda ctx, i=i: ran.append(i))
+    runner.cancel_all()
+    release.set()
+    assert runner.shutdown()
+    drain(runner)
+
+    assert ran == []
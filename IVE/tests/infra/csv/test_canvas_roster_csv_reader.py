@@ -70,3 +70,35 @@ class TestCanvasRosterCSVReader:
         levels = {s.academic_level for s in students}
         expected = {"Sophomore", "Junior", "Senior", "Graduate"}
         assert levels >= expected
+
+    def test_students_are_slotted(
+        self, students: list[RosterStudent]
+    ) -> None:
+        assert not hasattr(students[0], "__dict__")
+
+
+class TestReadMany:
+    def test_merges_sections_without_duplicates(
+        self, reader: CanvasRosterCSVReader, roster_csv_path: Path, tmp_path: Path
+    ) -> None:
+        lines = roster_csv_path.read_text(encoding="utf-8").splitlines()
+        # second section: the header, one student already seen and one new one.
+        other = tmp_path / "section_b.csv"
+        other.write_text(
+            "\n".join([lines[0], lines[1], lines[1].replace("1261966959", "1200000001")]) + "\n",
+            encoding="utf-8",
+        )
+
+        merged = reader.read_many([roster_csv_path, other])
+
+        assert len(merged) == EXPECTED_ROW_COUNT + 1
+        assert merged[-1].id == "1200000001"
+        assert len({s.id for s in merged}) == len(merged)
+
+    def test_missing_column_raises(
+        self, reader: CanvasRosterCSVReader, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "bad.csv"
+        path.write_text('"ID","First Name"\n"1","A"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="Posting ID"):
+            reader.read(path)
@@ -0,0 +1,68 @@
+"""Tests for the targeted Gradescope HTML extractors (infra/gradescope)."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from IVE.GAVEL.infra.gradescope.gradescope_html import (
+    extract_assignment_ids,
+    extract_bulk_export_href,
+    extract_csrf_token,
+)
+
+
+@pytest.fixture(scope="module")
+def gradescope_dir(data_dir: Path) -> Path:
+    return data_dir / "gradescope"
+
+
+@pytest.fixture(scope="module")
+def course_html(gradescope_dir: Path) -> str:
+    return (gradescope_dir / "course_assignments.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def ready_html(gradescope_dir: Path) -> str:
+    return (gradescope_dir / "review_grades_ready.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def pending_html(gradescope_dir: Path) -> str:
+    return (gradescope_dir / "review_grades_pending.html").read_text(encoding="utf-8")
+
+
+class TestExtractAssignmentIds:
+
+    def test_returns_ids_in_document_order(self, course_html: str) -> None:
+        assert extract_assignment_ids(course_html) == ["1100001", "1100002", "1100003"]
+
+    def test_returns_empty_list_without_marker(self, ready_html: str) -> None:
+        assert extract_assignment_ids(ready_html) == []
+
+
+class TestExtractBulkExportHref:
+
+    def test_returns_zip_link_when_export_ready(self, ready_html: str) -> None:
+        assert extract_bulk_export_href(ready_html) == (
+            "/courses/253450/generated_files/987654.zip"
+        )
+
+    def test_returns_placeholder_href_when_export_pending(self, pending_html: str) -> None:
+        assert extract_bulk_export_href(pending_html) == "#"
+
+    def test_returns_none_without_link(self, course_html: str) -> None:
+        assert extract_bulk_export_href(course_html) is None
+
+
+class TestExtractCsrfToken:
+
+    def test_reads_token_from_head(self, pending_html: str) -> None:
+        assert extract_csrf_token(pending_html) == "review-page-token=="
+
+    def test_falls_back_to_body_when_meta_not_in_head(self) -> None:
+        html = '<html><head></head><body><meta name="csrf-token" content="abc"></body></html>'
+        assert extract_csrf_token(html) == "abc"
+
+    def test_returns_none_without_meta(self) -> None:
+        assert extract_csrf_token("<html><head></head><body></body></html>") is None
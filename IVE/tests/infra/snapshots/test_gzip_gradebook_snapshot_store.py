@@ -0,0 +1,49 @@
+"""Tests for GzipGradebookSnapshotStore (infra/snapshots adapter)."""
+from __future__ import annotations
+
+import gzip
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from IVE.GAVEL.infra.snapshots.gzip_gradebook_snapshot_store import GzipGradebookSnapshotStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> GzipGradebookSnapshotStore:
+    start = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+    ticks = iter(start + timedelta(minutes=i) for i in range(100))
+    return GzipGradebookSnapshotStore(tmp_path / "snapshots", clock=lambda: next(ticks))
+
+
+def test_save_and_load_round_trip(store: GzipGradebookSnapshotStore, gradebook_csv_path: Path) -> None:
+    data = gradebook_csv_path.read_bytes()
+    snapshot = store.save(42, data)
+
+    assert store.load(42, snapshot.snapshot_id) == data
+    assert snapshot.taken_at == datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+    assert store.list_snapshots(42) == [snapshot]
+
+
+def test_snapshots_are_compressed(store: GzipGradebookSnapshotStore, tmp_path: Path, gradebook_csv_path: Path) -> None:
+    snapshot = store.save(42, gradebook_csv_path.read_bytes() * 50)
+    path = tmp_path / "snapshots" / "42" / f"{snapshot.snapshot_id}.csv.gz"
+    assert path.stat().st_size < len(gzip.decompress(path.read_bytes())) / 10
+
+
+def test_identical_pull_is_not_stored_twice(store: GzipGradebookSnapshotStore) -> None:
+    first = store.save(42, b"a,b\n1,2\n")
+    assert store.save(42, b"a,b\n1,2\n") == first
+    second = store.save(42, b"a,b\n1,3\n")
+    assert [s.snapshot_id for s in store.list_snapshots(42)] == [first.snapshot_id, second.snapshot_id]
+
+
+def test_courses_are_kept_apart(store: GzipGradebookSnapshotStore) -> None:
+    store.save(1, b"x")
+    assert store.list_snapshots(2) == []
+
+
+def test_unknown_snapshot_raises(store: GzipGradebookSnapshotStore) -> None:
+    with pytest.raises(KeyError):
+        store.load(42, "20260101T000000000000Z_0000")
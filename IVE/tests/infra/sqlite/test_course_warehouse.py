@@ -0,0 +1,104 @@
+"""Tests for CourseWarehouse (infra/sqlite adapter)."""
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from IVE.GAVEL.app.dtos.canvas_course import CanvasCourse, CanvasCourseData, CanvasModule
+from IVE.GAVEL.infra.csv.canvas_consent_form_csv_reader import CanvasConsentFormCSVReader
+from IVE.GAVEL.infra.csv.canvas_gradebook_csv_reader import LegacyGradebookCSVReader
+from IVE.GAVEL.infra.csv.canvas_roster_csv_reader import CanvasRosterCSVReader
+from IVE.GAVEL.infra.sqlite.course_warehouse import CourseWarehouse
+from IVE.GAVEL.infra.yaml.yaml_gradescope_reader import YamlGradescopeReader
+
+COURSE_ID = 12345
+
+
+@pytest.fixture
+def warehouse(
+    tmp_path: Path, roster_csv_path: Path, gradebook_csv_path: Path, consent_form_csv_path: Path, data_dir: Path
+) -> CourseWarehouse:
+    # the sample roster is a different class, so give its first student Bailey's ASURITE and ASU ID.
+    roster = CanvasRosterCSVReader().read(roster_csv_path)
+    roster[0] = replace(roster[0], asurite="brbourqu", id="1217482318")
+
+    wh = CourseWarehouse(tmp_path / "warehouse" / "gavel.db")
+    wh.ingest_course(
+        CanvasCourseData(CanvasCourse(COURSE_ID, "SER 222", "SER222"), [CanvasModule(1, "Module 3")]),
+        semester="2026Spring",
+    )
+    wh.ingest_roster(COURSE_ID, "12345", roster)
+    wh.ingest_gradebook(COURSE_ID, LegacyGradebookCSVReader().parse(gradebook_csv_path))
+    wh.ingest_gradescope(COURSE_ID, "HW02", YamlGradescopeReader().read(data_dir / "submission_metadata.yml"))
+    wh.ingest_evaluations(
+        COURSE_ID, "m2", {"brbourqu": {"tests": [{"number": 1.1, "name": "t", "score": 2.0, "max_score": 2.0}]}}
+    )
+    wh.ingest_consent(COURSE_ID, CanvasConsentFormCSVReader().read(str(consent_form_csv_path)))
+    yield wh
+    wh.close()
+
+
+def test_course_and_modules(warehouse: CourseWarehouse) -> None:
+    (course,) = warehouse.query("SELECT name, course_code, semester FROM courses")
+    assert tuple(course) == ("SER 222", "SER222", "2026Spring")
+    assert warehouse.query("SELECT name FROM modules")[0]["name"] == "Module 3"
+
+
+def test_students_are_merged_across_sources(warehouse: CourseWarehouse) -> None:
+    (bailey,) = warehouse.query("SELECT * FROM students WHERE key = 'brbourqu'")
+    assert bailey["asu_id"] == "1217482318"   # roster
+    assert bailey["canvas_id"] == 309780      # gradebook
+    assert bailey["academic_level"] == "Senior"
+
+    sources = warehouse.query(
+        "SELECT DISTINCT a.source FROM scores s JOIN assignments a ON a.id = s.assignment_id "
+        "JOIN students st ON st.id = s.student_id WHERE st.key = 'brbourqu' ORDER BY a.source"
+    )
+    assert [r["source"] for r in sources] == ["canvas", "gradescope", "shoggoth"]
+
+
+def test_gradescope_submitter_without_roster_entry_is_keyed_by_email(warehouse: CourseWarehouse) -> None:
+    (lindy,) = warehouse.query("SELECT asu_id, canvas_id FROM students WHERE key = 'lcrain'")
+    assert tuple(lindy) == ("1219749063", 494030)
+
+
+def test_gradebook_scores_and_enrollments(warehouse: CourseWarehouse) -> None:
+    (row,) = warehouse.query(
+        "SELECT s.score, a.points_possible FROM scores s JOIN assignments a ON a.id = s.assignment_id "
+        "JOIN students st ON st.id = s.student_id WHERE st.key = 'brbourqu' AND a.name = 'Module 3: Cairn'"
+    )
+    assert tuple(row) == (0.5, 5.0)
+    sections = warehouse.query("SELECT name FROM sections ORDER BY name")
+    assert [r["name"] for r in sections] == ["12345", "TRN-2026Spring-IVECapstone"]
+
+
+def test_latest_consent_attempt_is_kept(warehouse: CourseWarehouse) -> None:
+    rows = warehouse.query("SELECT canvas_id, attempt, consented FROM consent WHERE canvas_id IN (600005, 600006)")
+    assert sorted(tuple(r) for r in rows) == [(600005, 2, 0), (600006, 2, 1)]
+
+
+def test_reingest_is_idempotent(warehouse: CourseWarehouse, gradebook_csv_path: Path) -> None:
+    before = warehouse.query("SELECT COUNT(*) FROM scores")[0][0]
+    warehouse.ingest_gradebook(COURSE_ID, LegacyGradebookCSVReader().parse(gradebook_csv_path))
+    assert warehouse.query("SELECT COUNT(*) FROM scores")[0][0] == before
+
+
+def test_student_lookups_use_indexes(warehouse: CourseWarehouse) -> None:
+    plan = " ".join(
+        r["detail"] for r in warehouse.query("EXPLAIN QUERY PLAN SELECT * FROM scores WHERE student_id = 1")
+    )
+    assert "scores_by_student" in plan
+
+
+def test_dataframe_of_consenting_scores(warehouse: CourseWarehouse) -> None:
+    df = warehouse.dataframe(
+        "SELECT st.key, SUM(s.score) AS total FROM scores s "
+        "JOIN assignments a ON a.id = s.assignment_id AND a.source = 'canvas' "
+        "JOIN students st ON st.id = s.student_id "
+        "JOIN consent c ON c.canvas_id = st.canvas_id AND c.consented "
+        "GROUP BY st.key ORDER BY st.key"
+    )
+    assert df["key"].tolist() == ["brbourqu", "cvonwein", "lcrain"]
+    assert df["total"].iloc[0] == pytest.approx(8.45 + 10.0 + 0.5 + 1.25 + 26.0)
@@ -0,0 +1,88 @@
+"""Tests for CanvasCourseViewModel prefetching (pages/canvas_course)."""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication  # noqa: E402
+
+from IVE.GAVEL.app.dtos.canvas_course import CanvasCourse, CanvasCourseData, CanvasModule  # noqa: E402
+from IVE.GAVEL.app.usecases.canvas_download_course import DownloadCourseDataUseCase  # noqa: E402
+from IVE.GAVEL.app.usecases.course_data_cache import CourseDataCache  # noqa: E402
+from IVE.GAVEL.pages.canvas_course.viewmodel import CanvasCourseViewModel  # noqa: E402
+
+
+class FakeCanvasClient:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def fetch_course_data(self, course_id: int) -> CanvasCourseData:
+        self.calls.append(course_id)
+        return CanvasCourseData(
+            course=CanvasCourse(id=course_id, name=f"Course {course_id}"),
+            modules=[CanvasModule(id=1, name="Module 1")],
+        )
+
+
+class NullLogger:
+    def info(self, msg: str) -> None: ...
+    def warning(self, msg: str) -> None: ...
+    def error(self, msg: str) -> None: ...
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def make_vm(client: FakeCanvasClient, tmp_path: Path) -> CanvasCourseViewModel:
+    use_case = DownloadCourseDataUseCase(client, CourseDataCache())
+    return CanvasCourseViewModel(use_case, tmp_path, NullLogger(), True, prefetch_debounce_ms=30)
+
+
+def test_only_the_settled_course_id_is_prefetched(qapp, tmp_path: Path) -> None:
+    client = FakeCanvasClient()
+    vm = make_vm(client, tmp_path)
+
+    for text in ("1", "12", "123"):
+        vm.set_course_id(text)
+    assert wait_for(lambda: vm.get_state().preview and vm.get_state().preview.course_name)
+
+    preview = vm.get_state().preview
+    assert client.calls == [123]
+    assert (preview.course_id, preview.course_name, preview.module_names) == ("123", "Course 123", ("Module 1",))
+
+
+def test_download_uses_prefetched_data(qapp, tmp_path: Path) -> None:
+    client = FakeCanvasClient()
+    vm = make_vm(client, tmp_path)
+    vm.set_course_id("55")
+    assert wait_for(lambda: vm.get_state().preview and vm.get_state().preview.course_name)
+
+    vm.download_course()
+    assert wait_for(lambda: vm.get_state().last_saved_path)
+    assert client.calls == [55]
+
+
+def test_non_numeric_course_id_is_not_prefetched(qapp, tmp_path: Path) -> None:
+    client = FakeCanvasClient()
+    vm = make_vm(client, tmp_path)
+    vm.set_course_id("abc")
+    wait_for(lambda: False, timeout=0.1)
+    assert client.calls == []
+    assert vm.get_state().preview is None
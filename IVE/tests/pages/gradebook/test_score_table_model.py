@@ -0,0 +1,112 @@
+"""Tests for the NumPy-backed gradebook table model (pages/gradebook)."""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPersistentModelIndex, Qt  # noqa: E402
+from PyQt6.QtGui import QGuiApplication  # noqa: E402
+
+from IVE.GAVEL.app.dtos.score_matrix import ScoreMatrix  # noqa: E402
+from IVE.GAVEL.pages.gradebook.score_table_model import ScoreTableModel  # noqa: E402
+
+DISPLAY = Qt.ItemDataRole.DisplayRole
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QGuiApplication.instance() or QGuiApplication([])
+
+
+@pytest.fixture
+def model(qapp) -> ScoreTableModel:
+    scores = np.array(
+        [[8.0, 1.0], [np.nan, 3.0], [10.0, 2.0], [4.0, np.nan]],
+        order="F",
+    )
+    matrix = ScoreMatrix(
+        row_labels=("Bourque, Bailey", "Crain, Lindy", "Vonweinstein, Carli", "Crane, Ada"),
+        row_ids=("brbourqu", "lcrain", "cvonwein", "acrane"),
+        column_labels=("Module 1: Programming", "Module 2: Quiz"),
+        scores=scores,
+        points_possible=np.array([10.0, np.nan]),
+    )
+    m = ScoreTableModel("#FF0000", "#00FF00")
+    m.set_matrix(matrix)
+    return m
+
+
+def column(model: ScoreTableModel, c: int) -> list:
+    return [model.data(model.index(r, c), DISPLAY) for r in range(model.rowCount())]
+
+
+def names(model: ScoreTableModel) -> list:
+    return [model.headerData(r, Qt.Orientation.Vertical) for r in range(model.rowCount())]
+
+
+def test_display_values(model: ScoreTableModel) -> None:
+    assert (model.rowCount(), model.columnCount()) == (4, 2)
+    assert column(model, 0) == ["8", "", "10", "4"]
+    assert model.headerData(0, Qt.Orientation.Horizontal) == "Module 1: Programming"
+
+
+def test_sort_keeps_missing_last(model: ScoreTableModel) -> None:
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert column(model, 0) == ["4", "8", "10", ""]
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert column(model, 0) == ["10", "8", "4", ""]
+    model.sort(-1)
+    assert names(model)[0] == "Bourque, Bailey"
+
+
+def test_ties_keep_the_previous_sort(qapp) -> None:
+    matrix = ScoreMatrix(
+        row_labels=("A", "B", "C", "D"),
+        row_ids=("a", "b", "c", "d"),
+        column_labels=("Total", "Section"),
+        scores=np.array([[1.0, 2.0], [4.0, 1.0], [3.0, 2.0], [2.0, 1.0]], order="F"),
+        points_possible=np.array([np.nan, np.nan]),
+    )
+    m = ScoreTableModel("#FF0000", "#00FF00")
+    m.set_matrix(matrix)
+
+    m.sort(0, Qt.SortOrder.DescendingOrder)
+    m.sort(1, Qt.SortOrder.AscendingOrder)
+    # within each section, students stay in descending total order.
+    assert names(m) == ["B", "D", "C", "A"]
+
+
+def test_filter_applies_on_top_of_sort(model: ScoreTableModel) -> None:
+    model.sort(1, Qt.SortOrder.AscendingOrder)
+    model.set_name_filter("cra")
+    assert names(model) == ["Crain, Lindy", "Crane, Ada"]
+    model.set_name_filter("")
+    assert model.rowCount() == 4
+
+
+def test_matrix_is_not_reordered(model: ScoreTableModel) -> None:
+    before = model.matrix().scores.copy()
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    model.set_name_filter("c")
+    np.testing.assert_array_equal(model.matrix().scores, before)
+
+
+def test_selection_follows_the_student(model: ScoreTableModel) -> None:
+    held = QPersistentModelIndex(model.index(2, 0))  # Vonweinstein
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert model.headerData(held.row(), Qt.Orientation.Vertical) == "Vonweinstein, Carli"
+    model.set_name_filter("crain")
+    assert not held.isValid()
+
+
+def test_background_shades_by_fraction_of_points(model: ScoreTableModel) -> None:
+    low = model.data(model.index(3, 0), Qt.ItemDataRole.BackgroundRole).color()
+    high = model.data(model.index(2, 0), Qt.ItemDataRole.BackgroundRole).color()
+    assert high.green() > low.green()
+    # no points possible, or no score: no shading
+    assert model.data(model.index(0, 1), Qt.ItemDataRole.BackgroundRole) is None
+    assert model.data(model.index(1, 0), Qt.ItemDataRole.BackgroundRole) is None
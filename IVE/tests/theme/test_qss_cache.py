@@ -0,0 +1,97 @@
+"""Tests for the hash-keyed theme compiler and hot reload (theme/qss_cache)."""
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication  # noqa: E402
+
+from IVE.GAVEL.theme import qss_cache  # noqa: E402
+from IVE.GAVEL.theme.qss_builder import build_app_qss  # noqa: E402
+from IVE.GAVEL.theme.tokens import load_tokens  # noqa: E402
+
+TOKENS = Path(__file__).resolve().parents[2] / "GAVEL" / "theme" / "tokens_dark.json"
+
+
+@pytest.fixture
+def tokens_path(tmp_path: Path) -> Path:
+    path = tmp_path / "tokens_test.json"
+    path.write_bytes(TOKENS.read_bytes())
+    return path
+
+
+def set_color(path: Path, key: str, value: str) -> None:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["color"][key] = value
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_compiled_qss_matches_builder(tokens_path: Path) -> None:
+    theme = qss_cache.compile_theme(tokens_path)
+    assert theme.qss == build_app_qss(load_tokens(tokens_path))
+    assert theme.tokens.color == load_tokens(tokens_path).color
+
+
+def test_same_tokens_are_not_rendered_twice(
+    tokens_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = qss_cache.compile_theme(tokens_path)
+
+    def fail(tokens):
+        raise AssertionError("stylesheet rebuilt for unchanged tokens")
+
+    monkeypatch.setattr(qss_cache.qss_builder, "build_app_qss", fail)
+    copy = tmp_path / "tokens_copy.json"
+    copy.write_bytes(tokens_path.read_bytes())
+    assert qss_cache.compile_theme(copy) is first
+
+
+def test_token_change_changes_hash(tokens_path: Path) -> None:
+    first = qss_cache.compile_theme(tokens_path)
+    set_color(tokens_path, "bg", "#123456")
+    second = qss_cache.compile_theme(tokens_path)
+
+    assert second.token_hash != first.token_hash
+    assert "#123456" in second.qss
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_watcher_applies_changed_tokens(tokens_path: Path) -> None:
+    app = QCoreApplication.instance() or QCoreApplication([])
+    applied = []
+    failures = []
+    watcher = qss_cache.ThemeWatcher(
+        tokens_path, applied.append, qss_cache.compile_theme(tokens_path), debounce_ms=10
+    )
+    watcher.reload_failed.connect(failures.append)
+
+    original = tokens_path.read_text(encoding="utf-8")
+    tokens_path.write_text("{not json", encoding="utf-8")
+    assert wait_for(lambda: failures)
+    assert applied == []
+
+    # saving the original tokens again is not a change.
+    tokens_path.write_text(original, encoding="utf-8")
+    watcher.reload()
+    assert applied == []
+
+    set_color(tokens_path, "text", "#abcdef")
+    assert wait_for(lambda: applied)
+    assert "#abcdef" in applied[-1]
+    assert watcher.current.qss == applied[-1]
+    assert app is not None
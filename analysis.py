@@ -11,8 +11,10 @@ Requires JSON evaluations to exist in a folder like: shoggoth-validation/data_pr
 
 Produces:
   1) A table of autograder grades, proxy criteria grades, computed total proxy grades, and individual test results.
-  2) A table of correlations (r^2) for each test case.
-  3) If ground truth grades are available, calculates the delta between them and the proxy grades to produce a table,
+  2) A table of correlations (r^2) for each test case, and a ranking of redundant tests (see
+    analysis_test_redundancy.py).
+  3) A PCA of the test results: explained variance and loadings per test (see analysis_pca.py).
+  4) If ground truth grades are available, calculates the delta between them and the proxy grades to produce a table,
     box plot comparison, and a error histogram.
 
 These outputs are typically used to analyze the grades produced by the autograder to improve. For example, the
@@ -31,6 +33,8 @@ from analysis_proxy_grade_ser222 import *
 import constants
 import analysis_proxy_grade_ser334 as proxy_ser334
 import analysis_proxy_comparison as apc
+import analysis_pca
+import analysis_test_redundancy as atr
 
 
 # pandas settings
@@ -125,13 +129,29 @@ def analyze_assignment(course, config_file, canvas_gradebook, semester, proxy_fu
     selected_columns = df_class.iloc[:, 4:4+number_of_tests]
     print(selected_columns.corr())
 
-    # TODO: do PCA analysis.
+    # find tests whose outcomes are (nearly) implied by other tests.
+    atr.analyze_test_redundancy(class_data)
+
+    # find the main directions of variation between students, and which tests drive them.
+    if len(df_class) > 1 and number_of_tests > 0:
+        analysis_pca.analyze_pca(selected_columns.set_index(df_class["last_name"]))
+
+    summary = {"course": course,
+               "semester": semester,
+               "module": module,
+               "students": len(df_class),
+               "tests": number_of_tests,
+               "mean_autograder": float(df_class["total_score_autograder"].mean()),
+               "mean_proxy": float(df_class["total_score_proxy"].mean()),
+               "accuracy": None}
 
     if os.path.exists(canvas_gradebook):
-        apc.compare_autograder_accuracy(course, canvas_gradebook, class_data, config, semester)
+        summary["accuracy"] = apc.compare_autograder_accuracy(course, canvas_gradebook, class_data, config, semester)
     else:
         print("Could not find canvas gradebook, skipping grade comparison.")
 
+    return summary
+
 # testing area
 if __name__ == '__main__':
     #analyze_assignment("ser222", "ser222_config_m1.json", "ser222_21sc_gradebook.csv", "21sc", compute_proxy_grades_m1_21sc)
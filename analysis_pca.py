@@ -0,0 +1,146 @@
+"""
+shoggoth-validation - analysis_pca.py
+
+Principal component analysis of autograder results (students x tests score matrices).
+
+Uses a randomized truncated SVD (Halko, Martinsson, and Tropp) of the column-centered matrix. The matrix is only ever
+read in blocks of rows, and everything kept in memory is tests x components in size, so the input can be a numpy
+memmap far larger than RAM (e.g., every semester pooled together with pool_score_matrices). Two passes over the data
+are needed per power iteration, plus one for the column statistics and one for the projection.
+
+Produces the explained variance of each component, the loadings of every test on each component, and the students'
+coordinates in component space.
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import numpy as np
+import pandas as pd
+
+
+def _row_blocks(matrix, block_rows):
+    for start in range(0, matrix.shape[0], block_rows):
+        yield start, np.asarray(matrix[start:start + block_rows], dtype=np.float64)
+
+
+def pool_score_matrices(path, matrices, block_rows=65536):
+    r"""
+    Stacks several score matrices with the same tests (columns) into one .npy file on disk, without loading them all at
+    once.
+
+    :param path: Output .npy file.
+    :param matrices: Sequence of 2D arrays (or memmaps) with the same number of columns.
+    :return: read-only memmap of the pooled matrix.
+    """
+    columns = {m.shape[1] for m in matrices}
+    if len(columns) != 1:
+        raise Exception(f"Cannot pool score matrices with different numbers of tests ({sorted(columns)}).")
+
+    pooled = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64,
+                                       shape=(sum(m.shape[0] for m in matrices), columns.pop()))
+    offset = 0
+    for matrix in matrices:
+        for start, block in _row_blocks(matrix, block_rows):
+            pooled[offset + start:offset + start + block.shape[0]] = block
+        offset += matrix.shape[0]
+    pooled.flush()
+    del pooled
+
+    return np.load(path, mmap_mode="r")
+
+
+def randomized_pca(matrix, n_components=3, oversample=10, power_iterations=2, block_rows=65536, seed=0,
+                   scores_path=None):
+    r"""
+    Truncated PCA of a students x tests matrix via randomized SVD, reading the matrix in row blocks.
+
+    :param matrix: 2D array or memmap (students x tests).
+    :param n_components: Number of components to keep.
+    :param oversample: Extra random directions used while finding the subspace (improves accuracy).
+    :param power_iterations: Subspace iterations; more helps when the spectrum decays slowly.
+    :param block_rows: Rows read at a time.
+    :param seed: Seed for the random test matrix.
+    :param scores_path: If given, student coordinates are written to this .npy file (as a memmap) instead of memory.
+    :return: dictionary with mean, components (n_components x tests), singular_values, explained_variance,
+             explained_variance_ratio, and scores (students x n_components).
+    """
+    n, k = matrix.shape
+    n_components = min(n_components, k, n)
+    width = min(k, n_components + oversample)
+
+    # pass 1: column statistics.
+    total = np.zeros(k)
+    total_sq = np.zeros(k)
+    for _, block in _row_blocks(matrix, block_rows):
+        total += block.sum(axis=0)
+        total_sq += np.square(block).sum(axis=0)
+    mean = total / n
+    total_variance = (total_sq - n * np.square(mean)).sum() / max(n - 1, 1)
+
+    def gram_times(basis):
+        # (A - mean)^T (A - mean) basis, accumulated block by block.
+        product = np.zeros((k, basis.shape[1]))
+        for _, block in _row_blocks(matrix, block_rows):
+            centered = block - mean
+            product += centered.T @ (centered @ basis)
+        return product
+
+    # find an orthonormal basis for the dominant right singular subspace.
+    rng = np.random.default_rng(seed)
+    basis, _ = np.linalg.qr(gram_times(rng.standard_normal((k, width))))
+    for _ in range(power_iterations):
+        basis, _ = np.linalg.qr(gram_times(basis))
+
+    # exact SVD within the subspace: the small Gram matrix of (A - mean) basis.
+    small = basis.T @ gram_times(basis)
+    eigenvalues, eigenvectors = np.linalg.eigh((small + small.T) / 2)
+    order = np.argsort(eigenvalues)[::-1][:n_components]
+    eigenvalues = np.clip(eigenvalues[order], 0.0, None)
+    components = (basis @ eigenvectors[:, order]).T
+
+    # make signs deterministic: largest loading of each component is positive.
+    signs = np.sign(components[np.arange(n_components), np.argmax(np.abs(components), axis=1)])
+    components *= np.where(signs == 0, 1.0, signs)[:, None]
+
+    # final pass: project students.
+    if scores_path is not None:
+        scores = np.lib.format.open_memmap(scores_path, mode="w+", dtype=np.float64, shape=(n, n_components))
+    else:
+        scores = np.empty((n, n_components))
+    for start, block in _row_blocks(matrix, block_rows):
+        scores[start:start + block.shape[0]] = (block - mean) @ components.T
+
+    explained_variance = eigenvalues / max(n - 1, 1)
+    return {"mean": mean,
+            "components": components,
+            "singular_values": np.sqrt(eigenvalues),
+            "explained_variance": explained_variance,
+            "explained_variance_ratio": explained_variance / total_variance if total_variance > 0 else
+                                        np.zeros(n_components),
+            "scores": scores}
+
+
+def analyze_pca(df_tests, n_components=3):
+    r"""
+    Prints and returns a PCA of a class's test results.
+
+    :param df_tests: DataFrame with one column per test (e.g., the "T <n>" columns from analyze_assignment) and one row
+                     per student.
+    :param n_components: Number of components to report.
+    :return: dictionary with the randomized_pca output plus loadings (tests x components) and projection (students x
+             components) DataFrames.
+    """
+    result = randomized_pca(df_tests.to_numpy(dtype=np.float64), n_components)
+    names = [f"PC{i + 1}" for i in range(len(result["singular_values"]))]
+
+    loadings = pd.DataFrame(result["components"].T, index=df_tests.columns, columns=names)
+    projection = pd.DataFrame(result["scores"], index=df_tests.index, columns=names)
+
+    print("== PCA ==")
+    for name, ratio in zip(names, result["explained_variance_ratio"]):
+        print(f"  {name}: {ratio * 100:.1f}% of variance")
+    print(loadings)
+
+    result["loadings"] = loadings
+    result["projection"] = projection
+    return result
@@ -0,0 +1,67 @@
+"""
+shoggoth-validation - analysis_proxy_accuracy.py
+
+Accuracy statistics for proxy grades against ground truth (manual) grades, with bootstrap confidence intervals.
+
+Reports mean absolute error, root mean squared error, bias (mean of original - proxy), exact-match rate, and the rate of
+agreement within a few points. All bootstrap replicates are drawn as one replicates x students index matrix, so every
+statistic for every replicate is a single vectorized reduction (10,000 replicates take a few milliseconds for a class).
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import numpy as np
+
+# tolerance used when comparing scores, same as the rest of the analysis.
+SCORE_TOLERANCE = 0.0001
+
+
+def _statistics(errors, within):
+    r"""
+    Computes every statistic along the last axis of errors (so it works for one sample or a matrix of replicates).
+    """
+    abs_errors = np.abs(errors)
+    stats = {"mae": abs_errors.mean(axis=-1),
+             "rmse": np.sqrt(np.square(errors).mean(axis=-1)),
+             "bias": errors.mean(axis=-1),
+             "exact": (abs_errors <= SCORE_TOLERANCE).mean(axis=-1)}
+    for points in within:
+        stats[f"within_{points:g}"] = (abs_errors <= points + SCORE_TOLERANCE).mean(axis=-1)
+    return stats
+
+
+def accuracy_stats(original, proxy, within=(1.0, 2.0), replicates=10000, confidence=0.95, seed=0):
+    r"""
+    Computes proxy accuracy statistics with percentile bootstrap confidence intervals.
+
+    :param original: Ground truth grades, one per student.
+    :param proxy: Proxy grades, in the same order.
+    :param within: Point thresholds for the agreement rates (e.g., within_1 is the share of students whose proxy grade
+                   is within 1 point of their original grade).
+    :param replicates: Number of bootstrap resamples.
+    :param confidence: Confidence level of the intervals.
+    :param seed: Seed for the resampling.
+    :return: dictionary of statistic name -> {"estimate", "low", "high"}.
+    """
+    errors = np.asarray(original, dtype=np.float64) - np.asarray(proxy, dtype=np.float64)
+    n = len(errors)
+    if n == 0:
+        raise Exception("Cannot compute accuracy statistics without any students.")
+
+    estimates = _statistics(errors, within)
+
+    rng = np.random.default_rng(seed)
+    resampled = errors[rng.integers(0, n, size=(replicates, n))]
+    boot = _statistics(resampled, within)
+
+    tail = (1.0 - confidence) / 2 * 100
+    return {name: {"estimate": float(estimates[name]),
+                   "low": float(np.percentile(boot[name], tail)),
+                   "high": float(np.percentile(boot[name], 100 - tail))}
+            for name in estimates}
+
+
+def print_accuracy_stats(stats, confidence=0.95):
+    print(f"statistic\testimate\t{confidence * 100:g}% CI")
+    for name, stat in stats.items():
+        print(f"{name}\t{stat['estimate']:.3f}\t[{stat['low']:.3f}, {stat['high']:.3f}]")
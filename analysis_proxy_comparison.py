@@ -5,16 +5,36 @@ __author__ = "Ruben Acuna"
 __copyright__ = "Copyright 2024-25, Ruben Acuna"
 
 import csv
-import math
 import os
 
 import matplotlib.pyplot as plt
+import numpy as np
 
+import analysis_proxy_accuracy as apa
 import constants
 
 def compare_autograder_accuracy(course, canvas_gradebook, class_data, config, semester):
 
     # populate class_data with original scores
+    attach_original_scores(canvas_gradebook, class_data, config)
+
+    # compute error
+    for student in class_data:
+        student["error"] = student["original_score"] - student['total_score_proxy']
+        student["abs_error"] = abs(student["error"])
+        student["sq_error"] = student["error"] * student["error"]
+
+    stats = generate_grade_table(class_data)
+    generate_visuals(class_data, course + "_" + semester + "_" + config["module"])
+
+    return stats
+
+
+def attach_original_scores(canvas_gradebook, class_data, config):
+    r"""
+    Looks up each student's manually assigned grade for the assignment in a Canvas gradebook export and stores it as
+    "original_score" in their entry of class_data (matched on "last_name").
+    """
     columns, gradebook_rows = load_canvas_gradebook(canvas_gradebook)
     for entry in gradebook_rows:
         entry["Student"] = entry["Student"].split(",")[0].split(" ")[0]
@@ -42,17 +62,51 @@ def compare_autograder_accuracy(course, canvas_gradebook, class_data, config, se
 
         student["original_score"] = float(gradebook_entry[key])
 
-    # compute error
-    for student in class_data:
-        student["error"] = student["original_score"] - student['total_score_proxy']
-        student["abs_error"] = abs(student["error"])
-        student["sq_error"] = student["error"] * student["error"]
 
-    generate_grade_table(class_data)
-    generate_visuals(class_data, course + "_" + semester + "_" + config["module"])
+# parsed gradebooks, keyed by (path, size, mtime) so an edited export is re-read.
+_gradebook_cache = {}
+
+
+def _gradebook_cache_key(path_gradebook):
+    info = os.stat(path_gradebook)
+    return os.path.abspath(path_gradebook), info.st_size, info.st_mtime_ns
+
+
+def prime_gradebook_cache(entries):
+    r"""
+    Adds already parsed gradebooks to this process's cache (e.g., parsed once by a parent process and handed to its
+    workers).
+
+    :param entries: Dictionary of cache key -> (columns, rows), as produced by export_gradebook_cache.
+    """
+    _gradebook_cache.update(entries)
+
+
+def export_gradebook_cache(paths):
+    r"""
+    Parses each gradebook once and returns the cache entries for prime_gradebook_cache.
+    """
+    for path in paths:
+        load_canvas_gradebook(path)
+    return {key: _gradebook_cache[key] for key in (_gradebook_cache_key(path) for path in paths)}
 
 
 def load_canvas_gradebook(path_gradebook):
+    r"""
+    Reads the programming assignment columns of a Canvas gradebook export. Each file is only parsed once per process;
+    callers get their own copy of the rows, so they can modify them freely.
+
+    :return: (useful column names, list of row dictionaries)
+    """
+    key = _gradebook_cache_key(path_gradebook)
+    if key not in _gradebook_cache:
+        _gradebook_cache[key] = _parse_canvas_gradebook(path_gradebook)
+
+    columns, rows = _gradebook_cache[key]
+    return list(columns), [dict(row) for row in rows]
+
+
+def _parse_canvas_gradebook(path_gradebook):
     gradebook_rows = []
     useful_columns = ["Student"]
 
@@ -93,25 +147,23 @@ def generate_grade_table(cd):
     print(f"total abs error: {sum([s['abs_error'] for s in cd])}")
 
     def display_summary_stats(key):
-        #print(f"==display_summary_stats for {key}==")
-        key_data = [x[key] for x in cd]
-        data_min = min(key_data)
-
-        data_mean = sum(key_data) / len(key_data)
-
-        data_max = max(key_data)
-
-        #SD
-        data_sd = [(x - data_mean) ** 2 for x in key_data]
-        data_sd = math.sqrt(sum(data_sd)/len(data_sd))
+        key_data = np.array([x[key] for x in cd], dtype=np.float64)
+        data_max = key_data.max()
 
         #max count
-        maxes = len([x for x in key_data if math.isclose(x, data_max)])
-        print(f"{key[:14]}\tmin: {data_min}\tmean: {round(data_mean, 2)}\tmax: {data_max}\tsd: {round(data_sd, 2)}\tmaxes: {maxes}")
+        maxes = int(np.isclose(key_data, data_max).sum())
+        print(f"{key[:14]}\tmin: {key_data.min()}\tmean: {round(key_data.mean(), 2)}\tmax: {data_max}\t"
+              f"sd: {round(key_data.std(), 2)}\tmaxes: {maxes}")
 
     display_summary_stats("original_score")
     display_summary_stats("total_score_proxy")
 
+    # accuracy of the proxy grades, with bootstrap confidence intervals.
+    stats = apa.accuracy_stats([x["original_score"] for x in cd], [x["total_score_proxy"] for x in cd])
+    apa.print_accuracy_stats(stats)
+
+    return stats
+
 
 def generate_visuals(cd, prefix):
     # generate histogram of errors
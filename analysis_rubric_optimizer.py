@@ -0,0 +1,311 @@
+"""
+shoggoth-validation - analysis_rubric_optimizer.py
+
+Searches the partial-credit rules of a proxy grade rubric to best match human grades.
+
+The proxy functions in analysis_proxy_grade_ser222.py and analysis_proxy_grade_ser334.py award each rubric criterion a
+level (e.g., full, half, or no credit) depending on which of its tests passed, and those rules were tuned by hand. Here
+a criterion is described by its points, the tests it looks at, and the fractions of credit for each level:
+
+    {"name": "course_drop", "points": 5.0,
+     "tests": ["Remove Course 1", "Remove Course 2", "Remove Course 3", "Remove Course 4"],
+     "levels": [[1.0, ["Remove Course 1", "Remove Course 2", "Remove Course 3", "Remove Course 4"]],
+                [0.5, ["Remove Course 1", "Remove Course 2", "Remove Course 3"]],
+                [0.25, ["Remove Course 1"]]]}
+
+Each level lists the tests that must all pass (the hand-tuned starting rule; an empty list means the level is never
+awarded). Levels are checked in order, first match wins, otherwise no credit. The optimizer then searches, for every
+level, over conditions of the form "all of S pass" and "any of S pass" for subsets S of the criterion's tests, to
+minimize the mean absolute error of the total proxy grade against the Canvas grades.
+
+Search is coordinate descent over criteria: with the other criteria fixed, every combination of level conditions for
+one criterion is scored at once. Students are reduced to the bit pattern of their results on the criterion's tests, so
+a batch of candidate rules is a small conditions x patterns table lookup followed by one vectorized error computation.
+Large batches are split into chunks and spread over a process pool.
+
+optimize_rubric_cv holds out one semester at a time, so the reported error reflects rules that were not tuned on the
+students they are scored on.
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import analysis_proxy_comparison as apc
+import constants
+from analysis_proxy_grade_util import get_test_case_by_name
+
+# candidate batches larger than this are split across the process pool.
+CHUNK_SIZE = 4096
+
+
+def load_labeled_class(course, config_file, canvas_gradebook, semester):
+    r"""
+    Loads a class's evaluations (see analyze_assignment for the folder layout) together with the human grades from the
+    Canvas gradebook, stored as "original_score". Unparsable evaluations are skipped.
+
+    :return: class_data list, each entry tagged with its "semester".
+    """
+    with open(config_file) as file:
+        config = json.load(file)
+
+    input_folder = constants.FOLDER_EVALUATIONS + os.sep + f"{course}_{semester}_{config['module']}"
+    filenames = sorted(f for f in os.listdir(input_folder) if ".json" in f)
+    suffix = os.path.commonprefix([f[::-1] for f in filenames])[::-1]
+
+    class_data = []
+    for filename in filenames:
+        with open(input_folder + os.sep + filename) as f:
+            try:
+                student_data = json.load(f)
+            except json.JSONDecodeError:
+                continue
+        student_data["last_name"] = filename[:-len(suffix)]
+        student_data["semester"] = semester
+        class_data.append(student_data)
+
+    apc.attach_original_scores(canvas_gradebook, class_data, config)
+    return class_data
+
+
+def _criterion_codes(class_data, tests):
+    # bit j of a student's code is set if they passed the criterion's test j.
+    codes = np.zeros(len(class_data), dtype=np.int64)
+    for row, student in enumerate(class_data):
+        for j, name in enumerate(tests):
+            test = get_test_case_by_name(student, name)
+            if math.isclose(test["max_score"], test["score"], abs_tol=0.0001):
+                codes[row] |= 1 << j
+    return codes
+
+
+def _conditions(n_tests, max_subset):
+    r"""
+    Enumerates the conditions a level can use: ("never", 0), ("all", mask), and ("any", mask) for masks over the
+    criterion's tests, along with a table of which result patterns satisfy each one.
+    """
+    masks = [mask for mask in range(1, 1 << n_tests) if bin(mask).count("1") <= max_subset]
+    conditions = [("never", 0)] + [("all", mask) for mask in masks]
+    conditions += [("any", mask) for mask in masks if bin(mask).count("1") >= 2]
+
+    patterns = np.arange(1 << n_tests)
+    table = np.zeros((len(conditions), len(patterns)), dtype=bool)
+    for i, (mode, mask) in enumerate(conditions):
+        if mode == "all":
+            table[i] = (patterns & mask) == mask
+        elif mode == "any":
+            table[i] = (patterns & mask) != 0
+    return conditions, table
+
+
+def _level_values(table, fractions, points, candidates):
+    # candidates: rules x levels condition indices -> credit per result pattern, first satisfied level wins.
+    satisfied = table[candidates]  # rules x levels x patterns
+    first = np.argmax(satisfied, axis=1)
+    return np.where(satisfied.any(axis=1), fractions[first], 0.0) * points
+
+
+def _score_chunk(start, stop, n_conditions, n_levels, table, fractions, points, codes, base, truth):
+    r"""
+    Scores the candidate rules with flat indices [start, stop) of the criterion's search space.
+
+    :return: (best mean absolute error, its flat index)
+    """
+    candidates = np.stack(np.unravel_index(np.arange(start, stop), (n_conditions,) * n_levels), axis=1)
+    values = _level_values(table, fractions, points, candidates)  # rules x patterns
+    errors = np.abs(truth[None, :] - base[None, :] - values[:, codes]).mean(axis=1)
+    best = int(np.argmin(errors))
+    return float(errors[best]), start + best
+
+
+def _rule_from_levels(criterion, levels):
+    conditions = []
+    for _, tests in levels:
+        mask = sum(1 << criterion["tests"].index(name) for name in tests)
+        conditions.append(("all", mask) if mask else ("never", 0))
+    return conditions
+
+
+def _describe(criterion, condition):
+    mode, mask = condition
+    if mode == "never":
+        return "never"
+    names = [name for j, name in enumerate(criterion["tests"]) if mask >> j & 1]
+    return f"{mode} of {names}"
+
+
+def predict(rubric, rules, class_data):
+    r"""
+    Computes proxy grades for a class under a set of rules.
+
+    :param rubric: List of criteria (see module docstring).
+    :param rules: One list of (mode, mask) conditions per criterion, one per level.
+    :return: numpy array of total proxy grades, one per student.
+    """
+    total = np.zeros(len(class_data))
+    for criterion, rule in zip(rubric, rules, strict=True):
+        codes = _criterion_codes(class_data, criterion["tests"])
+        patterns = np.arange(1 << len(criterion["tests"]))
+        credit = np.zeros(len(patterns))
+        awarded = np.zeros(len(patterns), dtype=bool)
+        for (fraction, _), (mode, mask) in zip(criterion["levels"], rule, strict=True):
+            if mode == "all":
+                hit = (patterns & mask) == mask
+            elif mode == "any":
+                hit = (patterns & mask) != 0
+            else:
+                continue
+            credit[hit & ~awarded] = fraction * criterion["points"]
+            awarded |= hit
+        total += credit[codes]
+    return total
+
+
+def optimize_rubric(rubric, class_data, max_subset=3, max_sweeps=5, workers=None):
+    r"""
+    Tunes the partial-credit rules of a rubric against the human grades of a class.
+
+    :param rubric: List of criteria (see module docstring).
+    :param class_data: Evaluations with "original_score", e.g., from load_labeled_class.
+    :param max_subset: Largest subset of a criterion's tests a single condition may use.
+    :param max_sweeps: Maximum passes over all criteria.
+    :param workers: Process pool size (None for the number of CPUs). Use 1 to stay in this process.
+    :return: dictionary with the rules, their mean absolute error, and the error of the starting (hand-tuned) rules.
+    """
+    truth = np.array([student["original_score"] for student in class_data], dtype=np.float64)
+    codes = [_criterion_codes(class_data, criterion["tests"]) for criterion in rubric]
+    searches = [_conditions(len(criterion["tests"]), max_subset) for criterion in rubric]
+    rules = [_rule_from_levels(criterion, criterion["levels"]) for criterion in rubric]
+
+    def contributions():
+        return [predict([criterion], [rule], class_data) for criterion, rule in zip(rubric, rules, strict=True)]
+
+    current = contributions()
+    start_mae = float(np.abs(truth - sum(current)).mean())
+    best_mae = start_mae
+
+    pool = ProcessPoolExecutor(workers) if workers != 1 else None
+    try:
+        for _ in range(max_sweeps):
+            improved = False
+            for c, criterion in enumerate(rubric):
+                conditions, table = searches[c]
+                fractions = np.array([level[0] for level in criterion["levels"]])
+                n_levels = len(fractions)
+                base = sum(current) - current[c]
+                space = len(conditions) ** n_levels
+
+                args = (len(conditions), n_levels, table, fractions, criterion["points"], codes[c], base, truth)
+                chunks = [(lo, min(lo + CHUNK_SIZE, space)) for lo in range(0, space, CHUNK_SIZE)]
+                if pool is None or len(chunks) == 1:
+                    results = [_score_chunk(lo, hi, *args) for lo, hi in chunks]
+                else:
+                    results = list(pool.map(_score_chunk, *zip(*[(lo, hi, *args) for lo, hi in chunks], strict=True)))
+
+                mae, index = min(results)
+                if mae < best_mae - 1e-12:
+                    chosen = np.unravel_index(index, (len(conditions),) * n_levels)
+                    rules[c] = [conditions[i] for i in chosen]
+                    current[c] = predict([criterion], [rules[c]], class_data)
+                    best_mae = mae
+                    improved = True
+
+            if not improved:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {"rules": rules, "mae": best_mae, "start_mae": start_mae}
+
+
+def optimize_rubric_cv(rubric, class_data, max_subset=3, max_sweeps=5, workers=None):
+    r"""
+    Leave-one-semester-out cross-validation of optimize_rubric. Each semester is scored with rules tuned on the others,
+    alongside the hand-tuned starting rules.
+
+    :param class_data: Evaluations with "original_score" and "semester" from two or more semesters.
+    :return: dictionary with per-semester results (held-out error of tuned and starting rules) and the rules tuned on
+             all semesters.
+    """
+    semesters = sorted({student["semester"] for student in class_data})
+    if len(semesters) < 2:
+        raise Exception("Cross-validation needs class data from at least two semesters.")
+
+    start_rules = [_rule_from_levels(criterion, criterion["levels"]) for criterion in rubric]
+    folds = {}
+    for semester in semesters:
+        train = [student for student in class_data if student["semester"] != semester]
+        test = [student for student in class_data if student["semester"] == semester]
+        truth = np.array([student["original_score"] for student in test])
+
+        tuned = optimize_rubric(rubric, train, max_subset, max_sweeps, workers)
+        folds[semester] = {"train_mae": tuned["mae"],
+                           "test_mae": float(np.abs(truth - predict(rubric, tuned["rules"], test)).mean()),
+                           "start_test_mae": float(np.abs(truth - predict(rubric, start_rules, test)).mean()),
+                           "rules": tuned["rules"]}
+
+    return {"folds": folds, "final": optimize_rubric(rubric, class_data, max_subset, max_sweeps, workers)}
+
+
+def print_rules(rubric, rules):
+    for criterion, rule in zip(rubric, rules, strict=True):
+        print(f"  {criterion['name']} [{criterion['points']}pts]")
+        for (fraction, _), condition in zip(criterion["levels"], rule, strict=True):
+            print(f"    {fraction * criterion['points']:g}pts if {_describe(criterion, condition)}")
+
+
+def print_cv_report(rubric, result):
+    print("== RUBRIC OPTIMIZATION ==")
+    for semester, fold in result["folds"].items():
+        print(f"  held out {semester}: tuned MAE {fold['test_mae']:.3f} (train {fold['train_mae']:.3f}), "
+              f"hand-tuned MAE {fold['start_test_mae']:.3f}")
+    print(f"  all semesters: tuned MAE {result['final']['mae']:.3f}, hand-tuned MAE {result['final']['start_mae']:.3f}")
+    print_rules(rubric, result["final"]["rules"])
+
+
+# SER334 M2 (24SC) rubric, with the levels used by compute_proxies_m2_24sc as the starting rules.
+RUBRIC_SER334_M2 = [
+    {"name": "main menu", "points": 2.0, "tests": ["Main Menu 1", "Main Menu 2"],
+     "levels": [[1.0, ["Main Menu 1", "Main Menu 2"]], [0.5, ["Main Menu 1"]]]},
+    {"name": "memory leaks", "points": 2.0, "tests": ["Memory Allocation 3", "Memory Allocation 4"],
+     "levels": [[1.0, ["Memory Allocation 3", "Memory Allocation 4"]], [0.5, ["Memory Allocation 3"]]]},
+    {"name": "course_insert", "points": 7.0,
+     "tests": ["Insert Course 1", "Insert Course 2", "Insert Course 3", "Insert Course 4", "Insert Course 5",
+               "Insert Course 6", "Insert Course 7"],
+     "levels": [[1.0, ["Insert Course 1", "Insert Course 2", "Insert Course 3", "Insert Course 4", "Insert Course 5",
+                       "Insert Course 6", "Insert Course 7"]],
+                [0.5, ["Insert Course 1", "Insert Course 2", "Insert Course 4"]],
+                [0.25, ["Insert Course 1"]]]},
+    {"name": "course_insert::memory", "points": 2.0, "tests": ["Memory Allocation 1", "Memory Allocation 2"],
+     "levels": [[1.0, ["Memory Allocation 1", "Memory Allocation 2"]], [0.5, ["Memory Allocation 1"]]]},
+    {"name": "schedule_print", "points": 2.0, "tests": ["Schedule Print"],
+     "levels": [[1.0, ["Schedule Print"]]]},
+    {"name": "course_drop", "points": 5.0,
+     "tests": ["Remove Course 1", "Remove Course 2", "Remove Course 3", "Remove Course 4"],
+     "levels": [[1.0, ["Remove Course 1", "Remove Course 2", "Remove Course 3", "Remove Course 4"]],
+                [0.5, ["Remove Course 1", "Remove Course 2", "Remove Course 3"]],
+                [0.25, ["Remove Course 1"]]]},
+    {"name": "course_drop::memory", "points": 2.0, "tests": ["Memory Allocation 5", "Memory Allocation 6"],
+     "levels": [[1.0, ["Memory Allocation 5", "Memory Allocation 6"]], [0.5, ["Memory Allocation 5"]]]},
+    {"name": "schedule_load", "points": 4.0, "tests": ["Load File 1", "Load File 2", "Load File 3"],
+     "levels": [[1.0, ["Load File 1", "Load File 2", "Load File 3"]], [0.5, ["Load File 1"]]]},
+    {"name": "schedule_save", "points": 4.0, "tests": ["Save File 1", "Save File 2"],
+     "levels": [[1.0, ["Save File 1", "Save File 2"]], [0.5, ["Save File 1"]]]},
+]
+
+
+# testing area
+if __name__ == '__main__':
+    config_m2 = constants.FOLDER_DATA_ORIGINAL + os.sep + "ser334_config_m2.json"
+    gradebook_24sc = constants.FOLDER_DATA_ORIGINAL + os.sep + "ser334_24sc_gradebook.csv"
+    gradebook_24fc = constants.FOLDER_DATA_ORIGINAL + os.sep + "ser334_24fc_gradebook.csv"
+
+    data = (load_labeled_class("ser334", config_m2, gradebook_24sc, "24sc")
+            + load_labeled_class("ser334", config_m2, gradebook_24fc, "24fc"))
+    print_cv_report(RUBRIC_SER334_M2, optimize_rubric_cv(RUBRIC_SER334_M2, data))
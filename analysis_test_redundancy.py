@@ -0,0 +1,187 @@
+"""
+shoggoth-validation - analysis_test_redundancy.py
+
+Finds redundant test cases in an autograder's suite.
+
+Works on the binary pass matrix (students x tests) built from a class's evaluations. For every pair of tests it computes,
+in a few matrix products:
+  1) phi coefficients (Pearson correlation of the pass/fail outcomes).
+  2) mutual information, in bits.
+  3) conditional pass rates, P(pass column test | pass row test).
+
+Tests are then clustered hierarchically on 1 - phi into redundancy groups, and ranked by how much of their outcome is
+already explained by some other test (the uncertainty coefficient, MI / entropy). Within each group the most informative
+test is kept and the rest are suggested for removal. Tests that every student passes (or fails) carry no information and
+are always suggested.
+
+Since everything is pairwise over tests, the cost is one tests x tests matrix product over the students, so suites with
+hundreds of tests and pooled multi-semester cohorts stay fast.
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import math
+
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import squareform
+
+
+def build_pass_matrix(class_data):
+    r"""
+    Builds the pass matrix for a class. A test counts as passed if it received its full score (same rule as
+    analysis_proxy_grade_util.was_test_passed_by_name).
+
+    :param class_data: List of evaluations (loaded JSON) with "tests".
+    :return: (test numbers in order, boolean numpy array of shape students x tests)
+    """
+    numbers = sorted({test["number"] for student in class_data for test in student["tests"]}, key=float)
+    column = {number: i for i, number in enumerate(numbers)}
+
+    passed = np.zeros((len(class_data), len(numbers)), dtype=bool)
+    for row, student in enumerate(class_data):
+        for test in student["tests"]:
+            passed[row, column[test["number"]]] = math.isclose(test["max_score"], test["score"], abs_tol=0.0001)
+
+    return numbers, passed
+
+
+def _pair_counts(passed):
+    # n11[i, j] = number of students passing both i and j; n1[i] = number passing i.
+    x = passed.astype(np.float64)
+    n11 = x.T @ x
+    return x.shape[0], np.diag(n11).copy(), n11
+
+
+def phi_matrix(passed):
+    r"""
+    Phi coefficient between every pair of tests. Pairs involving a test with no variance are NaN.
+    """
+    n, n1, n11 = _pair_counts(passed)
+    variance = n1 * (n - n1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (n * n11 - np.outer(n1, n1)) / np.sqrt(np.outer(variance, variance))
+
+
+def _xlogx_ratio(p_joint, p_marginal):
+    # p * log2(p / q), with 0 log 0 = 0.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(p_joint > 0, p_joint * np.log2(p_joint / p_marginal), 0.0)
+
+
+def mutual_information_matrix(passed):
+    r"""
+    Mutual information (bits) between the outcomes of every pair of tests. The diagonal is each test's entropy.
+    """
+    n, n1, n11 = _pair_counts(passed)
+    p1 = n1 / n
+    p0 = 1.0 - p1
+
+    p11 = n11 / n
+    p10 = p1[:, None] - p11
+    p01 = p1[None, :] - p11
+    p00 = 1.0 - p1[:, None] - p1[None, :] + p11
+
+    return (_xlogx_ratio(p11, np.outer(p1, p1)) + _xlogx_ratio(p10, np.outer(p1, p0))
+            + _xlogx_ratio(p01, np.outer(p0, p1)) + _xlogx_ratio(p00, np.outer(p0, p0)))
+
+
+def conditional_pass_rates(passed):
+    r"""
+    Conditional pass rates, where entry [i, j] is P(pass j | pass i). Rows for tests nobody passed are NaN.
+    """
+    _, n1, n11 = _pair_counts(passed)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return n11 / n1[:, None]
+
+
+def cluster_tests(phi, threshold=0.8):
+    r"""
+    Groups tests whose outcomes are strongly positively correlated, using average linkage on 1 - phi.
+
+    :param phi: Output of phi_matrix.
+    :param threshold: Minimum average phi within a group.
+    :return: numpy array of group labels (1-based), one per test.
+    """
+    if phi.shape[0] < 2:
+        return np.ones(phi.shape[0], dtype=int)
+
+    distance = 1.0 - np.nan_to_num(phi, nan=0.0)  # constant tests are unrelated to everything.
+    distance = np.clip((distance + distance.T) / 2, 0.0, 2.0)
+    np.fill_diagonal(distance, 0.0)
+
+    tree = linkage(squareform(distance, checks=False), method="average")
+    return fcluster(tree, t=1.0 - threshold, criterion="distance")
+
+
+def rank_redundant_tests(numbers, passed, phi, mi, threshold=0.8):
+    r"""
+    Ranks tests by how redundant they are with the rest of the suite.
+
+    :param numbers: Test numbers, one per column of passed.
+    :param passed: Boolean pass matrix (students x tests).
+    :param phi: Output of phi_matrix.
+    :param mi: Output of mutual_information_matrix.
+    :param threshold: Minimum average phi for tests to be grouped together.
+    :return: DataFrame with one row per test (most redundant first): pass rate, entropy, redundancy group, best
+             predictor, the share of its entropy that predictor explains, and whether it is a candidate to drop.
+    """
+    entropy = np.diag(mi).copy()
+    groups = cluster_tests(phi, threshold)
+
+    others = mi.copy()
+    np.fill_diagonal(others, -np.inf)
+    best = np.argmax(others, axis=1) if len(numbers) > 1 else np.zeros(len(numbers), dtype=int)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        explained = np.where(entropy > 0, others[np.arange(len(numbers)), best] / entropy, 1.0)
+    explained = np.clip(np.nan_to_num(explained, nan=1.0, neginf=0.0), 0.0, 1.0)
+
+    # keep the most informative test of each group, suggest dropping the others and anything uninformative.
+    drop = entropy <= 0
+    for group in np.unique(groups):
+        members = np.flatnonzero(groups == group)
+        if len(members) > 1:
+            keep = members[np.argmax(entropy[members])]
+            drop[members[members != keep]] = True
+
+    table = pd.DataFrame({"test": numbers,
+                          "pass_rate": passed.mean(axis=0),
+                          "entropy": entropy,
+                          "group": groups,
+                          "best_predictor": [numbers[j] if entropy[i] > 0 and len(numbers) > 1 else None
+                                             for i, j in enumerate(best)],
+                          "explained": explained,
+                          "drop_candidate": drop})
+
+    return table.sort_values(["drop_candidate", "explained"], ascending=False, kind="stable").reset_index(drop=True)
+
+
+def analyze_test_redundancy(class_data, threshold=0.8):
+    r"""
+    Prints a redundancy report for a class's evaluations.
+
+    :param class_data: List of evaluations (loaded JSON) with "tests".
+    :param threshold: Minimum average phi for tests to be grouped together.
+    :return: dictionary with the test numbers, phi, mutual information, and conditional pass rate matrices, and the
+             ranking table.
+    """
+    numbers, passed = build_pass_matrix(class_data)
+    phi = phi_matrix(passed)
+    mi = mutual_information_matrix(passed)
+
+    ranking = rank_redundant_tests(numbers, passed, phi, mi, threshold)
+
+    print("== TEST REDUNDANCY ==")
+    print(ranking)
+
+    groups = ranking[ranking.groupby("group")["test"].transform("size") > 1].groupby("group")["test"].apply(list)
+    for tests in groups:
+        print(f"  Redundant group: {sorted(tests, key=float)}")
+    print(f"  {int(ranking['drop_candidate'].sum())} of {len(numbers)} tests are candidates to drop.")
+
+    return {"numbers": numbers,
+            "phi": phi,
+            "mutual_information": mi,
+            "conditional_pass_rates": conditional_pass_rates(passed),
+            "ranking": ranking}
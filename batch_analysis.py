@@ -0,0 +1,212 @@
+"""
+shoggoth-validation - batch_analysis.py
+
+Runs a whole set of analyses from a TOML manifest, in parallel.
+
+A manifest lists every assignment to analyze (see analyze_assignment) and, optionally, cohort comparisons between
+gradebooks (see stats.perform_two_tailed_test):
+
+    [settings]
+    workers = 0                                   # worker processes, 0 for one per CPU
+    output = "data_processed/fie_2025_enhancing_results.csv"
+
+    [[assignment]]
+    course = "ser334"
+    semester = "24sc"
+    config = "data_original/ser334_config_m2.json"
+    gradebook = "data_original/ser334_24sc_gradebook.csv"
+    proxy = "analysis_proxy_grade_ser334.compute_proxies_m2_24sc"
+
+    [[comparison]]
+    first = "data_original/ser334_24sc_gradebook.csv"
+    second = "data_original/ser334_24fc_gradebook.csv"
+    columns = ["Module 1: Programming", "Module CP3: Programming"]
+    alpha = 0.05
+
+    [[cohorts]]                                   # see stats.compare_cohorts
+    gradebooks = { 24sc = "data_original/ser334_24sc_gradebook.csv", 24fc = "data_original/ser334_24fc_gradebook.csv" }
+    correction = "holm"                           # or "bonferroni", "bh"
+    permutations = 10000
+
+Every distinct gradebook is parsed once, up front, and handed to each worker process when it starts, so no CSV is read
+more than once however many assignments use it. Assignments run in a process pool; each one's console output is
+collected and printed as a block when it finishes, and one row per assignment (with its accuracy statistics) is written
+to the output CSV. Each [[cohorts]] entry writes its tidy comparison table next to it (<output>_cohorts_<n>.csv).
+
+Usage:
+    python batch_analysis.py studies/fie_2025_enhancing.toml
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+import analysis_proxy_comparison as apc
+import constants
+
+
+def load_manifest(path):
+    with open(path, "rb") as f:
+        manifest = tomllib.load(f)
+
+    for entry in manifest.get("assignment", []):
+        for key in ("course", "semester", "config", "gradebook", "proxy"):
+            if key not in entry:
+                raise Exception(f"Manifest assignment entry is missing {key}: {entry}")
+    return manifest
+
+
+def _resolve_proxy(dotted_name):
+    module_name, _, function_name = dotted_name.rpartition(".")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _init_worker(gradebooks):
+    # figures are only saved, never shown, in workers.
+    import matplotlib
+    matplotlib.use("Agg")
+    apc.prime_gradebook_cache(gradebooks)
+
+
+def _run_assignment(entry):
+    r"""
+    Runs one analyze_assignment in a worker and captures its console output.
+
+    :return: (entry, summary or None, error or None, captured output, seconds)
+    """
+    from analysis import analyze_assignment
+
+    output = io.StringIO()
+    start = time.perf_counter()
+    summary = error = None
+    with contextlib.redirect_stdout(output):
+        try:
+            summary = analyze_assignment(entry["course"], entry["config"], entry["gradebook"], entry["semester"],
+                                         _resolve_proxy(entry["proxy"]))
+        except (Exception, SystemExit) as e:  # analyze_assignment exit()s on missing data; Ctrl-C still stops.
+            error = repr(e)
+    return entry, summary, error, output.getvalue(), time.perf_counter() - start
+
+
+def _result_row(entry, summary, error, seconds):
+    row = {"course": entry["course"],
+           "semester": entry["semester"],
+           "config": entry["config"],
+           "proxy": entry["proxy"],
+           "seconds": round(seconds, 3),
+           "error": error}
+    if summary is not None:
+        row.update({key: summary[key] for key in ("module", "students", "tests", "mean_autograder", "mean_proxy")})
+        for name, stat in (summary["accuracy"] or {}).items():
+            row[name] = stat["estimate"]
+            row[name + "_low"] = stat["low"]
+            row[name + "_high"] = stat["high"]
+    return row
+
+
+def run_comparisons(comparisons, cohort_sets=(), output_path=None):
+    r"""
+    Runs the cohort comparisons of a manifest. Each gradebook is prepared once.
+
+    :return: list of compare_cohorts DataFrames, one per cohorts entry.
+    """
+    from stats import compare_cohorts, perform_two_tailed_test, prepare_gradebook
+
+    prepared = {}
+
+    def gradebook(path):
+        if path not in prepared:
+            prepared[path] = prepare_gradebook(path, path[:-4] + "_stats_cleaned.csv")
+        return prepared[path]
+
+    for comparison in comparisons:
+        first = gradebook(comparison["first"])
+        second = gradebook(comparison["second"])
+        alpha = comparison.get("alpha", 0.05)
+
+        print("Assessment\t\t\t\tSection\tn\tMean\tSD\tMin")
+        for column in comparison["columns"]:
+            if isinstance(column, list):  # [column in first, column in second]
+                perform_two_tailed_test(column[0], column[1], alpha, first, second)
+            else:
+                perform_two_tailed_test(column, None, alpha, first, second)
+
+    tables = []
+    for i, cohort_set in enumerate(cohort_sets):
+        df_cohorts = compare_cohorts({name: gradebook(path) for name, path in cohort_set["gradebooks"].items()},
+                                     columns=cohort_set.get("columns"),
+                                     alpha=cohort_set.get("alpha", 0.05),
+                                     correction=cohort_set.get("correction", "holm"),
+                                     permutations=cohort_set.get("permutations", 10000))
+        print(df_cohorts.to_string(index=False))
+        if output_path:
+            df_cohorts.to_csv(os.path.splitext(output_path)[0] + f"_cohorts_{i + 1}.csv", index=False)
+        tables.append(df_cohorts)
+    return tables
+
+
+def run_manifest(path):
+    r"""
+    Runs every assignment and comparison in a manifest.
+
+    :param path: TOML manifest file.
+    :return: DataFrame with one row per assignment.
+    """
+    manifest = load_manifest(path)
+    settings = manifest.get("settings", {})
+    assignments = manifest.get("assignment", [])
+    workers = settings.get("workers", 0) or os.cpu_count()
+    output_path = settings.get("output", constants.FOLDER_DATA_PROCESSED + os.sep
+                               + os.path.splitext(os.path.basename(path))[0] + "_results.csv")
+
+    print(f"run_manifest({path}): {len(assignments)} assignments on {workers} workers")
+
+    gradebooks = apc.export_gradebook_cache(sorted({entry["gradebook"] for entry in assignments
+                                                    if os.path.exists(entry["gradebook"])}))
+
+    rows = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(min(workers, max(len(assignments), 1)), initializer=_init_worker,
+                             initargs=(gradebooks,)) as pool:
+        futures = [pool.submit(_run_assignment, entry) for entry in assignments]
+        for future in as_completed(futures):
+            entry, summary, error, output, seconds = future.result()
+            print(f"==== {entry['course']} {entry['semester']} {entry['config']} ({seconds:.1f} s) ====")
+            print(output, end="")
+            if error:
+                print(f"  Failed: {error}")
+            rows.append(_result_row(entry, summary, error, seconds))
+
+    # keep the manifest's order in the table, regardless of completion order.
+    order = {(e["course"], e["semester"], e["config"], e["proxy"]): i for i, e in enumerate(assignments)}
+    rows.sort(key=lambda row: order[(row["course"], row["semester"], row["config"], row["proxy"])])
+    df_results = pd.DataFrame(rows)
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    if manifest.get("comparison") or manifest.get("cohorts"):
+        run_comparisons(manifest.get("comparison", []), manifest.get("cohorts", []), output_path)
+
+    df_results.to_csv(output_path, index=False)
+    print(f"Analyzed {len(assignments)} assignments in {time.perf_counter() - start:.1f} s, results in {output_path}.")
+
+    return df_results
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("usage: python batch_analysis.py <manifest.toml>")
+        sys.exit(1)
+    run_manifest(sys.argv[1])
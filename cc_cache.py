@@ -0,0 +1,228 @@
+"""
+shoggoth-validation - cc_cache.py
+
+A caching wrapper around the C compiler, used when grading SER334 submissions in bulk.
+
+Every run of shoggoth-c rebuilds the test harness and support code next to the student's file, so a bulk run compiles
+the same harness translation units hundreds of times. This wrapper sits in front of gcc/cc (see
+preparation.C_BUILD_CACHE, which puts shims for them first on the autograder's PATH) and:
+- compiles each .c file to an object on its own, even when the autograder compiles and links in one command.
+- stores each object in a cache keyed by the compiler, the flags, and the hash of the preprocessed source.
+- links the objects with the original command line.
+
+The harness is therefore compiled once per autograder version (any change to its sources or headers changes the
+preprocessed hash) and each submission only compiles its own file. Compiler warnings are cached with the object and
+replayed on a hit, so the autograder sees the same output either way. Anything the wrapper does not understand (e.g.,
+dependency file generation, preprocessing only, multiple architectures) is passed through to the real compiler
+unchanged.
+
+Usage:
+    python cc_cache.py --real /usr/bin/gcc --cache <folder> -- <compiler arguments>
+    python cc_cache.py --cache <folder> --stats
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+
+SOURCE_SUFFIXES = (".c",)
+
+# arguments that are followed by a separate value.
+_ARGS_WITH_VALUE = {"-o", "-I", "-D", "-U", "-include", "-imacros", "-isystem", "-iquote", "-idirafter", "-x", "-L",
+                    "-l", "-Xlinker", "-MF", "-MT", "-MQ", "-arch"}
+
+# linker-only arguments, left out of the compile step when a one-step build is split up.
+_LINK_ONLY_PREFIXES = ("-l", "-L", "-Wl,", "-Xlinker")
+_LINK_ONLY = {"-static", "-shared", "-rdynamic", "-nostdlib", "-nodefaultlibs", "-s"}
+
+# arguments that make the wrapper step aside.
+_UNCACHEABLE = {"-E", "-S", "-", "-x", "-arch", "-save-temps", "--coverage"}
+_UNCACHEABLE_PREFIXES = ("-M", "-fprofile", "-save-temps=")
+
+
+def _split_args(args):
+    r"""
+    Splits a compiler command line into source files, the output path, and the remaining arguments (each option kept
+    together with its value).
+
+    :return: (sources, output, options), where options is a list of argument lists.
+    """
+    sources = []
+    output = None
+    options = []
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in _ARGS_WITH_VALUE and i + 1 < len(args):
+            if arg == "-o":
+                output = args[i + 1]
+            else:
+                options.append([arg, args[i + 1]])
+            i += 2
+            continue
+        if arg.startswith("-o") and len(arg) > 2:
+            output = arg[2:]
+        elif not arg.startswith("-") and arg.endswith(SOURCE_SUFFIXES):
+            sources.append(arg)
+        else:
+            options.append([arg])
+        i += 1
+
+    return sources, output, options
+
+
+def _is_cacheable(options):
+    for option in options:
+        flag = option[0]
+        if flag in _UNCACHEABLE or flag.startswith(_UNCACHEABLE_PREFIXES):
+            return False
+    return True
+
+
+def _is_link_only(option):
+    return option[0] in _LINK_ONLY or option[0].startswith(_LINK_ONLY_PREFIXES)
+
+
+def _compiler_identity(real_cc):
+    info = os.stat(real_cc)
+    return f"{os.path.realpath(real_cc)}:{info.st_size}:{info.st_mtime_ns}"
+
+
+def _record(cache_folder, outcome):
+    # one byte per compile, appended atomically, so concurrent builds can share the log.
+    with open(cache_folder + os.sep + "stats.log", "a") as f:
+        f.write(outcome)
+
+
+def compile_object(real_cc, cache_folder, source, compile_flags, object_path):
+    r"""
+    Compiles one source file to object_path, through the cache.
+
+    :return: (exit code, compiler stderr as bytes).
+    """
+    preprocessed = subprocess.run([real_cc, "-E", *compile_flags, source], capture_output=True)
+    if preprocessed.returncode != 0:
+        return preprocessed.returncode, preprocessed.stderr
+
+    key = hashlib.sha256()
+    key.update(_compiler_identity(real_cc).encode())
+    key.update(b"\0".join(arg.encode() for arg in compile_flags))
+    key.update(b"\0")
+    key.update(preprocessed.stdout)
+    digest = key.hexdigest()
+
+    entry = cache_folder + os.sep + digest[:2] + os.sep + digest
+    if os.path.exists(entry + ".o"):
+        with open(entry + ".o", "rb") as cached, open(object_path, "wb") as target:
+            target.write(cached.read())
+        with open(entry + ".stderr", "rb") as f:
+            stderr = f.read()
+        _record(cache_folder, "h")
+        return 0, stderr
+
+    compiled = subprocess.run([real_cc, "-c", *compile_flags, source, "-o", object_path], capture_output=True)
+    _record(cache_folder, "m")
+    if compiled.returncode != 0:
+        return compiled.returncode, compiled.stderr
+
+    # publish stderr before the object, since the object's presence is what marks an entry as complete.
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    for suffix, data in ((".stderr", compiled.stderr), (".o", None)):
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry), suffix=".partial")
+        with os.fdopen(fd, "wb") as f:
+            if data is None:
+                with open(object_path, "rb") as built:
+                    data = built.read()
+            f.write(data)
+        os.replace(temp_path, entry + suffix)
+
+    return 0, compiled.stderr
+
+
+def run_compiler(real_cc, cache_folder, args):
+    r"""
+    Runs one compiler command line, using the cache for every .c file it compiles.
+
+    :return: exit code.
+    """
+    sources, output, options = _split_args(args)
+
+    if not sources or not _is_cacheable(options):
+        return subprocess.run([real_cc, *args]).returncode
+
+    compile_only = ["-c"] in options
+    compile_flags = [arg for option in options if option != ["-c"] and not _is_link_only(option) for arg in option]
+
+    if compile_only:
+        if len(sources) != 1 and output is not None:
+            return subprocess.run([real_cc, *args]).returncode
+        for source in sources:
+            object_path = output or os.path.splitext(os.path.basename(source))[0] + ".o"
+            code, stderr = compile_object(real_cc, cache_folder, source, compile_flags, object_path)
+            sys.stderr.buffer.write(stderr)
+            if code != 0:
+                return code
+        return 0
+
+    # compile and link in one step: compile each source through the cache, then link the objects with the original
+    # options (so library and linker flags keep their positions relative to each other).
+    with tempfile.TemporaryDirectory(prefix="cc_cache_") as temp_folder:
+        objects = {}
+        for index, source in enumerate(sources):
+            object_path = temp_folder + os.sep + f"{index}_{os.path.splitext(os.path.basename(source))[0]}.o"
+            code, stderr = compile_object(real_cc, cache_folder, source, compile_flags, object_path)
+            sys.stderr.buffer.write(stderr)
+            if code != 0:
+                return code
+            objects[source] = object_path
+
+        link_args = [objects.get(arg, arg) for arg in args]
+        return subprocess.run([real_cc, *link_args]).returncode
+
+
+def print_stats(cache_folder):
+    entries = 0
+    size = 0
+    for root, _, files in os.walk(cache_folder):
+        for name in files:
+            if name.endswith(".o"):
+                entries += 1
+                size += os.path.getsize(root + os.sep + name)
+
+    hits = misses = 0
+    if os.path.exists(cache_folder + os.sep + "stats.log"):
+        with open(cache_folder + os.sep + "stats.log") as f:
+            log = f.read()
+        hits = log.count("h")
+        misses = log.count("m")
+
+    total = hits + misses
+    rate = 100 * hits / total if total else 0.0
+    print(f"{entries} cached objects ({size / 1024 / 1024:.1f} MiB), {hits} hits / {misses} misses ({rate:.1f}%).")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Caching C compiler wrapper for bulk grading.")
+    parser.add_argument("--real", help="path of the real compiler")
+    parser.add_argument("--cache", required=True, help="cache folder")
+    parser.add_argument("--stats", action="store_true", help="print cache statistics and exit")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="compiler arguments, after --")
+    parsed = parser.parse_args(argv)
+
+    if parsed.stats:
+        print_stats(parsed.cache)
+        return 0
+
+    args = parsed.args[1:] if parsed.args[:1] == ["--"] else parsed.args
+    os.makedirs(parsed.cache, exist_ok=True)
+    return run_compiler(parsed.real, parsed.cache, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
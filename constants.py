@@ -13,4 +13,7 @@ FOLDER_VISUALS = "visuals"
 
 # subfolders
 FOLDER_SUBMISSIONS = FOLDER_DATA_ORIGINAL + os.sep + "submissions"
-FOLDER_EVALUATIONS = FOLDER_DATA_PROCESSED + os.sep + "evaluations"
\ No newline at end of file
+FOLDER_EVALUATIONS = FOLDER_DATA_PROCESSED + os.sep + "evaluations"
+FOLDER_RUNS = FOLDER_DATA_PROCESSED + os.sep + "runs"
+FILE_RESULTS_DB = FOLDER_DATA_PROCESSED + os.sep + "results.sqlite"
+FOLDER_SCORE_ARCHIVE = FOLDER_DATA_PROCESSED + os.sep + "score_archive"
@@ -0,0 +1,379 @@
+"""
+shoggoth-validation - grading_queue.py
+
+A work queue for spreading run_shoggoth_bulk over several processes or machines.
+
+The queue is a single SQLite file, normally placed on storage that every grading machine can reach. Each submission
+becomes one job row. Workers claim a job by taking a time-limited lease on it, keep the lease alive with heartbeats
+while the autograder runs, and post the autograder's JSON back into the row. If a worker crashes, its lease expires and
+the job is handed to the next worker that asks, up to a fixed number of attempts.
+
+Each worker grades with its own local autograder install (configured at the top of preparation.py), so run at most one
+worker per install. The typical workflow is:
+1) python grading_queue.py enqueue queue.db ser334 C data_original/ser334_config_m2.json 24sc
+2) On every grading machine: python grading_queue.py work queue.db
+3) python grading_queue.py export queue.db    (writes the evaluation JSON files used by analysis.py)
+
+SQLite's rollback journal is used rather than WAL, since WAL does not work over network filesystems.
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import preparation
+import result_sink
+from preparation import Language
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY,
+    course        TEXT NOT NULL,
+    semester      TEXT NOT NULL,
+    module        TEXT NOT NULL,
+    lang          TEXT NOT NULL,
+    config_file   TEXT NOT NULL,
+    filename      TEXT NOT NULL,
+    status        TEXT NOT NULL DEFAULT 'pending',  -- pending, leased, done, failed
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    max_attempts  INTEGER NOT NULL DEFAULT 3,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    heartbeat_at  REAL,
+    result        TEXT,
+    log           TEXT,
+    error         TEXT,
+    created_at    REAL NOT NULL,
+    finished_at   REAL,
+    UNIQUE (course, semester, module, filename)
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, lease_expires);
+"""
+
+
+class GradingQueue:
+    r"""
+    Job table operations. Every state change is a single short transaction, so any number of workers can share the
+    file; claims use BEGIN IMMEDIATE so two workers never lease the same job.
+    """
+
+    def __init__(self, path, busy_timeout=60.0):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()  # the heartbeat thread shares this connection.
+        self._conn.executescript(SCHEMA)
+        # queues created before the autograder log was stored with the result.
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "log" not in columns:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN log TEXT")
+
+    def close(self):
+        self._conn.close()
+
+    def enqueue(self, course, lang, config_file, semester, max_attempts=3):
+        r"""
+        Adds one job per submission in the assignment's _2patched folder. Submissions that already have a job are left
+        alone, so enqueueing again after adding files is safe.
+
+        :return: number of new jobs.
+        """
+        setup = preparation.load_shoggoth_setup(course, lang, config_file, semester)
+        module = setup["config"]["module"]
+        now = time.time()
+        rows = [(course, semester, module, lang.name, config_file, filename, max_attempts, now)
+                for filename in sorted(preparation.list_submissions(setup["input_folder"]))]
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO jobs (course, semester, module, lang, config_file, filename,"
+                                   " max_attempts, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            return self._conn.total_changes - before
+
+    def claim(self, worker_id, lease_seconds):
+        r"""
+        Leases the oldest pending job, or a leased job whose lease has expired (its worker is presumed dead). Expired
+        jobs that are out of attempts are marked failed instead.
+
+        :return: the claimed job row, or None if nothing is available.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("UPDATE jobs SET status = 'failed', error = 'lease expired on final attempt', "
+                                   "finished_at = ? WHERE status = 'leased' AND lease_expires < ? "
+                                   "AND attempts >= max_attempts", (now, now))
+                job = self._conn.execute("SELECT * FROM jobs WHERE status = 'pending' "
+                                         "OR (status = 'leased' AND lease_expires < ?) "
+                                         "ORDER BY id LIMIT 1", (now,)).fetchone()
+                if job is not None:
+                    self._conn.execute("UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                                       "heartbeat_at = ?, attempts = attempts + 1 WHERE id = ?",
+                                       (worker_id, now + lease_seconds, now, job["id"]))
+                    job = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job["id"],)).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return job
+
+    def heartbeat(self, job_id, worker_id, lease_seconds):
+        r"""
+        Extends a lease. Returns False if the lease was lost (expired and taken over by another worker).
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute("UPDATE jobs SET lease_expires = ?, heartbeat_at = ? "
+                                        "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                                        (now + lease_seconds, now, job_id, worker_id))
+        return cursor.rowcount == 1
+
+    def complete(self, job_id, worker_id, result_json, log=None):
+        r"""
+        Stores the autograder's JSON output for a job. Ignored if the lease has since passed to another worker.
+
+        :param log: The autograder's console output (the *_stdout.txt of C jobs), if any.
+        """
+        with self._lock:
+            cursor = self._conn.execute("UPDATE jobs SET status = 'done', result = ?, log = ?, error = NULL, "
+                                        "finished_at = ?, lease_expires = NULL "
+                                        "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                                        (result_json, log, time.time(), job_id, worker_id))
+        return cursor.rowcount == 1
+
+    def fail(self, job_id, worker_id, error, retry=True):
+        r"""
+        Records a failed attempt. The job goes back to pending unless it is out of attempts or retry is False.
+        """
+        with self._lock:
+            cursor = self._conn.execute("UPDATE jobs SET status = CASE WHEN ? AND attempts < max_attempts "
+                                        "THEN 'pending' ELSE 'failed' END, error = ?, lease_expires = NULL, "
+                                        "finished_at = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                                        (int(retry), error, time.time(), job_id, worker_id))
+        return cursor.rowcount == 1
+
+    def requeue_failed(self):
+        r"""
+        Resets failed jobs to pending with a fresh set of attempts (e.g., after fixing an autograder problem).
+        """
+        with self._lock:
+            cursor = self._conn.execute("UPDATE jobs SET status = 'pending', attempts = 0, error = NULL "
+                                        "WHERE status = 'failed'")
+        return cursor.rowcount
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def finished_jobs(self):
+        with self._lock:
+            return self._conn.execute("SELECT * FROM jobs WHERE status = 'done' ORDER BY id").fetchall()
+
+
+class _Heartbeat(threading.Thread):
+    r"""
+    Keeps a job's lease alive while the autograder runs.
+    """
+
+    def __init__(self, queue, job_id, worker_id, lease_seconds):
+        super().__init__(daemon=True)
+        self._queue = queue
+        self._job_id = job_id
+        self._worker_id = worker_id
+        self._lease_seconds = lease_seconds
+        # not _stop: threading.Thread.join() calls a private _stop() method.
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self._lease_seconds / 3):
+            if not self._queue.heartbeat(self._job_id, self._worker_id, self._lease_seconds):
+                return
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_worker(queue_path, worker_id=None, lease_seconds=600, poll_seconds=10.0, exit_when_idle=True):
+    r"""
+    Claims and grades jobs until the queue is empty (or forever, if exit_when_idle is False).
+
+    :param queue_path: Path of the SQLite queue file.
+    :param worker_id: Name recorded on leases. Defaults to host:pid.
+    :param lease_seconds: How long a lease lasts without a heartbeat; should comfortably exceed one heartbeat interval
+                          (a third of the lease) plus any stall on the shared filesystem.
+    :param poll_seconds: How long to wait before asking again when no job is available.
+    :param exit_when_idle: Stop once no job is available instead of polling.
+    :return: number of jobs this worker completed.
+    """
+    worker_id = worker_id or default_worker_id()
+    queue = GradingQueue(queue_path)
+    setups = {}
+    project_folders = {}
+    completed = 0
+
+    print(f"run_worker({worker_id}):")
+
+    try:
+        while True:
+            job = queue.claim(worker_id, lease_seconds)
+            if job is None:
+                if exit_when_idle:
+                    break
+                time.sleep(poll_seconds)
+                continue
+
+            print(f"Processing {job['course']}_{job['semester']}_{job['module']}/{job['filename']} "
+                  f"(attempt {job['attempts']})")
+
+            key = (job["course"], job["lang"], job["config_file"], job["semester"])
+            if key not in setups:
+                setups[key] = preparation.load_shoggoth_setup(job["course"], Language[job["lang"]],
+                                                              job["config_file"], job["semester"])
+                project_folders[key] = preparation.open_project_folder(setups[key])
+            setup = setups[key]
+
+            heartbeat = _Heartbeat(queue, job["id"], worker_id, lease_seconds)
+            heartbeat.start()
+            try:
+                if not preparation.stage_submission(setup, project_folders[key], job["filename"]):
+                    queue.fail(job["id"], worker_id, "submission rejected during staging", retry=False)
+                    continue
+
+                with tempfile.TemporaryDirectory(prefix="shoggoth_job_") as scratch:
+                    output_path = scratch + os.sep + preparation.evaluation_filename(job["filename"])
+                    graded = preparation.run_autograder(setup, output_path)
+                    if graded["status"] == "timeout":
+                        # most likely an infinite loop in the submission, so another attempt would only time out again.
+                        queue.fail(job["id"], worker_id, f"timed out after {graded['grade']['wall_s']:.0f} s",
+                                   retry=False)
+                        continue
+                    if graded["status"] != "ok":
+                        queue.fail(job["id"], worker_id, f"autograder produced {graded['status']} output")
+                        continue
+                    with open(output_path) as f:
+                        result_json = f.read()  # already validated by run_autograder.
+                    # the scratch folder is deleted below, so the C console log travels with the result.
+                    log_path = os.path.splitext(output_path)[0] + "_stdout.txt"
+                    log = None
+                    if os.path.exists(log_path):
+                        with open(log_path) as f:
+                            log = f.read()
+
+                if queue.complete(job["id"], worker_id, result_json, log):
+                    completed += 1
+                else:
+                    print("  Lease was lost before completion, result discarded.")
+            except Exception as e:
+                print(f"  Failed: {e!r}")
+                queue.fail(job["id"], worker_id, repr(e))
+            finally:
+                heartbeat.stop()
+    finally:
+        for key, project_folder in project_folders.items():
+            if setups[key]["lang"] == Language.C:
+                project_folder.cleanup()
+        queue.close()
+
+    print(f"  Completed {completed} jobs.")
+    return completed
+
+
+def export_results(queue_path, overwrite=False):
+    r"""
+    Writes the posted result of every finished job to its usual evaluation path (see run_shoggoth_bulk), so analysis.py
+    can read them, and publishes it to the results database. C jobs also get their console log back as *_stdout.txt
+    next to the evaluation, as run_shoggoth_bulk leaves it.
+
+    :return: number of files written.
+    """
+    queue = GradingQueue(queue_path)
+    sink = result_sink.ResultSink()
+    written = 0
+    try:
+        for job in queue.finished_jobs():
+            output_folder = (preparation.constants.FOLDER_EVALUATIONS + os.sep
+                             + f"{job['course']}_{job['semester']}_{job['module']}")
+            output_path = output_folder + os.sep + preparation.evaluation_filename(job["filename"])
+            if os.path.exists(output_path) and not overwrite:
+                continue
+            os.makedirs(output_folder, exist_ok=True)
+            result_sink.write_text_atomic(output_path, job["result"])
+            if job["log"] is not None:
+                result_sink.write_text_atomic(os.path.splitext(output_path)[0] + "_stdout.txt", job["log"])
+            uid = os.path.splitext(preparation.evaluation_filename(job["filename"]))[0]
+            sink.publish(job["course"], job["semester"], job["module"], uid, json.loads(job["result"]))
+            written += 1
+    finally:
+        sink.close()
+        queue.close()
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQLite-backed grading work queue for shoggoth.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="add one job per submission of an assignment")
+    enqueue_parser.add_argument("queue")
+    enqueue_parser.add_argument("course")
+    enqueue_parser.add_argument("lang", choices=[lang.name for lang in Language])
+    enqueue_parser.add_argument("config_file")
+    enqueue_parser.add_argument("semester")
+    enqueue_parser.add_argument("--max-attempts", type=int, default=3)
+
+    work_parser = subparsers.add_parser("work", help="claim and grade jobs")
+    work_parser.add_argument("queue")
+    work_parser.add_argument("--worker-id")
+    work_parser.add_argument("--lease-seconds", type=float, default=600)
+    work_parser.add_argument("--forever", action="store_true", help="keep polling when the queue is empty")
+
+    status_parser = subparsers.add_parser("status", help="show job counts by status")
+    status_parser.add_argument("queue")
+
+    retry_parser = subparsers.add_parser("retry", help="send failed jobs back to pending")
+    retry_parser.add_argument("queue")
+
+    export_parser = subparsers.add_parser("export", help="write finished results as evaluation JSON files")
+    export_parser.add_argument("queue")
+    export_parser.add_argument("--overwrite", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "enqueue":
+        queue = GradingQueue(args.queue)
+        added = queue.enqueue(args.course, Language[args.lang], args.config_file, args.semester, args.max_attempts)
+        queue.close()
+        print(f"Added {added} jobs.")
+    elif args.command == "work":
+        run_worker(args.queue, args.worker_id, args.lease_seconds, exit_when_idle=not args.forever)
+    elif args.command == "status":
+        queue = GradingQueue(args.queue)
+        print(queue.counts())
+        queue.close()
+    elif args.command == "retry":
+        queue = GradingQueue(args.queue)
+        print(f"Requeued {queue.requeue_failed()} jobs.")
+        queue.close()
+    else:
+        print(f"Wrote {export_results(args.queue, args.overwrite)} evaluation files.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,6 +11,9 @@ The most common task is to generate JSON for a folder of submissions. The typica
 3) Make any needed corrections to the files in module_2patched.
 4) Run run_shoggoth_bulk to run the local shoggoth to generate JSON for all submissions.
 
+Alternatively, leave watch_shoggoth_bulk running during step 3; it regrades each file in module_2patched as soon as it
+is saved.
+
 where module is a placeholder for something more speific like (ser334_24sc_m2).
 
 See main for an example.
@@ -23,13 +26,18 @@ import glob
 import os
 import platform
 import shutil
+import signal
 import sys
 import subprocess
+import threading
 import json
+import tempfile
+import time
 import zipfile
 from enum import Enum
 
 import constants
+import result_sink
 
 # LOCAL CONFIGURATION
 if platform.system() == "Windows":
@@ -42,12 +50,217 @@ else:
     print(f"Unsupported OS found: {platform.system()}")
     exit()
 
+# Optional scratch location (ideally tmpfs, e.g., /dev/shm) for the C project folder. When set, each submission gets a
+# fresh directory here and the autograder's project folder is swapped to point at it, instead of being emptied file by
+# file. Leave as None to keep the project folder on disk.
+FOLDER_SCRATCH = None
+
+# Optional cache folder for compiled C objects (see cc_cache.py). When set, the SER334 autograder runs with gcc/cc shims
+# first on its PATH, so the harness is compiled once instead of once per submission. Leave as None to compile normally.
+C_BUILD_CACHE = None
+
+# Limits applied to .zip submissions before anything is extracted (guards against zip bombs).
+MAX_ZIP_MEMBER_BYTES = 8 * 1024 * 1024      # uncompressed size of any one required file.
+MAX_ZIP_TOTAL_BYTES = 32 * 1024 * 1024      # uncompressed size of all required files together.
+
+# ioctl request number for FICLONE (copy-on-write clone of a whole file) on Linux.
+_FICLONE = 0x40049409
+
 
 class Language(Enum):
     JAVA = 1    # only tested on Windows
     C = 2       # only tested on Linux
 
 
+# Wall-clock limit for one autograder run, in seconds. Runs that exceed it are killed (e.g., a submission stuck in an
+# infinite loop) and recorded as timeouts in the run manifest.
+GRADING_TIMEOUT_SECONDS = {Language.JAVA: 300, Language.C: 120}
+
+
+def _reflink(source_path, target_path):
+    r"""
+    Attempts a copy-on-write clone of source_path into a new target_path. Only works on Linux filesystems that support
+    FICLONE (e.g., btrfs, XFS), and only within one filesystem.
+
+    :return: True if the clone was made, False otherwise (target_path is left absent).
+    """
+    if platform.system() != "Linux":
+        return False
+
+    import fcntl
+
+    try:
+        with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        if os.path.exists(target_path):
+            os.remove(target_path)
+        return False
+
+
+def stage_file(source_path, target_path, allow_hardlink=True):
+    r"""
+    Places the contents of source_path at target_path without copying data when the filesystem allows it. Tries a
+    copy-on-write reflink first, then a hardlink, and only falls back to shutil.copy when neither is possible. Any
+    existing target is replaced.
+
+    A hardlinked target shares storage with its source, so edits to one show up in the other. Only allow hardlinks when
+    the target is read-only in practice (e.g., staging a submission for the autograder to compile).
+
+    :param source_path: File to stage.
+    :param target_path: Destination path.
+    :param allow_hardlink: Whether a hardlink is an acceptable way to stage the file.
+    """
+    if os.path.lexists(target_path):
+        os.remove(target_path)
+
+    if _reflink(source_path, target_path):
+        return
+
+    if allow_hardlink:
+        try:
+            os.link(source_path, target_path)
+            return
+        except OSError:
+            pass  # cross-device, unsupported filesystem, or not permitted.
+
+    shutil.copy(source_path, target_path)
+
+
+class ProjectFolder:
+    r"""
+    The autograder folder that receives each submission's source files. reset() hands out an empty folder for the next
+    submission by swapping directories rather than deleting the previous contents file by file:
+      - without FOLDER_SCRATCH, the old folder is renamed into a sibling trash folder and a new one is created.
+      - with FOLDER_SCRATCH, the project path becomes a symlink that is repointed at a fresh scratch directory.
+    Everything swapped out is removed in one pass by cleanup(), which also leaves a real, empty project folder behind.
+    """
+
+    def __init__(self, path, scratch_root=None):
+        self.path = path
+        self.scratch_root = scratch_root
+        self._trash = path + ".trash"
+        self._swapped = 0
+        self._scratch_dirs = []
+
+    def reset(self):
+        if self.scratch_root:
+            self._reset_scratch()
+        else:
+            self._reset_in_place()
+
+    def _reset_in_place(self):
+        if os.path.isdir(self.path) and not os.path.islink(self.path):
+            os.makedirs(self._trash, exist_ok=True)
+            try:
+                os.replace(self.path, self._trash + os.sep + str(self._swapped))
+                self._swapped += 1
+            except OSError:
+                # fall back to emptying the folder (e.g., Windows with a file open in the folder).
+                for file_path in glob.glob(self.path + os.sep + "*"):
+                    if os.path.isdir(file_path):
+                        shutil.rmtree(file_path)
+                    else:
+                        os.remove(file_path)
+                return
+        os.makedirs(self.path, exist_ok=True)
+
+    def _reset_scratch(self):
+        fresh = tempfile.mkdtemp(prefix="shoggoth_", dir=self.scratch_root)
+        self._scratch_dirs.append(fresh)
+
+        if os.path.isdir(self.path) and not os.path.islink(self.path):
+            # first use: move the real folder aside so the path can become a symlink.
+            os.makedirs(self._trash, exist_ok=True)
+            os.replace(self.path, self._trash + os.sep + str(self._swapped))
+            self._swapped += 1
+
+        # build the new link next to the old one and rename it over, so the swap is atomic.
+        next_link = self.path + ".next"
+        if os.path.lexists(next_link):
+            os.remove(next_link)
+        os.symlink(fresh, next_link, target_is_directory=True)
+        os.replace(next_link, self.path)
+
+        # scratch directories from earlier submissions are no longer reachable; drop them right away.
+        for old in self._scratch_dirs[:-1]:
+            shutil.rmtree(old, ignore_errors=True)
+        self._scratch_dirs = self._scratch_dirs[-1:]
+
+    def cleanup(self):
+        if os.path.islink(self.path):
+            os.remove(self.path)
+        for old in self._scratch_dirs:
+            shutil.rmtree(old, ignore_errors=True)
+        self._scratch_dirs = []
+
+        if os.path.exists(self._trash):
+            shutil.rmtree(self._trash, ignore_errors=True)
+
+        os.makedirs(self.path, exist_ok=True)
+
+
+def unpack_submission_zip(zip_path, target_folder, files_required):
+    r"""
+    Streams the required files of a .zip submission into target_folder. The archive's central directory is scanned
+    once: members are matched to files_required by basename, so files nested in folders (e.g., src/Main.java or a
+    top-level project folder) are still found. When a basename appears more than once, the shallowest member wins.
+    Everything else is skipped and nothing but the selected members is decompressed.
+
+    Sizes are checked from the central directory before any data is read, and the archive is rejected if a required
+    member or the required members together exceed MAX_ZIP_MEMBER_BYTES / MAX_ZIP_TOTAL_BYTES.
+
+    :param zip_path: Path of the .zip submission.
+    :param target_folder: Folder the required files are written to (flattened to their basenames).
+    :param files_required: File names the autograder expects.
+    :return: dictionary with the selected member names, skipped member names, missing required files, total
+             uncompressed bytes written, and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    required = set(files_required)
+    chosen = {}  # basename -> (folder depth, ZipInfo)
+    skipped = []
+
+    with zipfile.ZipFile(zip_path, "r") as zipf:
+        for info in zipf.infolist():
+            if info.is_dir():
+                continue
+
+            member_name = info.filename.replace("\\", "/")
+            basename = member_name.rsplit("/", 1)[-1]
+            depth = member_name.count("/")
+
+            if basename not in required or member_name.startswith("__MACOSX/"):
+                skipped.append(info.filename)
+            elif basename not in chosen:
+                chosen[basename] = (depth, info)
+            elif depth < chosen[basename][0]:
+                skipped.append(chosen[basename][1].filename)
+                chosen[basename] = (depth, info)
+            else:
+                skipped.append(info.filename)
+
+        chosen = {basename: info for basename, (_, info) in chosen.items()}
+
+        total_bytes = sum(info.file_size for info in chosen.values())
+        for info in chosen.values():
+            if info.file_size > MAX_ZIP_MEMBER_BYTES:
+                raise ValueError(f"{info.filename} expands to {info.file_size} bytes (limit {MAX_ZIP_MEMBER_BYTES}).")
+        if total_bytes > MAX_ZIP_TOTAL_BYTES:
+            raise ValueError(f"required files expand to {total_bytes} bytes (limit {MAX_ZIP_TOTAL_BYTES}).")
+
+        for basename, info in chosen.items():
+            with zipf.open(info) as src, open(target_folder + os.sep + basename, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    return {"selected": [info.filename for info in chosen.values()],
+            "skipped": skipped,
+            "missing": sorted(required - set(chosen)),
+            "bytes": total_bytes,
+            "seconds": time.perf_counter() - start}
+
+
 def rename_canvas_submission_files(input_folder, output_folder):
     r"""
     This function converts the default Canvas files into the simpler form listed in the assignment. Trims the prefix and
@@ -73,30 +286,17 @@ def rename_canvas_submission_files(input_folder, output_folder):
             print(f"target file name {new_name} already exists.")
             continue
 
-        shutil.copy(input_folder + os.sep + filename, output_folder + os.sep + new_name)
+        # renamed files get patched by hand later, so never hardlink them to the raw originals.
+        stage_file(input_folder + os.sep + filename, output_folder + os.sep + new_name, allow_hardlink=False)
 
 
-def run_shoggoth_bulk(course, lang, config_file, semester):
+def load_shoggoth_setup(course, lang, config_file, semester):
     r"""
-    Runs a local installation of a shoggoth java or c autograder on a folder of submissions and saves the results in
-    JSON. Supports either single source file submission or .zip containers.
-
-    For this to function, there must a local copy of the shoggoth autograder. Its location has to be configured at the
-    top of this file.
-
-    There must also be a folder of submissions at:
-        constants.FOLDER_SUBMISSIONS + os.sep + "{course}_{semester}_{module}_2patched"
-    For example:
-        data_original\submissions\ser334_24sc_m2_2patched
+    Resolves everything needed to run shoggoth on one assignment: the autograder config and the submission, evaluation,
+    and autograder folders. See run_shoggoth_bulk for the expected folder layout.
 
-    :param course: Short name for the course.
-    :param lang: the programming used for the assignment.
-    :param config_file: Config from autograder.
-    :param semester: Semester ID for data (e.g., 24sc).
+    :return: dictionary with the config and the resolved folders.
     """
-
-    print("run_shoggoth_bulk:")
-
     with open(config_file) as file:
         config = json.load(file)
 
@@ -119,87 +319,516 @@ def run_shoggoth_bulk(course, lang, config_file, semester):
     if "files_optional" in config and len(config["files_optional"]) > 0:
         raise Exception("run_shoggoth_bulk() does not support optional files.")
 
-    # check if output folder exists
-    if not os.path.exists(output_folder):
-        os.mkdir(output_folder)
+    return {"course": course,
+            "lang": lang,
+            "semester": semester,
+            "config_file": config_file,
+            "config": config,
+            "input_folder": input_folder,
+            "output_folder": output_folder,
+            "autograder_root": autograder_root,
+            "autograder_src": autograder_src}
+
+
+def open_project_folder(setup):
+    r"""
+    Makes sure the autograder's project folder exists and wraps it in a ProjectFolder. Call cleanup() on the result
+    when done grading (only matters for C, where the folder is swapped per submission).
+    """
+    autograder_src = setup["autograder_src"]
 
     # check if target folder for submission source code exists
+    if os.path.islink(autograder_src) and not os.path.exists(autograder_src):
+        os.remove(autograder_src)  # dangling link left by an interrupted run that used FOLDER_SCRATCH.
     if not os.path.exists(autograder_src):
         os.mkdir(autograder_src)
 
-    for filename in os.listdir(input_folder):
-        if not (".java" in filename or ".c" in filename or ".zip" in filename):
+    return ProjectFolder(autograder_src, FOLDER_SCRATCH if setup["lang"] == Language.C else None)
+
+
+def list_submissions(input_folder):
+    r"""
+    Lists the submission files (single source files or .zip containers) in a folder of submissions.
+    """
+    return [f for f in os.listdir(input_folder) if ".java" in f or ".c" in f or ".zip" in f]
+
+
+def evaluation_filename(submission_filename):
+    r"""
+    Maps a submission file name to the name of its JSON evaluation (e.g., smith.c -> smith.json).
+    """
+    return submission_filename.split(".")[0] + ".json"
+
+
+def stage_submission(setup, project_folder, filename):
+    r"""
+    Places one submission's source files in the autograder's project folder.
+
+    :return: True if the submission is ready to grade, False if it was rejected.
+    """
+    config = setup["config"]
+    autograder_src = setup["autograder_src"]
+    submission_path = setup["input_folder"] + os.sep + filename
+
+    # hand the autograder an empty project folder.
+    if setup["lang"] == Language.C:
+        project_folder.reset()
+
+    if ".java" in filename or ".c" in filename:
+        target_file_path = autograder_src + os.sep + config["files_required"][0]
+        stage_file(submission_path, target_file_path)
+        return True
+
+    # must be .zip
+
+    # remove existing files. to ensure that all files are refreshed (even if zip is incomplete).
+    for required_file in config["files_required"]:
+        expected_file = autograder_src + os.sep + required_file
+
+        if os.path.exists(expected_file):
+            os.remove(expected_file)
+
+    # extract only the required files into the project folder.
+    try:
+        unpacked = unpack_submission_zip(submission_path, autograder_src, config["files_required"])
+    except (ValueError, zipfile.BadZipFile) as e:
+        print(f"  Rejected ZIP, skipping submission: {e}")
+        return False
+
+    if len(unpacked["skipped"]):
+        print(f"  Skipping {len(unpacked['skipped'])} files in ZIP ({unpacked['skipped']}).")
+    if len(unpacked["missing"]):
+        print(f"  Missing required files in ZIP: {unpacked['missing']}.")
+    print(f"  Unpacked {len(unpacked['selected'])} files ({unpacked['bytes']} bytes) in "
+          f"{unpacked['seconds'] * 1000:.1f} ms.")
+    return True
+
+
+def _run_measured(args, cwd, stdout, timeout, shell=False, env=None):
+    r"""
+    Runs a command to completion (or until timeout) and measures it. On POSIX the child is reaped with os.wait4, which
+    reports the CPU time and peak RSS of the child together with everything it waited on (e.g., the compiler and test
+    binaries started by the autograder). Elsewhere only wall time is available.
+
+    :return: dictionary with returncode, timed_out, wall_s, cpu_user_s, cpu_sys_s, and peak_rss_kb.
+    """
+    posix = os.name == "posix"
+    start = time.perf_counter()
+    # on POSIX, give the child its own process group so a timeout also kills anything it started.
+    p = subprocess.Popen(args, shell=shell, cwd=cwd, stdout=stdout, env=env, start_new_session=posix)
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        try:
+            if posix:
+                os.killpg(p.pid, signal.SIGKILL)
+            else: # kill the whole tree, since with shell=True the direct child is only cmd.exe.
+                subprocess.run(["taskkill", "/F", "/T", "/PID", str(p.pid)], capture_output=True)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer:
+        timer.start()
+
+    try:
+        if posix:
+            _, status, usage = os.wait4(p.pid, 0)
+            p.returncode = os.waitstatus_to_exitcode(status)
+        else:
+            p.wait()
+            usage = None
+    finally:
+        if timer:
+            timer.cancel()
+
+    measured = {"returncode": p.returncode,
+                "timed_out": timed_out.is_set(),
+                "wall_s": time.perf_counter() - start,
+                "cpu_user_s": None,
+                "cpu_sys_s": None,
+                "peak_rss_kb": None}
+
+    if usage is not None:
+        measured["cpu_user_s"] = usage.ru_utime
+        measured["cpu_sys_s"] = usage.ru_stime
+        # ru_maxrss is in kilobytes on Linux but bytes on macOS.
+        measured["peak_rss_kb"] = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+    return measured
+
+
+def _compiler_cache_env():
+    r"""
+    Builds the environment for the C autograder when C_BUILD_CACHE is set: shims named gcc, cc, and clang are written to
+    C_BUILD_CACHE/bin and put first on PATH, each forwarding to cc_cache.py with the real compiler it replaces. This
+    works however the autograder starts the compiler, as long as it finds it through PATH.
+
+    :return: environment dictionary, or None to inherit the current one.
+    """
+    if C_BUILD_CACHE is None:
+        return None
+
+    cache_folder = os.path.abspath(C_BUILD_CACHE)
+    shim_folder = cache_folder + os.sep + "bin"
+    os.makedirs(shim_folder, exist_ok=True)
+    wrapper = os.path.dirname(os.path.abspath(__file__)) + os.sep + "cc_cache.py"
+
+    # look up the real compilers with the shims out of the way.
+    search_path = os.pathsep.join(p for p in os.environ.get("PATH", "").split(os.pathsep)
+                                  if os.path.abspath(p) != shim_folder)
+
+    for name in ("gcc", "cc", "clang"):
+        real_cc = shutil.which(name, path=search_path)
+        if real_cc is None:
             continue
+        shim_path = shim_folder + os.sep + name
+        with open(shim_path, "w") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{wrapper}" --real "{real_cc}" --cache "{cache_folder}" -- "$@"\n')
+        os.chmod(shim_path, 0o755)
 
-        print ("Processing " + filename)
-        output_filename = filename.split(".")[0] + ".json"
+    env = dict(os.environ)
+    env["PATH"] = shim_folder + os.pathsep + search_path
+    return env
 
-        #clean the project folder of existing files.
-        if lang == Language.C:
-            existing_files = glob.glob(autograder_src + os.sep + "*")
-            for file_path in existing_files:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
 
-        if ".java" in filename or ".c" in filename:
-            target_file_path = autograder_src + os.sep + config["files_required"][0]
+def run_autograder(setup, output_path, timeout=None):
+    r"""
+    Runs the autograder on whatever is currently staged in the project folder and writes its JSON result to
+    output_path. For C, the human-readable console output is also kept next to it as *_stdout.txt.
 
-            if os.path.exists(target_file_path):
-                os.remove(target_file_path)
+    shoggoth compiles and tests in one process, so both are measured together as the "grade" phase; "collect" covers
+    validating the JSON result and getting it into place. The result is only written (atomically) once it has been
+    validated against the suite, so a run that times out, crashes, or produces incomplete output leaves no file at
+    output_path and is retried on the next pass. Invalid output is kept next to it as *_invalid.txt for inspection.
 
-            shutil.copy(input_folder + os.sep + filename, target_file_path)
-        else: # must be .zip
+    :param timeout: Wall-clock limit in seconds. Defaults to GRADING_TIMEOUT_SECONDS for the language.
+    :return: dictionary with status (ok, timeout, no_result, or invalid), the validated evaluation (or None), the grade
+             phase's measurements, and collect_s.
+    """
+    autograder_root = setup["autograder_root"]
+    if timeout is None:
+        timeout = GRADING_TIMEOUT_SECONDS[setup["lang"]]
 
-            # remove existing files. to ensure that all files are refreshed (even if zip is incomplete).
-            for required_file in config["files_required"]:
-                expected_file = autograder_src + os.sep + required_file
+    stem = os.path.splitext(output_path)[0]
+    text = None
 
-                if os.path.exists(expected_file):
-                    os.remove(expected_file)
+    if setup["lang"] == Language.JAVA:
+        # the console output of shoggoth-java is the JSON result, so capture it away from the final output path.
+        with tempfile.TemporaryFile("w+") as output_stream:
+            arg = "mvn -q compile exec:java" # force recompile so that tests don't run with previous bins.
+            grade = _run_measured(arg, autograder_root, output_stream, timeout, shell=True)
 
-            # extract files into target file. probably check if all are there
-            with zipfile.ZipFile(input_folder + os.sep +filename, 'r') as zipf:
-                compressed_files = zipf.namelist()
-                selected_files = [x for x in compressed_files if x in config["files_required"]]
-                skipped_files = [x for x in compressed_files if x not in config["files_required"]]
+            start = time.perf_counter()
+            output_stream.seek(0)
+            if not grade["timed_out"]:
+                text = output_stream.read()
 
-                if len(skipped_files):
-                    print(f"  Skipping {len(skipped_files)} files in ZIP ({skipped_files}).")
+    else: # C
+        # the console output of shoggoth-c is the human-readable test summery.
+        log_path = stem + "_stdout.txt"
+
+        # shoggoth-c saves the results to a separate JSON file. it is the same file for every run of this install, so
+        # read it straight away rather than copying it around.
+        results_path = FOLDER_SER334_AUTOGRADERS + os.sep + "results" + os.sep + "results.json"
+
+        if os.path.exists(results_path):
+            os.remove(results_path)
+
+        with open(log_path, "w") as output_stream:
+            arg = [sys.executable, "main.py"]
+            grade = _run_measured(arg, autograder_root, output_stream, timeout, env=_compiler_cache_env())
+
+        start = time.perf_counter()
+        if not grade["timed_out"] and os.path.exists(results_path):
+            with open(results_path) as f:
+                text = f.read()
+
+    evaluation = None
+    if grade["timed_out"]:
+        status = "timeout"
+    elif not text:
+        status = "no_result"
+    else:
+        try:
+            evaluation = result_sink.parse_evaluation(text, result_sink.expected_test_numbers(setup["config"]))
+            result_sink.write_text_atomic(output_path, text)
+            status = "ok"
+        except ValueError as e:
+            print(f"  Rejected autograder output: {e}")
+            with open(stem + "_invalid.txt", "w") as f:
+                f.write(text)
+            status = "invalid"
+    collect_s = time.perf_counter() - start
+
+    return {"status": status, "evaluation": evaluation, "grade": grade, "collect_s": collect_s}
+
+
+def _new_run_record(filename):
+    return {"filename": filename,
+            "status": "skipped",
+            "stage_s": None,
+            "grade_s": None,
+            "collect_s": None,
+            "total_s": None,
+            "returncode": None,
+            "grade_cpu_user_s": None,
+            "grade_cpu_sys_s": None,
+            "peak_rss_kb": None}
+
+
+def grade_submission(setup, project_folder, filename, output_path, timeout=None, sink=None):
+    r"""
+    Stages one submission, runs the autograder on it, and writes its JSON result to output_path. If a
+    result_sink.ResultSink is given, a successful result is also published to it.
 
-                zipf.extractall(autograder_src, members=selected_files)
+    :return: run record for the submission, as written to the run manifest.
+    """
+    record = _new_run_record(filename)
+
+    start = time.perf_counter()
+    staged = stage_submission(setup, project_folder, filename)
+    record["stage_s"] = time.perf_counter() - start
+
+    if not staged:
+        record["status"] = "rejected"
+    else:
+        result = run_autograder(setup, output_path, timeout)
+        grade = result["grade"]
+        record.update(status=result["status"],
+                      grade_s=grade["wall_s"],
+                      collect_s=result["collect_s"],
+                      returncode=grade["returncode"],
+                      grade_cpu_user_s=grade["cpu_user_s"],
+                      grade_cpu_sys_s=grade["cpu_sys_s"],
+                      peak_rss_kb=grade["peak_rss_kb"])
+        if result["status"] != "ok":
+            print(f"  Autograder {result['status']} after {grade['wall_s']:.1f} s.")
+        elif sink is not None:
+            uid = os.path.splitext(os.path.basename(output_path))[0]
+            sink.publish(setup["course"], setup["semester"], setup["config"]["module"], uid, result["evaluation"])
+
+    record["total_s"] = time.perf_counter() - start
+    return record
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def summarize_run(records, slowest=5):
+    r"""
+    Prints an end-of-run summary of a grading run: outcome counts, throughput, and the slowest submissions.
 
-        output_path = output_folder + os.sep + output_filename
-        print("  output_path:", output_path)
+    :param records: Per-submission records, as written to the run manifest by run_shoggoth_bulk.
+    :param slowest: How many of the slowest submissions to list.
+    """
+    graded = [r for r in records if r["status"] not in ("skipped", "rejected")]
+    counts = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
 
-        # check if we actually need to generate JSON
-        if not os.path.exists(output_path):
+    print("Run summary:")
+    print(f"  Outcomes: {counts}")
+    if not graded:
+        return
 
-            if lang == Language.JAVA:
-                # the console output of shoggoth-c is the JSON result.
-                with open(output_path, "w") as output_stream:
-                    arg = ["mvn", "-q", "compile", "exec:java"] # force recompile so that tests don't run with previous bins.
-                    p = subprocess.run(arg, shell=True, cwd=autograder_root, stdout=output_stream)
+    total_s = sum(r["total_s"] for r in graded)
+    walls = sorted(r["total_s"] for r in graded)
+    print(f"  Graded {len(graded)} submissions in {total_s:.1f} s ({60 * len(graded) / total_s:.1f} per minute).")
+    print(f"  Per submission: median {_percentile(walls, 0.5):.2f} s, p95 {_percentile(walls, 0.95):.2f} s, "
+          f"max {walls[-1]:.2f} s.")
 
-            else: # C
-                # the console output of shoggoth-c is the human-readable test summery.
-                log_path = os.path.splitext(output_path)[0] + "_stdout.txt"
+    cpu = [r["grade_cpu_user_s"] + r["grade_cpu_sys_s"] for r in graded if r["grade_cpu_user_s"] is not None]
+    rss = [r["peak_rss_kb"] for r in graded if r["peak_rss_kb"] is not None]
+    if cpu:
+        print(f"  Grading CPU time: {sum(cpu):.1f} s total, peak RSS {max(rss) / 1024:.1f} MiB.")
 
-                # shoggoth-c saves the results to a separate JSON file.
-                results_path = FOLDER_SER334_AUTOGRADERS + os.sep + "results" + os.sep + "results.json"
+    print(f"  Slowest {min(slowest, len(graded))}:")
+    for record in sorted(graded, key=lambda r: r["total_s"], reverse=True)[:slowest]:
+        print(f"    {record['filename']}: {record['total_s']:.2f} s ({record['status']})")
 
-                if os.path.exists(results_path):
-                    os.remove(results_path)
 
-                with open(log_path, "w") as output_stream:
-                    arg = [sys.executable, "main.py"]
-                    p = subprocess.run(arg, shell=False, cwd=autograder_root, stdout=output_stream)
+def run_shoggoth_bulk(course, lang, config_file, semester, timeout=None):
+    r"""
+    Runs a local installation of a shoggoth java or c autograder on a folder of submissions and saves the results in
+    JSON. Supports either single source file submission or .zip containers.
 
-                shutil.copy(results_path, output_path)
+    For this to function, there must a local copy of the shoggoth autograder. Its location has to be configured at the
+    top of this file.
 
-        else:
-            print ("  JSON output already exists, skipping autograder.")
+    There must also be a folder of submissions at:
+        constants.FOLDER_SUBMISSIONS + os.sep + "{course}_{semester}_{module}_2patched"
+    For example:
+        data_original\submissions\ser334_24sc_m2_2patched
+
+    Each run also writes a manifest with per-submission timings, CPU time, and peak memory (one JSON object per line)
+    to constants.FOLDER_RUNS, and prints a summary at the end. Results are published to the results database (see
+    result_sink.py) as each submission finishes.
+
+    :param course: Short name for the course.
+    :param lang: the programming used for the assignment.
+    :param config_file: Config from autograder.
+    :param semester: Semester ID for data (e.g., 24sc).
+    :param timeout: Wall-clock limit per submission in seconds. Defaults to GRADING_TIMEOUT_SECONDS for the language.
+    :return: list of per-submission records (same as the manifest).
+    """
+
+    print("run_shoggoth_bulk:")
+
+    setup = load_shoggoth_setup(course, lang, config_file, semester)
+    output_folder = setup["output_folder"]
+
+    # check if output folder exists
+    if not os.path.exists(output_folder):
+        os.mkdir(output_folder)
+
+    os.makedirs(constants.FOLDER_RUNS, exist_ok=True)
+    manifest_path = (constants.FOLDER_RUNS + os.sep
+                     + f"{course}_{semester}_{setup['config']['module']}_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+    print("  manifest_path:", manifest_path)
+
+    project_folder = open_project_folder(setup)
+    sink = result_sink.ResultSink()
+    records = []
+
+    try:
+        with open(manifest_path, "w") as manifest:
+            for filename in list_submissions(setup["input_folder"]):
+                print ("Processing " + filename)
+
+                output_path = output_folder + os.sep + evaluation_filename(filename)
+                print("  output_path:", output_path)
+
+                # check if we actually need to generate JSON
+                if os.path.exists(output_path):
+                    print ("  JSON output already exists, skipping autograder.")
+                    record = _new_run_record(filename)
+                else:
+                    record = grade_submission(setup, project_folder, filename, output_path, timeout, sink)
+
+                records.append(record)
+                manifest.write(json.dumps(record) + "\n")
+                manifest.flush()
+    finally:
+        sink.close()
+        if lang == Language.C:
+            project_folder.cleanup()
+
+    summarize_run(records)
+    return records
+
+
+def _is_submission_edit(filename):
+    # editors leave swap, backup, and lock files next to the file being edited; they are not submissions.
+    return not (filename.startswith(".") or filename.startswith("~") or filename.endswith("~")
+                or filename.endswith(".swp") or filename.endswith(".tmp"))
+
+
+def _snapshot_submissions(input_folder):
+    snapshot = {}
+    for filename in list_submissions(input_folder):
+        if not _is_submission_edit(filename):
+            continue
+        try:
+            info = os.stat(input_folder + os.sep + filename)
+        except FileNotFoundError: # removed between listing and stat.
+            continue
+        snapshot[filename] = (info.st_mtime_ns, info.st_size)
+    return snapshot
+
+
+def watch_shoggoth_bulk(course, lang, config_file, semester, poll_seconds=1.0, debounce_seconds=2.0, timeout=None,
+                        on_graded=None):
+    r"""
+    Watches the _2patched folder of an assignment and regrades submissions as soon as they are added or changed,
+    replacing their JSON evaluation and their row in the results database. Submissions without a JSON evaluation when the watch starts are graded right away.
+    Runs until interrupted (Ctrl+C).
+
+    The folder is polled rather than using OS notifications, so this also works on network and synced folders. A
+    changed file is only graded once it has stopped changing for debounce_seconds, so a save in progress (or several
+    saves in a row) results in one regrade.
+
+    :param course: Short name for the course.
+    :param lang: the programming used for the assignment.
+    :param config_file: Config from autograder.
+    :param semester: Semester ID for data (e.g., 24sc).
+    :param poll_seconds: How often to scan the folder.
+    :param debounce_seconds: How long a file has to stay unchanged before it is regraded.
+    :param timeout: Wall-clock limit per submission in seconds. Defaults to GRADING_TIMEOUT_SECONDS for the language.
+    :param on_graded: Optional callback, called as on_graded(record, output_path) after each regrade, for refreshing
+                      anything derived from the evaluations.
+    """
+
+    print("watch_shoggoth_bulk:")
+
+    setup = load_shoggoth_setup(course, lang, config_file, semester)
+    input_folder = setup["input_folder"]
+    output_folder = setup["output_folder"]
+
+    if not os.path.exists(output_folder):
+        os.mkdir(output_folder)
+
+    os.makedirs(constants.FOLDER_RUNS, exist_ok=True)
+    manifest_path = (constants.FOLDER_RUNS + os.sep
+                     + f"{course}_{semester}_{setup['config']['module']}_watch_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+    print("  manifest_path:", manifest_path)
+
+    project_folder = open_project_folder(setup)
+    sink = result_sink.ResultSink()
+
+    known = _snapshot_submissions(input_folder)
+    # filename -> (signature, time it was first seen with that signature)
+    pending = {filename: (signature, 0.0) for filename, signature in known.items()
+               if not os.path.exists(output_folder + os.sep + evaluation_filename(filename))}
+
+    print(f"  Watching {input_folder} ({len(known)} submissions, {len(pending)} without JSON).")
+
+    try:
+        with open(manifest_path, "w") as manifest:
+            while True:
+                now = time.monotonic()
+                current = _snapshot_submissions(input_folder)
+
+                for filename, signature in current.items():
+                    if known.get(filename) != signature:
+                        pending[filename] = (signature, now)
+                for filename in known.keys() - current.keys():
+                    pending.pop(filename, None)
+                    print(f"Removed {filename} (its JSON evaluation is left in place).")
+                known = current
+
+                for filename, (_, changed_at) in sorted(pending.items()):
+                    if now - changed_at < debounce_seconds:
+                        continue
+                    del pending[filename]
+
+                    print("Regrading " + filename)
+                    output_path = output_folder + os.sep + evaluation_filename(filename)
+
+                    # drop the old result first, so a failed regrade can't leave a stale evaluation behind.
+                    if os.path.exists(output_path):
+                        os.remove(output_path)
+                    sink.retract(course, semester, setup["config"]["module"],
+                                 os.path.splitext(os.path.basename(output_path))[0])
+
+                    record = grade_submission(setup, project_folder, filename, output_path, timeout, sink)
+                    print(f"  {record['status']} in {record['total_s']:.1f} s.")
+                    manifest.write(json.dumps(record) + "\n")
+                    manifest.flush()
+
+                    if on_graded is not None:
+                        on_graded(record, output_path)
+
+                time.sleep(poll_seconds)
+    except KeyboardInterrupt:
+        print("  Stopped watching.")
+    finally:
+        sink.close()
+        if lang == Language.C:
+            project_folder.cleanup()
 
 
 # testing area
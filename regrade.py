@@ -0,0 +1,196 @@
+"""
+shoggoth-validation - regrade.py
+
+Selective regrading after an autograder's test suite changes.
+
+When a test in a config's suite is edited or added mid-semester, only the (module, method) groups that changed need to
+run again. regrade_changed_tests diffs the old and new suite definitions, runs just the affected groups on each
+submission, and merges the new per-test results into the existing evaluation JSON (matched by test number):
+- changed or added groups are rerun, replacing any previous results for their tests.
+- groups whose tests only changed point values are rescaled in place, without running anything.
+- tests that no longer appear in the suite are dropped from the evaluation.
+
+The subset is run by temporarily replacing the autograder's config (ACTIVE_CONFIG_NAME, in the autograder folder) with
+a copy of the new config whose suite only contains the affected groups. The original is restored afterwards. Only
+shoggoth-c configs define a suite, so this only applies to Language.C.
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import json
+import math
+import os
+import shutil
+import tempfile
+
+import preparation
+import result_sink
+from preparation import Language
+
+# name of the config file shoggoth-c reads, relative to the autograder folder.
+ACTIVE_CONFIG_NAME = "config.json"
+
+
+def _group_key(group):
+    return group["module"], group["method"]
+
+
+def _without_points(tests):
+    return [{k: v for k, v in test.items() if k != "points"} for test in tests]
+
+
+def diff_suites(old_config, new_config):
+    r"""
+    Compares the suites of two versions of an autograder config.
+
+    :return: dictionary with:
+                rerun: (module, method) keys of groups that are new or whose tests changed.
+                rescale: test number -> new points, for groups where only point values changed.
+                removed: test numbers that are no longer in the suite, or that belonged to a rerun group.
+    """
+    old_groups = {_group_key(group): group["tests"] for group in old_config["suite"]}
+    new_groups = {_group_key(group): group["tests"] for group in new_config["suite"]}
+
+    rerun = []
+    rescale = {}
+    removed = set()
+
+    for key, tests in new_groups.items():
+        old_tests = old_groups.get(key)
+        if old_tests == tests:
+            continue
+        if old_tests is not None and _without_points(old_tests) == _without_points(tests):
+            rescale.update({test["number"]: test["points"] for test in tests})
+            continue
+        rerun.append(key)
+        if old_tests is not None:
+            removed.update(test["number"] for test in old_tests)
+
+    for key, old_tests in old_groups.items():
+        if key not in new_groups:
+            removed.update(test["number"] for test in old_tests)
+
+    return {"rerun": rerun, "rescale": rescale, "removed": removed}
+
+
+def merge_results(evaluation, new_tests, diff):
+    r"""
+    Merges the results of a partial run into an evaluation. Tests are matched by number and kept in number order.
+
+    :param evaluation: Existing evaluation (loaded JSON), updated in place.
+    :param new_tests: "tests" list from the partial run.
+    :param diff: Output of diff_suites.
+    :return: the updated evaluation.
+    """
+    tests = {test["number"]: test for test in evaluation["tests"] if test["number"] not in diff["removed"]}
+
+    for number, points in diff["rescale"].items():
+        test = tests.get(number)
+        if test is None:
+            continue
+        fraction = test["score"] / test["max_score"] if not math.isclose(test["max_score"], 0) else 0.0
+        test["score"] = fraction * points
+        test["max_score"] = points
+
+    for test in new_tests:
+        tests[test["number"]] = test
+
+    evaluation["tests"] = sorted(tests.values(), key=lambda x: float(x["number"]))
+    if "score" in evaluation: # keep the overall total consistent with the tests.
+        evaluation["score"] = sum(test["score"] for test in evaluation["tests"])
+    return evaluation
+
+
+def regrade_changed_tests(course, lang, old_config_file, new_config_file, semester, timeout=None):
+    r"""
+    Updates the existing evaluations of an assignment after its suite changed, running only the affected tests. See
+    run_shoggoth_bulk for the expected folder layout. Submissions without an evaluation are skipped (run
+    run_shoggoth_bulk for those).
+
+    :param course: Short name for the course.
+    :param lang: the programming used for the assignment (must be Language.C).
+    :param old_config_file: Config the existing evaluations were generated with.
+    :param new_config_file: Updated config.
+    :param semester: Semester ID for data (e.g., 24sc).
+    :param timeout: Wall-clock limit per submission in seconds. Defaults to GRADING_TIMEOUT_SECONDS for the language.
+    """
+
+    print("regrade_changed_tests:")
+
+    if lang != Language.C:
+        raise Exception("regrade_changed_tests() requires a config with a suite (shoggoth-c).")
+
+    with open(old_config_file) as file:
+        old_config = json.load(file)
+
+    setup = preparation.load_shoggoth_setup(course, lang, new_config_file, semester)
+    new_config = setup["config"]
+
+    diff = diff_suites(old_config, new_config)
+    print(f"  Rerun groups: {diff['rerun']}")
+    print(f"  Rescaled tests: {sorted(diff['rescale'])}")
+    print(f"  Removed tests: {sorted(diff['removed'])}")
+
+    if not diff["rerun"] and not diff["rescale"] and not diff["removed"]:
+        print("  Suites are identical, nothing to regrade.")
+        return
+
+    output_folder = setup["output_folder"]
+    active_config_path = setup["autograder_root"] + os.sep + ACTIVE_CONFIG_NAME
+    backup_config_path = active_config_path + ".regrade_backup"
+
+    partial_config = dict(new_config)
+    partial_config["suite"] = [group for group in new_config["suite"] if _group_key(group) in diff["rerun"]]
+    partial_setup = dict(setup, config=partial_config)  # so partial results are validated against the subset.
+
+    project_folder = preparation.open_project_folder(setup) if diff["rerun"] else None
+    if diff["rerun"]:
+        shutil.copy2(active_config_path, backup_config_path)
+        with open(active_config_path, "w") as f:
+            json.dump(partial_config, f, indent=2)
+
+    sink = result_sink.ResultSink()
+
+    try:
+        for filename in preparation.list_submissions(setup["input_folder"]):
+            output_path = output_folder + os.sep + preparation.evaluation_filename(filename)
+            if not os.path.exists(output_path):
+                print(f"Skipping {filename}, it has no evaluation yet.")
+                continue
+
+            print("Regrading " + filename)
+
+            with open(output_path) as f:
+                try:
+                    evaluation = json.load(f)
+                except json.JSONDecodeError:
+                    print("  Failed to parse existing JSON, skipping student.")
+                    continue
+
+            new_tests = []
+            if diff["rerun"]:
+                with tempfile.TemporaryDirectory(prefix="shoggoth_regrade_") as scratch:
+                    partial_path = scratch + os.sep + preparation.evaluation_filename(filename)
+                    record = preparation.grade_submission(partial_setup, project_folder, filename, partial_path,
+                                                          timeout)
+                    if record["status"] != "ok":
+                        print(f"  Partial run failed ({record['status']}), evaluation left unchanged.")
+                        continue
+                    with open(partial_path) as f:
+                        new_tests = json.load(f)["tests"]
+
+            evaluation = merge_results(evaluation, new_tests, diff)
+            result_sink.write_text_atomic(output_path, json.dumps(evaluation, indent=2))
+            sink.publish(course, semester, new_config["module"], os.path.splitext(os.path.basename(output_path))[0],
+                         evaluation)
+    finally:
+        sink.close()
+        if diff["rerun"]:
+            os.replace(backup_config_path, active_config_path)
+            project_folder.cleanup()
+
+
+# testing area
+if __name__ == '__main__':
+    regrade_changed_tests("ser334", Language.C, preparation.constants.FOLDER_DATA_ORIGINAL + os.sep + "ser334_config_m3.json",
+                          preparation.constants.FOLDER_DATA_ORIGINAL + os.sep + "ser334_config_m3.json", "00dv")
@@ -0,0 +1,184 @@
+"""
+shoggoth-validation - result_sink.py
+
+Publishes autograder results as they complete.
+
+Evaluations are validated before they are accepted and written atomically (to a temporary file in the same folder,
+then renamed into place), so a crashed or killed run never leaves a partial JSON file in the evaluations folder. Each
+accepted evaluation is also added to a SQLite results database (constants.FILE_RESULTS_DB by default), one row per
+submission plus one row per test, so analysis can query finished results while grading is still running.
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import json
+import numbers
+import os
+import sqlite3
+import tempfile
+import time
+
+import constants
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id          INTEGER PRIMARY KEY,
+    course      TEXT NOT NULL,
+    semester    TEXT NOT NULL,
+    module      TEXT NOT NULL,
+    uid         TEXT NOT NULL,
+    score       REAL NOT NULL,
+    max_score   REAL NOT NULL,
+    n_tests     INTEGER NOT NULL,
+    evaluation  TEXT NOT NULL,
+    graded_at   REAL NOT NULL,
+    UNIQUE (course, semester, module, uid)
+);
+CREATE TABLE IF NOT EXISTS test_scores (
+    result_id   INTEGER NOT NULL REFERENCES results (id) ON DELETE CASCADE,
+    number      REAL NOT NULL,
+    score       REAL NOT NULL,
+    max_score   REAL NOT NULL,
+    PRIMARY KEY (result_id, number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS test_scores_by_number ON test_scores (number);
+"""
+
+
+def expected_test_numbers(config):
+    r"""
+    Returns the set of test numbers an autograder config's suite defines, or None if the config has no suite (e.g.,
+    shoggoth-java configs).
+    """
+    if "suite" not in config:
+        return None
+    return {test["number"] for group in config["suite"] for test in group["tests"]}
+
+
+def parse_evaluation(text, expected_numbers=None):
+    r"""
+    Parses and validates the JSON output of an autograder run.
+
+    :param text: Raw JSON text.
+    :param expected_numbers: Test numbers the evaluation must contain exactly, or None to skip that check.
+    :return: the parsed evaluation.
+    :raises ValueError: if the output is not a complete, well-formed evaluation.
+    """
+    try:
+        evaluation = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"not valid JSON ({e})") from e
+
+    if not isinstance(evaluation, dict) or not isinstance(evaluation.get("tests"), list):
+        raise ValueError("missing tests list")
+
+    for test in evaluation["tests"]:
+        if not isinstance(test, dict):
+            raise ValueError("malformed test entry")
+        for key in ("number", "score", "max_score"):
+            if not isinstance(test.get(key), numbers.Real):
+                raise ValueError(f"test {test.get('name', '?')} has no numeric {key}")
+
+    found = [test["number"] for test in evaluation["tests"]]
+    if len(found) != len(set(found)):
+        raise ValueError("test numbering is not unique")
+
+    if expected_numbers is not None and set(found) != expected_numbers:
+        missing = sorted(expected_numbers - set(found))
+        extra = sorted(set(found) - expected_numbers)
+        raise ValueError(f"tests do not match the suite (missing {missing}, unexpected {extra})")
+
+    return evaluation
+
+
+def write_text_atomic(path, text):
+    r"""
+    Writes a file so that readers only ever see the old contents or the complete new contents. The temporary file does
+    not contain ".json" in its name, so analysis never picks it up.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".partial")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class ResultSink:
+    r"""
+    Connection to the results database. The database lives on the grading machine, so it uses WAL to let readers run
+    alongside the grader.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or constants.FILE_RESULTS_DB
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def publish(self, course, semester, module, uid, evaluation):
+        r"""
+        Adds or replaces the result of one submission.
+
+        :param uid: Submission identifier (the evaluation file name without .json).
+        :param evaluation: Validated evaluation, see parse_evaluation.
+        """
+        tests = evaluation["tests"]
+        score = sum(test["score"] for test in tests)
+        max_score = sum(test["max_score"] for test in tests)
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            result_id = self._conn.execute(
+                "INSERT INTO results (course, semester, module, uid, score, max_score, n_tests, evaluation, graded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (course, semester, module, uid) DO UPDATE SET score = excluded.score, "
+                "max_score = excluded.max_score, n_tests = excluded.n_tests, evaluation = excluded.evaluation, "
+                "graded_at = excluded.graded_at RETURNING id",
+                (course, semester, module, uid, score, max_score, len(tests), json.dumps(evaluation), time.time())
+            ).fetchone()["id"]
+            self._conn.execute("DELETE FROM test_scores WHERE result_id = ?", (result_id,))
+            self._conn.executemany("INSERT INTO test_scores (result_id, number, score, max_score) VALUES (?, ?, ?, ?)",
+                                   [(result_id, test["number"], test["score"], test["max_score"]) for test in tests])
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def retract(self, course, semester, module, uid):
+        r"""
+        Removes the result of one submission (and its test scores), e.g. before it is regraded.
+
+        :return: True if there was a result to remove.
+        """
+        key = (course, semester, module, uid)
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute("DELETE FROM test_scores WHERE result_id IN (SELECT id FROM results WHERE course = ? "
+                               "AND semester = ? AND module = ? AND uid = ?)", key)
+            removed = self._conn.execute("DELETE FROM results WHERE course = ? AND semester = ? AND module = ? "
+                                         "AND uid = ?", key).rowcount
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        return removed > 0
+
+    def finished_results(self, course, semester, module):
+        r"""
+        Returns the evaluations published so far for an assignment, as a dictionary of uid -> evaluation.
+        """
+        rows = self._conn.execute("SELECT uid, evaluation FROM results WHERE course = ? AND semester = ? "
+                                  "AND module = ? ORDER BY uid", (course, semester, module)).fetchall()
+        return {row["uid"]: json.loads(row["evaluation"]) for row in rows}
@@ -0,0 +1,180 @@
+"""
+shoggoth-validation - score_archive.py
+
+Append-only, memory-mapped archive of Shoggoth test scores across semesters.
+
+Pooling several years of evaluations by reading every JSON file needs them all in memory at once. The archive instead
+keeps each (course, semester, module) as one block of a single binary file: a students x tests float64 matrix in
+Fortran order, so each test's scores are contiguous and missing results are NaN. A sidecar index.json records, per
+block, its byte offset, students (evaluation uids) and test numbers.
+
+Adding a semester appends its block to the end of scores.f64 and then replaces the index atomically; nothing already
+written is touched, and a run that dies between the two steps only leaves unreferenced bytes at the end of the file.
+Reads map each block with np.memmap, so slicing a test out of a ten-semester archive only pages in that column.
+
+Usage:
+    archive = ScoreArchive()
+    archive.append_folder("ser222", "24fc", "m1")
+    semesters, scores = archive.pooled("ser222", "m1")
+"""
+__author__ = "Ruben Acuna"
+__copyright__ = "Copyright 2025, Ruben Acuna"
+
+import json
+import os
+
+import numpy as np
+
+import constants
+from result_sink import write_text_atomic
+
+FILE_SCORES = "scores.f64"
+FILE_INDEX = "index.json"
+DTYPE = np.float64
+
+
+def load_evaluation_folder(course, semester, module):
+    r"""
+    Loads the evaluations of one assignment from constants.FOLDER_EVALUATIONS, keyed by uid (the file name without the
+    suffix common to all files, as in analysis.analyze_assignment). Unparsable evaluations are skipped.
+
+    :return: dictionary of uid -> evaluation.
+    """
+    input_folder = constants.FOLDER_EVALUATIONS + os.sep + f"{course}_{semester}_{module}"
+    filenames = sorted(f for f in os.listdir(input_folder) if ".json" in f)
+    suffix = os.path.commonprefix([f[::-1] for f in filenames])[::-1]
+
+    evaluations = {}
+    for filename in filenames:
+        with open(input_folder + os.sep + filename) as f:
+            try:
+                evaluations[filename[:-len(suffix)]] = json.load(f)
+            except json.JSONDecodeError:
+                continue
+    return evaluations
+
+
+class ScoreArchive:
+    r"""
+    A score archive folder (constants.FOLDER_SCORE_ARCHIVE by default). Blocks are described by dictionaries with keys
+    course, semester, module, offset (in bytes), students and tests.
+    """
+
+    def __init__(self, folder=None):
+        self.folder = folder or constants.FOLDER_SCORE_ARCHIVE
+        os.makedirs(self.folder, exist_ok=True)
+        self.path_scores = self.folder + os.sep + FILE_SCORES
+        self.path_index = self.folder + os.sep + FILE_INDEX
+
+        if os.path.exists(self.path_index):
+            with open(self.path_index) as f:
+                self.blocks = json.load(f)["blocks"]
+        else:
+            self.blocks = []
+
+    def find(self, course=None, semester=None, module=None):
+        r"""
+        Returns the blocks matching the given course, semester and module (None matches anything), in append order.
+        """
+        return [b for b in self.blocks
+                if (course is None or b["course"] == course)
+                and (semester is None or b["semester"] == semester)
+                and (module is None or b["module"] == module)]
+
+    def append(self, course, semester, module, evaluations):
+        r"""
+        Adds one assignment's evaluations as a new block.
+
+        :param evaluations: Dictionary of uid -> evaluation (see result_sink.parse_evaluation).
+        :return: the new block.
+        """
+        if self.find(course, semester, module):
+            raise Exception(f"{course}_{semester}_{module} is already archived.")
+        if not evaluations:
+            raise Exception(f"No evaluations to archive for {course}_{semester}_{module}.")
+
+        students = sorted(evaluations)
+        tests = sorted({float(t["number"]) for e in evaluations.values() for t in e["tests"]})
+        column = {number: j for j, number in enumerate(tests)}
+
+        scores = np.full((len(students), len(tests)), np.nan, dtype=DTYPE, order="F")
+        for i, uid in enumerate(students):
+            for test in evaluations[uid]["tests"]:
+                scores[i, column[float(test["number"])]] = test["score"]
+
+        with open(self.path_scores, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(scores.tobytes(order="F"))
+            f.flush()
+            os.fsync(f.fileno())
+
+        block = {"course": course, "semester": semester, "module": module, "offset": offset,
+                 "students": students, "tests": tests}
+        write_text_atomic(self.path_index, json.dumps({"blocks": self.blocks + [block]}))
+        self.blocks.append(block)
+        return block
+
+    def append_folder(self, course, semester, module):
+        r"""
+        Archives an assignment straight from its evaluations folder, see load_evaluation_folder.
+        """
+        return self.append(course, semester, module, load_evaluation_folder(course, semester, module))
+
+    def scores(self, block):
+        r"""
+        Returns a read-only, memory-mapped (students x tests) view of a block. Nothing is read from disk until the
+        view is indexed.
+        """
+        shape = (len(block["students"]), len(block["tests"]))
+        return np.memmap(self.path_scores, dtype=DTYPE, mode="r", offset=block["offset"], shape=shape, order="F")
+
+    def test_scores(self, block, number):
+        r"""
+        Returns the scores of one test in a block (a contiguous slice of the mapping), or None if the block does not
+        have that test.
+        """
+        if float(number) not in block["tests"]:
+            return None
+        return self.scores(block)[:, block["tests"].index(float(number))]
+
+    def pooled(self, course, module, tests=None):
+        r"""
+        Pools one assignment across every archived semester. Only the selected test columns are read.
+
+        :param tests: Test numbers to include; by default, the tests every semester has in common.
+        :return: (semesters, scores) where semesters labels each row and scores is a (students x tests) array.
+        """
+        blocks = self.find(course=course, module=module)
+        if not blocks:
+            return np.empty(0, dtype=object), np.empty((0, 0 if tests is None else len(tests)), dtype=DTYPE)
+
+        if tests is None:
+            common = set(blocks[0]["tests"]).intersection(*(b["tests"] for b in blocks[1:]))
+            tests = sorted(common)
+        tests = [float(t) for t in tests]
+
+        parts = []
+        for block in blocks:
+            view = self.scores(block)
+            part = np.full((view.shape[0], len(tests)), np.nan, dtype=DTYPE)
+            for j, number in enumerate(tests):
+                if number in block["tests"]:
+                    part[:, j] = view[:, block["tests"].index(number)]
+            parts.append(part)
+
+        semesters = np.concatenate([np.full(len(b["students"]), b["semester"], dtype=object) for b in blocks])
+        return semesters, np.concatenate(parts)
+
+
+# testing area
+if __name__ == '__main__':
+    archive = ScoreArchive()
+
+    for semester in ["24sc", "24fc"]:
+        if not archive.find("ser334", semester, "m2"):
+            archive.append_folder("ser334", semester, "m2")
+
+    semesters, scores = archive.pooled("ser334", "m2")
+    print(f"{len(archive.blocks)} blocks, pooled {scores.shape[0]} students x {scores.shape[1]} common tests.")
+    for semester in np.unique(semesters):
+        print(f"  {semester}: mean total {np.nansum(scores[semesters == semester], axis=1).mean():.2f}")
@@ -3,15 +3,18 @@ shoggoth-validation - stats.py
 
 Loads Canvas exported gradebooks and executes t-tests between assignment grades.
 
+compare_cohorts runs every test (Student and Welch t-tests, Mann-Whitney U, permutation test) on every assignment column
+shared by two or more gradebooks in one call, with multiple-comparison correction.
 """
 __author__ = "Ruben Acuna"
 __copyright__ = "Copyright 2024-25, Ruben Acuna"
 
 import csv
+import itertools
 import numpy as np
 import os
 import pandas as pd
-from scipy.stats import ttest_ind
+from scipy.stats import false_discovery_control, mannwhitneyu, ttest_ind
 
 import constants
 
@@ -97,6 +100,134 @@ def perform_two_tailed_test(col_1st, col_2nd, alpha, df_1stf, df_second):
     print(f"\t\tt({df}) = {round(result.statistic, 3)}, p = {round(result.pvalue, 3)}. {ans}")
 
 
+def _score_matrix(df_gradebook, columns, drop_zeros):
+    # students x columns, with excluded scores as NaN.
+    scores = df_gradebook[columns].to_numpy(dtype=np.float64)
+    if drop_zeros:
+        scores[scores == 0] = np.nan
+    return scores
+
+
+def permutation_test_means(scores_a, scores_b, permutations=10000, seed=0):
+    r"""
+    Two-sided permutation test for a difference in means, for every column at once. Missing scores (NaN) are left out
+    per column. All columns share one matrix of random relabelings, so the null distributions for every column come from
+    two matrix products.
+
+    :param scores_a: First cohort (students x columns).
+    :param scores_b: Second cohort (students x columns).
+    :return: (observed differences in means, p-values), one per column.
+    """
+    pooled = np.vstack([scores_a, scores_b])
+    valid = ~np.isnan(pooled)
+    values = np.where(valid, pooled, 0.0)
+    n_a = scores_a.shape[0]
+
+    rng = np.random.default_rng(seed)
+    observed_labels = np.zeros(pooled.shape[0])
+    observed_labels[:n_a] = 1.0
+    # row 0 is the observed labeling, every other row a random relabeling.
+    labels = np.vstack([observed_labels, rng.permuted(np.tile(observed_labels, (permutations, 1)), axis=1)])
+
+    sums_a = labels @ values
+    counts_a = labels @ valid
+    sums_b = values.sum(axis=0) - sums_a
+    counts_b = valid.sum(axis=0) - counts_a
+    with np.errstate(divide="ignore", invalid="ignore"):
+        differences = sums_a / counts_a - sums_b / counts_b
+
+    observed = differences[0]
+    extreme = (np.abs(differences[1:]) >= np.abs(observed) - 1e-12).sum(axis=0)
+    return observed, (extreme + 1) / (permutations + 1)
+
+
+def adjust_pvalues(pvalues, method):
+    r"""
+    Corrects a family of p-values for multiple comparisons.
+
+    :param method: "bonferroni", "holm", "bh" (Benjamini-Hochberg), or None.
+    """
+    pvalues = np.asarray(pvalues, dtype=np.float64)
+    if method is None or len(pvalues) == 0:
+        return pvalues
+    if method == "bonferroni":
+        return np.minimum(pvalues * len(pvalues), 1.0)
+    if method == "holm":
+        order = np.argsort(pvalues)
+        stepped = np.maximum.accumulate(pvalues[order] * (len(pvalues) - np.arange(len(pvalues))))
+        adjusted = np.empty_like(pvalues)
+        adjusted[order] = np.minimum(stepped, 1.0)
+        return adjusted
+    if method == "bh":
+        return false_discovery_control(pvalues, method="bh")
+    raise Exception(f"Unknown p-value correction: {method}")
+
+
+def compare_cohorts(cohorts, columns=None, alpha=0.05, correction="holm", permutations=10000, drop_zeros=True,
+                    seed=0):
+    r"""
+    Compares assignment grades between every pair of cohorts, over every shared assignment column.
+
+    Runs Student's and Welch's t-tests, the Mann-Whitney U test, and a permutation test on the difference in means. Each
+    kind of test is vectorized over the columns. P-values are corrected within each kind of test, across all columns
+    and pairs.
+
+    :param cohorts: Dictionary of cohort name -> gradebook DataFrame (see prepare_gradebook).
+    :param columns: Columns to compare. Defaults to every "Programming" column present in all cohorts.
+    :param alpha: Significance level for the reject column.
+    :param correction: "holm", "bonferroni", "bh", or None.
+    :param permutations: Number of permutations for the permutation test (0 to skip it).
+    :param drop_zeros: Leave out zero scores (i.e., only students who submitted), as in perform_two_tailed_test.
+    :param seed: Seed for the permutation test.
+    :return: tidy DataFrame with one row per (column, pair of cohorts, test).
+    """
+    if len(cohorts) < 2:
+        raise Exception("compare_cohorts() needs at least two cohorts.")
+
+    if columns is None:
+        shared = set.intersection(*[set(df.columns) for df in cohorts.values()])
+        first = next(iter(cohorts.values()))
+        columns = [column for column in first.columns if column in shared and "Programming" in column]
+
+    rows = []
+    for name_a, name_b in itertools.combinations(cohorts, 2):
+        a = _score_matrix(cohorts[name_a], columns, drop_zeros)
+        b = _score_matrix(cohorts[name_b], columns, drop_zeros)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            descriptive = {"n_a": (~np.isnan(a)).sum(axis=0), "mean_a": np.nanmean(a, axis=0),
+                           "sd_a": np.nanstd(a, axis=0, ddof=1),
+                           "n_b": (~np.isnan(b)).sum(axis=0), "mean_b": np.nanmean(b, axis=0),
+                           "sd_b": np.nanstd(b, axis=0, ddof=1)}
+
+        results = {}
+        student = ttest_ind(a, b, axis=0, equal_var=True, nan_policy="omit")
+        results["student_t"] = (student.statistic, student.pvalue, descriptive["n_a"] + descriptive["n_b"] - 2)
+        welch = ttest_ind(a, b, axis=0, equal_var=False, nan_policy="omit")
+        results["welch_t"] = (welch.statistic, welch.pvalue, welch.df)
+        mwu = mannwhitneyu(a, b, axis=0, alternative="two-sided", nan_policy="omit")
+        results["mann_whitney"] = (mwu.statistic, mwu.pvalue, np.full(len(columns), np.nan))
+        if permutations:
+            difference, pvalue = permutation_test_means(a, b, permutations, seed)
+            results["permutation"] = (difference, pvalue, np.full(len(columns), np.nan))
+
+        for test, (statistic, pvalue, df) in results.items():
+            for i, column in enumerate(columns):
+                rows.append({"assessment": column, "cohort_a": name_a, "cohort_b": name_b,
+                             **{key: value[i] for key, value in descriptive.items()},
+                             "test": test, "statistic": float(statistic[i]), "df": float(np.asarray(df)[i]),
+                             "pvalue": float(pvalue[i])})
+
+    df_results = pd.DataFrame(rows)
+    df_results["pvalue_adj"] = np.nan
+    for _, group in df_results.groupby("test"):
+        tested = group["pvalue"].notna()
+        df_results.loc[group.index[tested], "pvalue_adj"] = adjust_pvalues(group["pvalue"][tested], correction)
+    df_results["reject"] = df_results["pvalue_adj"] <= alpha
+
+    return df_results
+
+
 # testing area
 if __name__ == '__main__':
 
@@ -118,3 +249,7 @@ if __name__ == '__main__':
     #perform_two_tailed_test("Module 2: Programming", "Module 2: Programming (Gradescope)", alpha, df_grades_ser334_24sc, df_grades_ser334_24fc)
     perform_two_tailed_test("Module CP3: Programming", None, a, df_grades_ser334_24sc, df_grades_ser334_24fc)
 
+    # every shared programming assignment at once, Holm corrected.
+    df_comparison = compare_cohorts({"24sc": df_grades_ser334_24sc, "24fc": df_grades_ser334_24fc}, alpha=a)
+    print(df_comparison.to_string(index=False))
+
@@ -3,6 +3,9 @@ shoggoth-validation - study_replication.py
 
 This file can be used to replicate the results from various papers.
 
+Each study also has a manifest in studies/ that batch_analysis.py runs in parallel, e.g.:
+    python batch_analysis.py studies/fie_2025_enhancing.toml
+
 """
 __author__ = "Ruben Acuna"
 __copyright__ = "Copyright 2025, Ruben Acuna"
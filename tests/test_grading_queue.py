@@ -0,0 +1,94 @@
+"""
+Tests for grading_queue.py, with preparation stubbed out so no autograder is needed.
+"""
+import json
+import os
+import types
+
+import pytest
+
+import grading_queue
+from preparation import Language
+
+SUBMISSIONS = ["alice.c", "bob.c", "carol.c"]
+
+
+class FakeProjectFolder:
+    def __init__(self):
+        self.cleaned_up = False
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+
+@pytest.fixture
+def fake_preparation(tmp_path, monkeypatch):
+    graded = []
+    folders = []
+
+    def run_autograder(setup, output_path, timeout=None):
+        name = os.path.basename(output_path)
+        graded.append(name)
+        with open(output_path, "w") as f:
+            json.dump({"tests": [{"number": 1.1, "score": 1.0, "max_score": 1.0}]}, f)
+        with open(os.path.splitext(output_path)[0] + "_stdout.txt", "w") as f:
+            f.write(f"log of {name}\n")
+        return {"status": "ok", "grade": {"wall_s": 0.0}}
+
+    def open_project_folder(setup):
+        folders.append(FakeProjectFolder())
+        return folders[-1]
+
+    fake = types.SimpleNamespace(
+        load_shoggoth_setup=lambda course, lang, config_file, semester: {
+            "lang": lang, "config": {"module": "m2"}, "input_folder": "unused"},
+        list_submissions=lambda folder: SUBMISSIONS,
+        open_project_folder=open_project_folder,
+        stage_submission=lambda setup, project_folder, filename: True,
+        evaluation_filename=lambda filename: filename.split(".")[0] + ".json",
+        run_autograder=run_autograder,
+        constants=types.SimpleNamespace(FOLDER_EVALUATIONS=str(tmp_path / "evaluations")),
+        graded=graded,
+        folders=folders,
+    )
+    monkeypatch.setattr(grading_queue, "preparation", fake)
+    monkeypatch.chdir(tmp_path)  # the results database goes under data_processed here.
+    return fake
+
+
+def test_worker_drains_queue(tmp_path, fake_preparation):
+    queue_path = str(tmp_path / "queue.db")
+    queue = grading_queue.GradingQueue(queue_path)
+    assert queue.enqueue("ser334", Language.C, "config.json", "24sc") == len(SUBMISSIONS)
+    queue.close()
+
+    assert grading_queue.run_worker(queue_path, worker_id="w1", lease_seconds=30) == len(SUBMISSIONS)
+    assert fake_preparation.graded == ["alice.json", "bob.json", "carol.json"]
+    assert fake_preparation.folders[0].cleaned_up
+
+    queue = grading_queue.GradingQueue(queue_path)
+    assert queue.counts() == {"done": len(SUBMISSIONS)}
+    assert queue.finished_jobs()[0]["log"] == "log of alice.json\n"
+    queue.close()
+
+
+def test_export_restores_console_log(tmp_path, fake_preparation):
+    queue_path = str(tmp_path / "queue.db")
+    queue = grading_queue.GradingQueue(queue_path)
+    queue.enqueue("ser334", Language.C, "config.json", "24sc")
+    queue.close()
+    grading_queue.run_worker(queue_path, worker_id="w1", lease_seconds=30)
+
+    assert grading_queue.export_results(queue_path) == len(SUBMISSIONS)
+    folder = tmp_path / "evaluations" / "ser334_24sc_m2"
+    assert json.loads((folder / "bob.json").read_text())["tests"][0]["score"] == 1.0
+    assert (folder / "bob_stdout.txt").read_text() == "log of bob.json\n"
+
+
+def test_heartbeat_stops_cleanly(tmp_path):
+    queue = grading_queue.GradingQueue(str(tmp_path / "queue.db"))
+    heartbeat = grading_queue._Heartbeat(queue, 1, "w1", lease_seconds=30)
+    heartbeat.start()
+    heartbeat.stop()
+    assert not heartbeat.is_alive()
+    queue.close()
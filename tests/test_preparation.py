@@ -0,0 +1,84 @@
+"""
+Tests for watch_shoggoth_bulk in preparation.py, with the autograder stubbed out.
+"""
+import json
+import os
+
+import pytest
+
+import preparation
+import result_sink
+from preparation import Language
+
+EVALUATION = {"tests": [{"number": 1.1, "score": 1.0, "max_score": 1.0}]}
+
+
+class FakeProjectFolder:
+    def cleanup(self):
+        pass
+
+
+@pytest.fixture
+def watch_folder(tmp_path, monkeypatch):
+    input_folder = tmp_path / "ser334_24sc_m2_2patched"
+    output_folder = tmp_path / "ser334_24sc_m2"
+    input_folder.mkdir()
+    output_folder.mkdir()
+    (input_folder / "alice.c").write_text("int main() { return 0; }\n")
+
+    monkeypatch.chdir(tmp_path)  # the results database and run manifests go under data_processed here.
+    monkeypatch.setattr(preparation, "load_shoggoth_setup", lambda course, lang, config_file, semester: {
+        "lang": lang, "course": course, "semester": semester, "config": {"module": "m2"},
+        "input_folder": str(input_folder), "output_folder": str(output_folder)})
+    monkeypatch.setattr(preparation, "open_project_folder", lambda setup: FakeProjectFolder())
+    monkeypatch.setattr(preparation, "stage_submission", lambda setup, project_folder, filename: True)
+    return output_folder
+
+
+def _timed_out(setup, output_path, timeout=None):
+    grade = {"returncode": None, "timed_out": True, "wall_s": 1.0, "cpu_user_s": None, "cpu_sys_s": None,
+             "peak_rss_kb": None}
+    return {"status": "timeout", "evaluation": None, "grade": grade, "collect_s": 0.0}
+
+
+def _stop(record, output_path):
+    raise KeyboardInterrupt
+
+
+def test_failed_regrade_leaves_no_result(watch_folder, monkeypatch):
+    # a previous run graded alice; the watch sees the file as changed and regrades it.
+    (watch_folder / "alice.json").write_text(json.dumps(EVALUATION))
+    sink = result_sink.ResultSink()
+    sink.publish("ser334", "24sc", "m2", "alice", EVALUATION)
+    sink.close()
+
+    # the first scan is the starting state; every later one sees alice.c saved again.
+    scans = iter([{"alice.c": (1, 10)}])
+    monkeypatch.setattr(preparation, "_snapshot_submissions", lambda folder: next(scans, {"alice.c": (2, 10)}))
+    monkeypatch.setattr(preparation, "run_autograder", _timed_out)
+
+    preparation.watch_shoggoth_bulk("ser334", Language.JAVA, "config.json", "24sc", poll_seconds=0,
+                                    debounce_seconds=0, on_graded=_stop)
+
+    assert not os.path.exists(watch_folder / "alice.json")
+    sink = result_sink.ResultSink()
+    assert sink.finished_results("ser334", "24sc", "m2") == {}
+    sink.close()
+
+
+def test_retract(tmp_path):
+    sink = result_sink.ResultSink(str(tmp_path / "results.sqlite"))
+    sink.publish("ser334", "24sc", "m2", "alice", EVALUATION)
+    sink.publish("ser334", "24sc", "m2", "bob", EVALUATION)
+
+    assert sink.retract("ser334", "24sc", "m2", "alice")
+    assert not sink.retract("ser334", "24sc", "m2", "alice")
+    assert list(sink.finished_results("ser334", "24sc", "m2")) == ["bob"]
+    assert sink._conn.execute("SELECT COUNT(*) FROM test_scores").fetchone()[0] == 1
+    sink.close()
+
+
+@pytest.mark.parametrize("text", ['{"tests": [1]}', '{"tests": [null]}', '{"tests": [["number", 1.1]]}'])
+def test_malformed_test_entry_is_invalid(text):
+    with pytest.raises(ValueError, match="malformed test entry"):
+        result_sink.parse_evaluation(text)